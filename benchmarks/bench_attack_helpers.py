@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Cost of building and validating attack helpers against the target
+inventories, served by the in-process mock API server.
+
+"cold" includes downloading and indexing the inventory, "warm" validates
+against the already cached inventory, which is the cost paid by every helper
+after the first.
+
+    python -m benchmarks.bench_attack_helpers [agents] [targets] [repeat]
+"""
+
+import sys
+import timeit
+
+from gremlinapi.attack_helpers import (
+    GremlinAttackHelper,
+    GremlinLatencyAttack,
+    GremlinTargetContainers,
+    GremlinTargetHosts,
+)
+from gremlinapi.clients import active_client_inventory
+from gremlinapi.containers import container_inventory
+
+from benchmarks.mock_server import GremlinMockAPIServer
+
+
+def bench(agents: int = 10000, targets: int = 100, repeat: int = 5) -> dict:
+    results: dict = {}
+    step: int = max(1, agents // targets)
+    ids: list = [f"host-{index}" for index in range(0, agents, step)]
+    tags: dict = {
+        "zone": [f"zone-{index}" for index in range(4)],
+        "service": [f"service-{index}" for index in range(16)],
+    }
+    labels: dict = {"app": [f"app-{index}" for index in range(8)]}
+
+    builders: dict = {
+        f"hosts by id x{len(ids)}": lambda: GremlinTargetHosts(
+            strategy_type="Exact", exact=1, target_all_hosts=False, ids=ids
+        ),
+        "hosts by tag": lambda: GremlinTargetHosts(
+            strategy_type="Random", percent=10, target_all_hosts=False, tags=tags
+        ),
+        "containers by label": lambda: GremlinTargetContainers(
+            strategy_type="Random", percent=10, target_all_containers=False, labels=labels
+        ),
+        "latency attack model": lambda: GremlinAttackHelper(
+            command=GremlinLatencyAttack(delay=250),
+            target=GremlinTargetHosts(target_all_hosts=False, tags=tags),
+        ).api_model(),
+    }
+    with GremlinMockAPIServer(agents=agents, containers=agents) as server:
+        client = server.client(http_pool_enabled=True)
+        with client.activate():
+
+            def _cold() -> None:
+                active_client_inventory.invalidate()
+                container_inventory.invalidate()
+                for build in builders.values():
+                    build()
+
+            results[f"cold inventories {agents}"] = min(
+                timeit.repeat(_cold, number=1, repeat=repeat)
+            )
+            for name, build in builders.items():
+                build()
+                results[f"warm {name}"] = min(
+                    timeit.repeat(build, number=1, repeat=repeat)
+                )
+        client.close()
+    return results
+
+
+def main(argv: list) -> None:
+    agents: int = int(argv[1]) if len(argv) > 1 else 10000
+    targets: int = int(argv[2]) if len(argv) > 2 else 100
+    repeat: int = int(argv[3]) if len(argv) > 3 else 5
+    results: dict = bench(agents, targets, repeat)
+    print(f"Attack helper validation against {agents} agents, best of {repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<36} {seconds * 1e6:12.1f} us")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Per call overhead of the endpoint classes and the cost of a large
+list_clients response, measured against the in-process mock API server.
+
+Each endpoint is called through the plain requests transport and through the
+pooled session. "raw session" is a bare requests.Session GET of the same
+server, so the difference is what the SDK itself adds to a call.
+
+    python -m benchmarks.bench_http_clients [calls] [repeat] [agents]
+"""
+
+import sys
+import timeit
+
+import requests
+
+from gremlinapi import json_codec
+from gremlinapi.attacks import GremlinAPIAttacks
+from gremlinapi.clients import GremlinAPIClients
+from gremlinapi.executions import GremlinAPIExecutions
+from gremlinapi.inventory import GremlinClientInventory
+from gremlinapi.scenarios import GremlinAPIScenarios
+from gremlinapi.users import GremlinAPIUsers
+
+from benchmarks.mock_server import MOCK_API_KEY, GremlinMockAPIServer
+
+from typing import Callable, Tuple
+
+ENDPOINTS: Tuple[Tuple[str, Callable], ...] = (
+    ("Attacks.list_active_attacks", GremlinAPIAttacks.list_active_attacks),
+    ("Attacks.halt_all_attacks", GremlinAPIAttacks.halt_all_attacks),
+    ("Clients.list_active_clients", GremlinAPIClients.list_active_clients),
+    ("Executions.list_executions", GremlinAPIExecutions.list_executions),
+    ("Scenarios.list_scenarios", GremlinAPIScenarios.list_scenarios),
+    ("Users.get_user_self", GremlinAPIUsers.get_user_self),
+)
+
+TRANSPORTS: Tuple[Tuple[str, dict], ...] = (
+    ("requests", {"http_pool_enabled": False}),
+    ("pooled", {"http_pool_enabled": True}),
+)
+
+
+def _per_call(func: Callable, calls: int, repeat: int) -> float:
+    func()
+    return min(timeit.repeat(func, number=calls, repeat=repeat)) / calls
+
+
+def bench_endpoints(calls: int = 200, repeat: int = 5) -> dict:
+    """Seconds per call of each endpoint method, by transport"""
+    results: dict = {}
+    with GremlinMockAPIServer(agents=100) as server:
+        with requests.Session() as session:
+            uri: str = f"{server.base_uri}/attacks/active"
+            headers: dict = {"Authorization": f"Key {MOCK_API_KEY}"}
+            results["raw session GET"] = _per_call(
+                lambda: session.get(uri, headers=headers).json(), calls, repeat
+            )
+        for transport, settings in TRANSPORTS:
+            client = server.client(**settings)
+            with client.activate():
+                for name, method in ENDPOINTS:
+                    results[f"{transport} {name}"] = _per_call(method, calls, repeat)
+            client.close()
+    return results
+
+
+def bench_list_clients(agents: int = 10000, repeat: int = 5) -> dict:
+    """Seconds to fetch, decode and index a list_clients response of agents clients"""
+    results: dict = {}
+    with GremlinMockAPIServer(agents=agents) as server:
+        client = server.client(http_pool_enabled=True)
+        with client.activate():
+            body: dict = GremlinAPIClients.list_clients()
+            results[f"list_clients fetch {agents}"] = _per_call(
+                GremlinAPIClients.list_clients, 1, repeat
+            )
+            payload: bytes = json_codec.dumpb(body)
+            results[f"list_clients decode {agents}"] = _per_call(
+                lambda: json_codec.loads(payload), 1, repeat
+            )
+            inventory: GremlinClientInventory = GremlinClientInventory(lambda: body)
+            results[f"list_clients index {agents}"] = _per_call(
+                lambda: inventory._index(body), 1, repeat
+            )
+        client.close()
+    return results
+
+
+def bench(calls: int = 200, repeat: int = 5, agents: int = 10000) -> dict:
+    return {**bench_endpoints(calls, repeat), **bench_list_clients(agents, repeat)}
+
+
+def main(argv: list) -> None:
+    calls: int = int(argv[1]) if len(argv) > 1 else 200
+    repeat: int = int(argv[2]) if len(argv) > 2 else 5
+    agents: int = int(argv[3]) if len(argv) > 3 else 10000
+    results: dict = bench(calls, repeat, agents)
+    print(f"Mock API server calls, {json_codec.backend()} codec, best of {repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<44} {seconds * 1e6:12.1f} us")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Import time of the package, measured with `python -X importtime` in a fresh
+interpreter for each statement.
+
+    python -m benchmarks.bench_import [repeat] [max_ms]
+
+With max_ms the run fails when the bare `import gremlinapi` takes longer,
+which guards against eager imports creeping back into gremlinapi/__init__.py.
+"""
+
+import subprocess
+import sys
+
+STATEMENTS: tuple = (
+    "import gremlinapi",
+    "from gremlinapi import Attacks",
+    "from gremlinapi import AsyncAttacks",
+)
+
+
+def _root_imports(statement: str) -> dict:
+    """Cumulative microseconds of every top level import made running statement"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    roots: dict = {}
+    for line in result.stderr.splitlines():
+        fields: list = line.split("|")
+        # Nested imports are indented below the module that triggered them
+        if (
+            len(fields) == 3
+            and fields[1].strip().isdigit()
+            and not fields[2].startswith("  ")
+        ):
+            roots[fields[2].strip()] = int(fields[1])
+    return roots
+
+
+def import_time_us(statement: str) -> int:
+    """Import time of statement, less what the bare interpreter imports at startup"""
+    startup: dict = _root_imports("pass")
+    return sum(
+        us for name, us in _root_imports(statement).items() if name not in startup
+    )
+
+
+def bench(repeat: int = 5) -> dict:
+    return {
+        statement: min(import_time_us(statement) for _ in range(repeat))
+        for statement in STATEMENTS
+    }
+
+
+def main(argv: list) -> None:
+    repeat: int = int(argv[1]) if len(argv) > 1 else 5
+    max_ms: float = float(argv[2]) if len(argv) > 2 else 0
+    results: dict = bench(repeat)
+    print(f"Cumulative import time, best of {repeat}")
+    for statement, us in results.items():
+        print(f"  {statement:<36} {us / 1000:10.2f} ms")
+    if max_ms and results[STATEMENTS[0]] / 1000 > max_ms:
+        print(f"import gremlinapi exceeded {max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Microbenchmark for building and serializing a linear scenario graph.
+
+Compares _GremlinNodeGraph._validate_type against the previous implementation,
+which called inspect.stack() on every validation to name the caller.
+
+    python -m benchmarks.bench_scenario_graph [node_count] [repeat]
+"""
+
+import inspect
+import logging
+import sys
+import timeit
+
+from unittest.mock import patch
+
+from gremlinapi.exceptions import GremlinParameterError
+from gremlinapi.scenario_graph_helpers import GremlinScenarioNode, _GremlinNodeGraph
+
+log = logging.getLogger("GremlinAPI.client")
+
+
+def _validate_type_inspect_stack(self, _node: GremlinScenarioNode) -> bool:
+    _caller = inspect.stack()[2][3]
+    if not issubclass(type(_node), GremlinScenarioNode):
+        error_msg: str = f"{_caller} expects node to be a subclass of GremlinScenarioNode, received {type(_node)}"
+        log.error(error_msg)
+        raise GremlinParameterError(error_msg)
+    return True
+
+
+def build_graph(node_count: int) -> _GremlinNodeGraph:
+    graph = _GremlinNodeGraph()
+    previous = None
+    for index in range(node_count):
+        node = GremlinScenarioNode(name=f"node-{index}", node_type="Delay")
+        graph.append(node)
+        if previous is not None:
+            graph.add_edge(previous, node)
+        previous = node
+    return graph
+
+
+def build_and_serialize(node_count: int) -> dict:
+    return build_graph(node_count).get_nodes_linear()
+
+
+def bench(node_count: int = 200, repeat: int = 5, legacy: bool = True) -> dict:
+    results: dict = {}
+    results["validate_type"] = min(
+        timeit.repeat(lambda: build_and_serialize(node_count), number=1, repeat=repeat)
+    )
+    if not legacy:
+        return results
+    with patch.object(
+        _GremlinNodeGraph, "_validate_type", _validate_type_inspect_stack
+    ):
+        results["inspect_stack"] = min(
+            timeit.repeat(
+                lambda: build_and_serialize(node_count), number=1, repeat=repeat
+            )
+        )
+    return results
+
+
+def main(argv: list) -> None:
+    node_count: int = int(argv[1]) if len(argv) > 1 else 200
+    repeat: int = int(argv[2]) if len(argv) > 2 else 5
+    results: dict = bench(node_count, repeat)
+    print(f"Build and serialize a {node_count} node linear graph, best of {repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<16} {seconds * 1000:10.2f} ms")
+    print(f"  speedup          {results['inspect_stack'] / results['validate_type']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+In-process HTTP server answering like api.gremlin.com, for benchmarks.
+
+Responses are shaped like the real API's and encoded once up front, so the
+server itself adds as little as possible to the measured time. `latency`
+delays every response and `agents`, `containers` and `items` size the
+client, container and generic list responses.
+
+    with GremlinMockAPIServer(agents=10000) as server:
+        with server.client().activate():
+            GremlinAPIClients.list_clients()
+"""
+
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from gremlinapi.client import GremlinClient
+
+from typing import Any, Dict, List, Optional
+
+MOCK_API_KEY: str = "mock-api-key"
+
+
+def mock_agents(count: int) -> List[dict]:
+    """Active clients as returned by /clients/active, with tags and native keys"""
+    return [
+        {
+            "identifier": f"host-{index}",
+            "state": "ACTIVE",
+            "os-type": "Linux",
+            "os-version": "Ubuntu 22.04",
+            "tags": {
+                "zone": f"zone-{index % 8}",
+                "service": f"service-{index % 64}",
+                "ip": [f"10.0.{index // 256 % 256}.{index % 256}"],
+            },
+            "containers": [
+                {"id": f"container-{index}", "labels": {"app": f"app-{index % 32}"}}
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def mock_containers(count: int) -> List[dict]:
+    return [
+        {
+            "identifier": f"container-{index}",
+            "container_labels": {
+                "app": f"app-{index % 32}",
+                "team": f"team-{index % 4}",
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def mock_items(count: int, item_bytes: int) -> List[dict]:
+    """Generic list items, each padded to about item_bytes of JSON"""
+    return [
+        {
+            "guid": f"{index:08x}-0000-4000-8000-000000000000",
+            "name": f"item-{index}",
+            "state": "Successful",
+            "description": "x" * max(0, item_bytes - 96),
+        }
+        for index in range(count)
+    ]
+
+
+class _GremlinMockAPIHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open, so pooled clients can reuse them
+    protocol_version: str = "HTTP/1.1"
+    # Headers and body go out in separate writes, without TCP_NODELAY the
+    # client's delayed ACK stalls every kept alive response by ~40ms
+    disable_nagle_algorithm: bool = True
+    server: "_GremlinMockHTTPServer"
+
+    def _respond(self) -> None:
+        length: int = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        path: str = urlsplit(self.path).path.rstrip("/")
+        if path.startswith(self.server.base_path):
+            path = path[len(self.server.base_path) :]
+        body: bytes = self.server.responses.get((self.command, path), b"")
+        if not body:
+            body = self.server.default_responses.get(self.command, b"")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _GremlinMockHTTPServer(ThreadingHTTPServer):
+    daemon_threads: bool = True
+    base_path: str = "/v1"
+    latency: float = 0.0
+    responses: Dict[tuple, bytes] = {}
+    default_responses: Dict[str, bytes] = {}
+
+
+class GremlinMockAPIServer(object):
+    def __init__(
+        self,
+        latency: float = 0.0,
+        agents: int = 100,
+        containers: int = 100,
+        items: int = 10,
+        item_bytes: int = 256,
+    ):
+        self.latency: float = latency
+        self.agents: int = agents
+        self.containers: int = containers
+        self.items: int = items
+        self.item_bytes: int = item_bytes
+        self._server: Optional[_GremlinMockHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def responses(self) -> Dict[tuple, bytes]:
+        """Encoded response body by (method, path below /v1)"""
+        agents: List[dict] = mock_agents(self.agents)
+        items: bytes = json.dumps(mock_items(self.items, self.item_bytes)).encode()
+        responses: Dict[tuple, Any] = {
+            ("GET", "/clients"): {"active": agents, "inactive": [], "idle": []},
+            ("GET", "/clients/active"): agents,
+            ("GET", "/containers"): mock_containers(self.containers),
+            ("GET", "/users/self"): {"email": "user@example.com", "role": "TEAM_USER"},
+        }
+        encoded: Dict[tuple, bytes] = {
+            key: json.dumps(value).encode() for key, value in responses.items()
+        }
+        for path in (
+            "/attacks",
+            "/attacks/active",
+            "/attacks/completed",
+            "/executions",
+            "/scenarios",
+            "/scenarios/active",
+            "/schedules",
+            "/templates",
+        ):
+            encoded[("GET", path)] = items
+        return encoded
+
+    @property
+    def base_uri(self) -> str:
+        if self._server is None:
+            raise RuntimeError("GremlinMockAPIServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self._server.base_path}"
+
+    def start(self) -> "GremlinMockAPIServer":
+        server: _GremlinMockHTTPServer = _GremlinMockHTTPServer(
+            ("127.0.0.1", 0), _GremlinMockAPIHandler
+        )
+        server.latency = self.latency
+        server.responses = self.responses()
+        server.default_responses = {
+            "GET": b"[]",
+            "POST": b'"00000000-0000-4000-8000-000000000000"',
+            "PUT": b"{}",
+            "DELETE": b"{}",
+            "PATCH": b"{}",
+        }
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="gremlin-mock-api", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def client(self, **settings: Any) -> GremlinClient:
+        """A GremlinClient pointed at this server, with its own pools and caches"""
+        options: Dict[str, Any] = {
+            "base_uri": self.base_uri,
+            "api_key": MOCK_API_KEY,
+            "bearer_token": None,
+            "retry_max_attempts": 1,
+        }
+        options.update(settings)
+        return GremlinClient(**options)
+
+    def __enter__(self) -> "GremlinMockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Runs every benchmark, records the results as JSON and compares them with a
+baseline recorded earlier on the same machine.
+
+    python -m benchmarks.run [--quick] [--save FILE] [--baseline FILE] [--tolerance 0.5]
+
+With --baseline the run fails when any measurement is more than tolerance
+slower than the baseline and at least --min-delta seconds slower, which
+catches regressions in http_clients.py, attack_helpers.py and
+scenario_graph_helpers.py without failing on microsecond noise.
+"""
+
+import argparse
+import json
+import platform
+import sys
+
+from datetime import datetime, timezone
+
+from gremlinapi import json_codec
+
+from benchmarks import (
+    bench_attack_helpers,
+    bench_http_clients,
+    bench_import,
+    bench_scenario_graph,
+)
+
+from typing import Callable, Dict, List, Tuple
+
+
+def _scenario_graph(quick: bool) -> dict:
+    results: dict = {}
+    for node_count in (100, 1000):
+        # Without the inspect.stack() comparison, which takes seconds per run
+        seconds: float = bench_scenario_graph.bench(
+            node_count, 3 if quick else 5, legacy=False
+        )["validate_type"]
+        results[f"build and serialize {node_count} nodes"] = seconds
+    return results
+
+
+def _imports(quick: bool) -> dict:
+    # bench_import reports microseconds
+    return {
+        statement: us / 1e6
+        for statement, us in bench_import.bench(3 if quick else 5).items()
+    }
+
+
+SUITES: Tuple[Tuple[str, Callable[[bool], dict]], ...] = (
+    (
+        "http_clients",
+        lambda quick: bench_http_clients.bench(
+            calls=50 if quick else 200, repeat=3 if quick else 5, agents=10000
+        ),
+    ),
+    (
+        "attack_helpers",
+        lambda quick: bench_attack_helpers.bench(
+            agents=10000, targets=100, repeat=3 if quick else 5
+        ),
+    ),
+    ("scenario_graph", _scenario_graph),
+    ("import", _imports),
+)
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    """Seconds for every measurement, keyed "suite: measurement" """
+    results: Dict[str, float] = {}
+    for suite, bench in SUITES:
+        for name, seconds in bench(quick).items():
+            results[f"{suite}: {name}"] = seconds
+    return results
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = 0.5,
+    min_delta: float = 2e-5,
+) -> List[str]:
+    """Measurements slower than the baseline by more than tolerance and min_delta"""
+    return [
+        name
+        for name, seconds in results.items()
+        if name in baseline
+        and seconds > baseline[name] * (1 + tolerance)
+        and seconds - baseline[name] > min_delta
+    ]
+
+
+def _parser() -> argparse.ArgumentParser:
+    p: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Gremlin API benchmark suite"
+    )
+    p.add_argument("--quick", action="store_true", help="Fewer calls and repeats")
+    p.add_argument("--save", help="Write the results to this JSON file")
+    p.add_argument("--baseline", help="Compare with results saved by an earlier run")
+    p.add_argument("--tolerance", type=float, default=0.5)
+    p.add_argument("--min-delta", type=float, default=2e-5)
+    return p
+
+
+def main(argv: list) -> None:
+    args: argparse.Namespace = _parser().parse_args(argv[1:])
+    baseline: Dict[str, float] = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    results: Dict[str, float] = run(args.quick)
+    regressions: List[str] = compare(
+        results, baseline, args.tolerance, args.min_delta
+    )
+    for name, seconds in results.items():
+        line: str = f"  {name:<64} {seconds * 1e6:12.1f} us"
+        if name in baseline:
+            line += f" {seconds / baseline[name]:7.2f}x"
+            if name in regressions:
+                line += "  REGRESSION"
+        print(line)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "json_codec": json_codec.backend(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if regressions:
+        print(f"{len(regressions)} measurements regressed beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -4,19 +4,20 @@ from gremlinapi.clients import GremlinAPIClients as clients
 from gremlinapi.orgs import GremlinAPIOrgs as orgs
 import sys
 
+def _bulk_success(outcome) -> bool:
+    for guid, error in outcome['errors'].items():
+        print(f"  {guid} failed: {error}")
+    return not outcome['errors'] and all(
+        body == 'Success' for body in outcome['results'].values()
+    )
+
 def enable_all(team_id, targets) -> bool:
-    success = True
-    for rover in targets:
-        if clients.activate_client(teamId=team_id, guid=rover['identifier']) != 'Success':
-            success = False
-    return success
+    guids = [rover['identifier'] for rover in targets]
+    return _bulk_success(clients.bulk_activate(guids, team_id=team_id, concurrency=16))
 
 def disable_all(team_id, targets) -> bool:
-    success = True
-    for rover in targets:
-        if clients.deactivate_client(teamId=team_id, guid=rover['identifier']) != 'Success':
-            success = False
-    return success
+    guids = [rover['identifier'] for rover in targets]
+    return _bulk_success(clients.bulk_deactivate(guids, team_id=team_id, concurrency=16))
 
 def confirm_yes() -> bool:
     while True:
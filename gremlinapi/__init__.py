@@ -2,6 +2,7 @@
 #
 # Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
 
+import functools
 import logging
 import os
 import re
@@ -9,107 +10,213 @@ import time
 
 from datetime import datetime, timezone
 
-from gremlinapi.alfi import GremlinALFI as alfi
-from gremlinapi.apikeys import GremlinAPIapikeys as apikeys
-from gremlinapi.attack_helpers import (
-    GremlinAttackHelper,
-    GremlinAttackTargetHelper,
-    GremlinTargetHosts,
-    GremlinTargetContainers,
-    GremlinAttackCommandHelper,
-    GremlinResourceAttackHelper,
-    GremlinStateAttackHelper,
-    GremlinNetworkAttackHelper,
-    GremlinCPUAttack,
-    GremlinMemoryAttack,
-    GremlinDiskSpaceAttack,
-    GremlinDiskIOAttack,
-    GremlinShutdownAttack,
-    GremlinProcessKillerAttack,
-    GremlinTimeTravelAttack,
-    GremlinBlackholeAttack,
-    GremlinDNSAttack,
-    GremlinLatencyAttack,
-    GremlinPacketLossAttack,
-)
-from gremlinapi.attacks import GremlinAPIAttacks as Attacks
-from gremlinapi.clients import GremlinAPIClients as Clients
-from gremlinapi.companies import GremlinAPICompanies as Companies
 from gremlinapi.config import GremlinAPIConfig
-from gremlinapi.containers import GremlinAPIContainers as Containers
-from gremlinapi.contracts import GremlinAPIContracts as Contracts
 from gremlinapi.exceptions import *
-from gremlinapi.executions import GremlinAPIExecutions as Executions
-from gremlinapi.gremlinapi import GremlinAPI
-from gremlinapi.halts import GremlinAPIHalts as Halts
-from gremlinapi.http_clients import get_gremlin_httpclient
-from gremlinapi.kubernetes import (
-    GremlinAPIKubernetesAttacks as KubernetesAttacks,
-    GremlinAPIKubernetesTargets as KubernetesTargets,
-)
-from gremlinapi.metadata import GremlinAPIMetadata as Metadata
-from gremlinapi.metrics import GremlinAPIMetrics as Metrics
-from gremlinapi.orgs import GremlinAPIOrgs as Orgs
-from gremlinapi.providers import GremlinAPIProviders as Providers
-from gremlinapi.reports import (
-    GremlinAPIReports as Reports,
-    GremlinAPIReportsSecurity as SecurityReports,
-)
-from gremlinapi.saml import GremlinAPISaml
-from gremlinapi.scenario_helpers import (
-    GremlinScenarioHelper,
-    GremlinScenarioStep,
-    GremlinILFIStep,
-)
-from gremlinapi.scenario_graph_helpers import (
-    GremlinScenarioGraphHelper,
-    GremlinScenarioNode,
-    GremlinScenarioAttackNode,
-    GremlinScenarioILFINode,
-    GremlinScenarioALFINode,
-    GremlinScenarioDelayNode,
-    GremlinScenarioStatusCheckNode,
-)
-from gremlinapi.scenarios import (
-    GremlinAPIScenarios as Scenarios,
-    GremlinAPIScenariosRecommended as RecommendedScenarios,
-)
-from gremlinapi.schedules import GremlinAPISchedules as Schedules
-from gremlinapi.templates import GremlinAPITemplates as Templates
-from gremlinapi.users import (
-    GremlinAPIUsers as Users,
-    GremlinAPIUsersAuth as userAuth,
-    GremlinAPIUsersAuthMFA as userMFAuth,
-)
 from gremlinapi.util import get_version
 
+from importlib import import_module
+from importlib.util import find_spec
+
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Endpoint and helper classes are imported on first access through the module
+# level __getattr__ (PEP 562), so `import gremlinapi` does not pay for requests,
+# urllib3 and every endpoint module up front.
+_lazy_attributes: Dict[str, Tuple[str, str]] = {
+    "alfi": ("gremlinapi.alfi", "GremlinALFI"),
+    "GremlinAnalytics": ("gremlinapi.analytics", "GremlinAnalytics"),
+    "apikeys": ("gremlinapi.apikeys", "GremlinAPIapikeys"),
+    "AsyncAttacks": ("gremlinapi.async_api", "AsyncGremlinAPIAttacks"),
+    "AsyncClients": ("gremlinapi.async_api", "AsyncGremlinAPIClients"),
+    "AsyncContainers": ("gremlinapi.async_api", "AsyncGremlinAPIContainers"),
+    "AsyncExecutions": ("gremlinapi.async_api", "AsyncGremlinAPIExecutions"),
+    "AsyncHalts": ("gremlinapi.async_api", "AsyncGremlinAPIHalts"),
+    "AsyncKubernetesAttacks": ("gremlinapi.async_api", "AsyncGremlinAPIKubernetesAttacks"),
+    "AsyncKubernetesTargets": ("gremlinapi.async_api", "AsyncGremlinAPIKubernetesTargets"),
+    "AsyncMetrics": ("gremlinapi.async_api", "AsyncGremlinAPIMetrics"),
+    "AsyncReports": ("gremlinapi.async_api", "AsyncGremlinAPIReports"),
+    "AsyncScenarios": ("gremlinapi.async_api", "AsyncGremlinAPIScenarios"),
+    "AsyncSchedules": ("gremlinapi.async_api", "AsyncGremlinAPISchedules"),
+    "AsyncUsers": ("gremlinapi.async_api", "AsyncGremlinAPIUsers"),
+    "Attacks": ("gremlinapi.attacks", "GremlinAPIAttacks"),
+    "Clients": ("gremlinapi.clients", "GremlinAPIClients"),
+    "Companies": ("gremlinapi.companies", "GremlinAPICompanies"),
+    "Containers": ("gremlinapi.containers", "GremlinAPIContainers"),
+    "Contracts": ("gremlinapi.contracts", "GremlinAPIContracts"),
+    "Executions": ("gremlinapi.executions", "GremlinAPIExecutions"),
+    "GremlinAPI": ("gremlinapi.gremlinapi", "GremlinAPI"),
+    "GremlinClient": ("gremlinapi.client", "GremlinClient"),
+    "Halts": ("gremlinapi.halts", "GremlinAPIHalts"),
+    "GremlinAPIInstrumentation": (
+        "gremlinapi.instrumentation",
+        "GremlinAPIInstrumentation",
+    ),
+    "get_gremlin_httpclient": ("gremlinapi.http_clients", "get_gremlin_httpclient"),
+    "close_gremlin_httpclient": ("gremlinapi.http_clients", "close_gremlin_httpclient"),
+    "GremlinAPIRecordingClient": ("gremlinapi.http_clients", "GremlinAPIRecordingClient"),
+    "GremlinAPIReplayClient": ("gremlinapi.http_clients", "GremlinAPIReplayClient"),
+    "KubernetesAttacks": ("gremlinapi.kubernetes", "GremlinAPIKubernetesAttacks"),
+    "KubernetesTargets": ("gremlinapi.kubernetes", "GremlinAPIKubernetesTargets"),
+    "Metadata": ("gremlinapi.metadata", "GremlinAPIMetadata"),
+    "Metrics": ("gremlinapi.metrics", "GremlinAPIMetrics"),
+    "Orgs": ("gremlinapi.orgs", "GremlinAPIOrgs"),
+    "Providers": ("gremlinapi.providers", "GremlinAPIProviders"),
+    "Reports": ("gremlinapi.reports", "GremlinAPIReports"),
+    "SecurityReports": ("gremlinapi.reports", "GremlinAPIReportsSecurity"),
+    "GremlinReportEngine": ("gremlinapi.report_engine", "GremlinReportEngine"),
+    "GremlinReportCache": ("gremlinapi.report_engine", "GremlinReportCache"),
+    "GremlinAPISaml": ("gremlinapi.saml", "GremlinAPISaml"),
+    "GremlinAPITokenManager": ("gremlinapi.token_manager", "GremlinAPITokenManager"),
+    "Scenarios": ("gremlinapi.scenarios", "GremlinAPIScenarios"),
+    "RecommendedScenarios": ("gremlinapi.scenarios", "GremlinAPIScenariosRecommended"),
+    "Schedules": ("gremlinapi.schedules", "GremlinAPISchedules"),
+    "Templates": ("gremlinapi.templates", "GremlinAPITemplates"),
+    "Users": ("gremlinapi.users", "GremlinAPIUsers"),
+    "userAuth": ("gremlinapi.users", "GremlinAPIUsersAuth"),
+    "userMFAuth": ("gremlinapi.users", "GremlinAPIUsersAuthMFA"),
+}
+for _name in (
+    "GremlinAttackHelper",
+    "GremlinAttackTargetHelper",
+    "GremlinTargetHosts",
+    "GremlinTargetContainers",
+    "GremlinAttackCommandHelper",
+    "GremlinResourceAttackHelper",
+    "GremlinStateAttackHelper",
+    "GremlinNetworkAttackHelper",
+    "GremlinCPUAttack",
+    "GremlinMemoryAttack",
+    "GremlinDiskSpaceAttack",
+    "GremlinDiskIOAttack",
+    "GremlinShutdownAttack",
+    "GremlinProcessKillerAttack",
+    "GremlinTimeTravelAttack",
+    "GremlinBlackholeAttack",
+    "GremlinDNSAttack",
+    "GremlinLatencyAttack",
+    "GremlinPacketLossAttack",
+):
+    _lazy_attributes[_name] = ("gremlinapi.attack_helpers", _name)
+for _name in ("GremlinScenarioHelper", "GremlinScenarioStep", "GremlinILFIStep"):
+    _lazy_attributes[_name] = ("gremlinapi.scenario_helpers", _name)
+for _name in (
+    "GremlinScenarioGraphHelper",
+    "GremlinScenarioNode",
+    "GremlinScenarioAttackNode",
+    "GremlinScenarioILFINode",
+    "GremlinScenarioALFINode",
+    "GremlinScenarioDelayNode",
+    "GremlinScenarioStatusCheckNode",
+):
+    _lazy_attributes[_name] = ("gremlinapi.scenario_graph_helpers", _name)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        module_name, attribute = _lazy_attributes[name]
+        value: Any = getattr(import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    # Submodules stay reachable as attributes, e.g. gremlinapi.attacks
+    if not name.startswith("__") and find_spec(f"{__name__}.{name}") is not None:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
+
 
 __version__ = get_version()
 
 
 # Logging Configuration
+# The secrets a SecretsFilter redacts, with the pattern matching any of them
+# and the replacement for each. Never mutated, so concurrent filter calls
+# can share one.
+_SecretsState = Tuple[Tuple[Any, ...], Optional[Pattern], Dict[str, str]]
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_secrets(secrets: Tuple[Any, ...], secret_length: int) -> _SecretsState:
+    api_key, bearer_token, password = secrets
+    replacements: Dict[str, str] = {}
+    for value, replacement in (
+        (api_key, f"...{str(api_key)[-4:]}"),
+        (bearer_token, f"...{str(bearer_token)[-4:]}"),
+        (password, "[PASSWORD REDACTED]"),
+    ):
+        if isinstance(value, str) and len(value) >= secret_length:
+            replacements.setdefault(value, replacement)
+    if not replacements:
+        return (secrets, None, replacements)
+    # Longest first, so a secret containing another is replaced whole
+    ordered: List[str] = sorted(replacements, key=len, reverse=True)
+    alternatives: str = "|".join(re.escape(secret) for secret in ordered)
+    return (secrets, re.compile(rf"({alternatives})[\'\s]?"), replacements)
+
+
 class SecretsFilter(logging.Filter):
-    def filter(self, record):
-        secret_length = 5
-        if len(GremlinAPIConfig.api_key) >= secret_length:
-            record.msg = re.sub(
-                rf"{GremlinAPIConfig.api_key}[\'\s]?",
-                "..." + GremlinAPIConfig.api_key[-4:],
-                record.msg,
-            )
-        if len(GremlinAPIConfig.bearer_token) >= secret_length:
-            record.msg = re.sub(
-                rf"{GremlinAPIConfig.bearer_token}[\'\s]?",
-                "..." + GremlinAPIConfig.bearer_token[-4:],
-                record.msg,
+    """
+    Redacts the configured API key, bearer token and password from log records,
+    including their arguments.
+
+    A single pattern matching every secret is compiled once per set of values,
+    and records are only rewritten when that pattern matches, so most records
+    pass through untouched. Compiled patterns are cached, so switching between
+    clients with different keys does not recompile them.
+    """
+
+    secret_length: int = 5
+
+    def __init__(self, name: str = ""):
+        super(SecretsFilter, self).__init__(name)
+        self._state: _SecretsState = _compile_secrets(
+            (None, None, None), self.secret_length
+        )
+
+    @staticmethod
+    def _redact_arg(arg: Any, pattern: Pattern, replacements: Dict[str, str]) -> Any:
+        if arg is None or isinstance(arg, (bool, int, float)):
+            return arg
+        text: str = arg if isinstance(arg, str) else str(arg)
+        if pattern.search(text) is None:
+            return arg
+        return pattern.sub(lambda match: replacements[match.group(1)], text)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        secrets: Tuple[Any, ...] = tuple(
+            value if isinstance(value, str) else None
+            for value in (
+                GremlinAPIConfig.api_key,
+                GremlinAPIConfig.bearer_token,
+                GremlinAPIConfig.password,
             )
-        if len(GremlinAPIConfig.password) >= secret_length:
-            record.msg = re.sub(
-                rf"{GremlinAPIConfig.password}[\'\s]?",
-                "[PASSWORD REDACTED]",
-                record.msg,
+        )
+        # Read once, as another thread may replace it while this one redacts
+        state: _SecretsState = self._state
+        if state[0] != secrets:
+            state = self._state = _compile_secrets(secrets, self.secret_length)
+        pattern: Optional[Pattern] = state[1]
+        if pattern is None:
+            return True
+        replacements: Dict[str, str] = state[2]
+        record.msg = self._redact_arg(record.msg, pattern, replacements)
+        args: Any = record.args
+        if isinstance(args, dict):
+            redacted: Dict[Any, Any] = {
+                key: self._redact_arg(value, pattern, replacements)
+                for key, value in args.items()
+            }
+            if any(redacted[key] is not value for key, value in args.items()):
+                record.args = redacted
+        elif args:
+            redacted_args: Tuple[Any, ...] = tuple(
+                self._redact_arg(arg, pattern, replacements) for arg in args
             )
-        return record
+            if any(new is not old for new, old in zip(redacted_args, args)):
+                record.args = redacted_args
+        return True
 
 
 logging_levels = {
@@ -140,6 +247,7 @@ _api_key: str = os.getenv("GREMLIN_API_KEY", "")
 _api_bearer_token: str = os.getenv("GREMLIN_BEARER_TOKEN", "")
 _bearer_token_timestamp: str = ""
 _max_bearer_interval: int = int(os.getenv("GREMLIN_MAX_BEARER_INTERVAL", 86400))
+_bearer_refresh_margin: float = float(os.getenv("GREMLIN_BEARER_REFRESH_MARGIN", 300))
 _api_user: str = os.getenv("GREMLIN_USER", "")
 _api_password: str = os.getenv("GREMLIN_PASSWORD", "")
 _api_user_mfa_token: str = os.getenv("GREMLIN_USER_MFA_TOKEN", "")
@@ -148,6 +256,34 @@ _api_team_id: str = os.getenv("GREMLIN_TEAM_ID", "")
 
 _http_proxy = os.getenv("GREMLIN_HTTP_PROXY", os.getenv("HTTP_PROXY", None))
 _https_proxy = os.getenv("GREMLIN_HTTPS_PROXY", os.getenv("HTTPS_PROXY", None))
+_json_codec = os.getenv("GREMLIN_JSON_CODEC", None)
+_cassette = os.getenv("GREMLIN_CASSETTE", None)
+_cassette_mode = os.getenv("GREMLIN_CASSETTE_MODE", None)
+_cassette_time_scale: float = float(os.getenv("GREMLIN_CASSETTE_TIME_SCALE", 1.0))
+_report_cache = os.getenv("GREMLIN_REPORT_CACHE", None)
+
+_client_cache_ttl: float = float(os.getenv("GREMLIN_CLIENT_CACHE_TTL", 300))
+_target_inventory_ttl: float = float(os.getenv("GREMLIN_TARGET_INVENTORY_TTL", 300))
+
+_http_pool_enabled: bool = os.getenv("GREMLIN_HTTP_POOL", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+_http_pool_connections: int = int(os.getenv("GREMLIN_HTTP_POOL_CONNECTIONS", 10))
+_http_pool_maxsize: int = int(os.getenv("GREMLIN_HTTP_POOL_MAXSIZE", 10))
+_http_connect_timeout: float = float(os.getenv("GREMLIN_HTTP_CONNECT_TIMEOUT", 10))
+_http_read_timeout: float = float(os.getenv("GREMLIN_HTTP_READ_TIMEOUT", 60))
+_retry_max_attempts: int = int(os.getenv("GREMLIN_HTTP_RETRY_MAX_ATTEMPTS", 3))
+_http_keep_alive: bool = os.getenv("GREMLIN_HTTP_KEEP_ALIVE", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+_http2: bool = os.getenv("GREMLIN_HTTP2", "false").lower() in ("1", "true", "yes")
+_instrumentation_enabled: bool = os.getenv(
+    "GREMLIN_INSTRUMENTATION", "true"
+).lower() in ("1", "true", "yes")
 
 
 GremlinAPIConfig.user = _api_user  # type: ignore
@@ -159,8 +295,25 @@ GremlinAPIConfig.api_key = _api_key  # type: ignore
 GremlinAPIConfig.bearer_token = _api_bearer_token  # type: ignore
 GremlinAPIConfig.bearer_timestamp = _bearer_token_timestamp  # type: ignore
 GremlinAPIConfig.max_bearer_interval = _max_bearer_interval  # type: ignore
+GremlinAPIConfig.bearer_refresh_margin = _bearer_refresh_margin  # type: ignore
 GremlinAPIConfig.http_proxy = _http_proxy  # type: ignore
 GremlinAPIConfig.https_proxy = _https_proxy  # type: ignore
+GremlinAPIConfig.json_codec = _json_codec  # type: ignore
+GremlinAPIConfig.cassette = _cassette  # type: ignore
+GremlinAPIConfig.cassette_mode = _cassette_mode  # type: ignore
+GremlinAPIConfig.cassette_time_scale = _cassette_time_scale  # type: ignore
+GremlinAPIConfig.report_cache = _report_cache  # type: ignore
+GremlinAPIConfig.client_cache_ttl = _client_cache_ttl  # type: ignore
+GremlinAPIConfig.target_inventory_ttl = _target_inventory_ttl  # type: ignore
+GremlinAPIConfig.http_pool_enabled = _http_pool_enabled  # type: ignore
+GremlinAPIConfig.http_pool_connections = _http_pool_connections  # type: ignore
+GremlinAPIConfig.http_pool_maxsize = _http_pool_maxsize  # type: ignore
+GremlinAPIConfig.http_keep_alive = _http_keep_alive  # type: ignore
+GremlinAPIConfig.http2 = _http2  # type: ignore
+GremlinAPIConfig.http_connect_timeout = _http_connect_timeout  # type: ignore
+GremlinAPIConfig.http_read_timeout = _http_read_timeout  # type: ignore
+GremlinAPIConfig.retry_max_attempts = _retry_max_attempts  # type: ignore
+GremlinAPIConfig.instrumentation_enabled = _instrumentation_enabled  # type: ignore
 
 
 def _auth_response_to_bearer_config(auth_response):
@@ -177,7 +330,17 @@ def login(
     password=GremlinAPIConfig.password,
     company_name=GremlinAPIConfig.company_name,
     token=GremlinAPIConfig.user_mfa_token_value,
+    auto_refresh=False,
 ):
+    """
+    Logs in with a user's credentials and stores the bearer token in
+    GremlinAPIConfig, unless the current token is still valid.
+
+    With auto_refresh the token manager renews the token with these same
+    credentials before it expires and after a 401. An MFA token is reused as
+    given, so MFA logins should start GremlinAPITokenManager with their own
+    refresher instead.
+    """
     if GremlinAPIConfig.user != email:
         if log.getEffectiveLevel() == logging.DEBUG:
             log.debug(
@@ -207,20 +370,34 @@ def login(
         or not GremlinAPIConfig.bearer_token
         or GremlinAPIConfig.is_bearer_expired()
     ):
-        if token:
-            if log.getEffectiveLevel() == logging.DEBUG:
-                log.debug(f"MFA Login for {email} in company {company_name}")
-            auth_response = userMFAuth.auth_user(
-                email=email, password=password, companyName=company_name, token=token
-            )
-        else:
-            if log.getEffectiveLevel() == logging.DEBUG:
-                log.debug(f"Non-MFA Login for {email} in company {company_name}")
-            auth_response = userAuth.auth_user(
-                email=email, password=password, companyName=company_name
-            )
-        # if (log.getEffectiveLevel() == logging.DEBUG): log.debug(auth_response)
-        _auth_response_to_bearer_config(auth_response)
+        _authenticate(email, password, company_name, token)
+    if auto_refresh:
+        from gremlinapi.token_manager import GremlinAPITokenManager
+
+        GremlinAPITokenManager.start(
+            lambda: _authenticate(email, password, company_name, token)
+        )
+
+
+def _authenticate(email, password, company_name, token):
+    if token:
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"MFA Login for {email} in company {company_name}")
+        from gremlinapi.users import GremlinAPIUsersAuthMFA as userMFAuth
+
+        auth_response = userMFAuth.auth_user(
+            email=email, password=password, companyName=company_name, token=token
+        )
+    else:
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"Non-MFA Login for {email} in company {company_name}")
+        from gremlinapi.users import GremlinAPIUsersAuth as userAuth
+
+        auth_response = userAuth.auth_user(
+            email=email, password=password, companyName=company_name
+        )
+    # if (log.getEffectiveLevel() == logging.DEBUG): log.debug(auth_response)
+    _auth_response_to_bearer_config(auth_response)
 
 
 def saml_login(email=GremlinAPIConfig.user, saml_assertion=None, relay_state=None):
@@ -242,6 +419,8 @@ def saml_login(email=GremlinAPIConfig.user, saml_assertion=None, relay_state=Non
         error_msg = "Both saml_assertion and relay_state arguments must be specified"
         log.fatal(error_msg)
         raise GremlinParameterError(error_msg)
+    from gremlinapi.saml import GremlinAPISaml
+
     acs_response = GremlinAPISaml.acs(
         SAMLResponse=saml_assertion, RelayState=relay_state
     )
@@ -257,3 +436,11 @@ def saml_login(email=GremlinAPIConfig.user, saml_assertion=None, relay_state=Non
     saml_sessions = GremlinAPISaml.sessions(code=saml_session_code)
     GremlinAPIConfig.bearer_token = saml_sessions["header"]
     return GremlinAPIConfig.bearer_token
+
+
+__all__ = [
+    name
+    for name in globals()
+    if not name.startswith("_")
+    and getattr(globals()[name], "__module__", None) != "typing"
+] + list(_lazy_attributes)
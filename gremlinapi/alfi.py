@@ -13,7 +13,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -26,87 +26,93 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinALFI(GremlinAPI):
     @classmethod
     @register_cli_action("create_alfi_experiment", ("body",), ("teamId",))
+    @api_endpoint
     def create_alfi_experiment(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = cls._error_if_not_json_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint("/experiments", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_all_alfi_experiments", ("",), ("teamId",))
+    @api_endpoint
     def halt_all_alfi_experiments(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         endpoint: str = cls._optional_team_endpoint("/experiments", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_alfi_experiment_details", ("guid",), ("teamId",))
+    @api_endpoint
     def get_alfi_experiment_details(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/experiments/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_alfi_experiment", ("guid",), ("teamId",))
+    @api_endpoint
     def halt_alfi_experiment(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/experiments/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_active_alfi_experiments", ("",), ("teamId",))
+    @api_endpoint
     def list_active_alfi_experiments(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint("/experiments/active", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_completed_alfi_experiments", ("",), ("teamId",))
+    @api_endpoint
     def list_completed_alfi_experiments(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint("/experiments/completed", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Vectorized analysis of attack metrics and scenario runs.
+
+Responses of GremlinAPIMetrics.get_attack_metrics, get_scenario_run_metrics
+and GremlinAPIScenarios.list_scenarios_runs are flattened into columns in one
+pass of plain Python, then handed to pandas as whole columns, so percentiles,
+failure rates and time bucketed rollups over a year of history are computed
+by NumPy rather than by loops over runs. pandas and NumPy are optional,
+install gremlinapi[analytics].
+"""
+
+import logging
+
+from gremlinapi.exceptions import GremlinParameterError
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+log = logging.getLogger("GremlinAPI.client")
+
+# Column: paths tried in order, the first present in a run is used
+RUN_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "scenario_id": ("scenario_id", "scenarioId", "guid"),
+    "scenario_name": ("scenario_name", "scenarioName", "name"),
+    "run_number": ("run_number", "runNumber"),
+    "team_id": ("org_id", "team_id", "teamId"),
+    "stage": ("stage_info.stage", "stage", "state"),
+    "created_at": ("created_at", "createdAt", "create_at"),
+    "start_time": ("start_time", "startTime"),
+    "end_time": ("end_time", "endTime"),
+}
+
+# Stages of runs which have not finished, they are neither passed nor failed
+ACTIVE_STAGES: Tuple[str, ...] = (
+    "Pending",
+    "Distributed",
+    "Initializing",
+    "Running",
+    "HaltRequested",
+    "RollbackStarted",
+)
+SUCCESSFUL_STAGES: Tuple[str, ...] = ("Successful",)
+FAILED_STAGES: Tuple[str, ...] = (
+    "Failed",
+    "InitializationFailed",
+    "LostCommunication",
+    "ClientAborted",
+    "TargetNotFound",
+)
+
+POINT_KEYS: Tuple[str, ...] = ("points", "datapoints", "values", "data")
+TIMESTAMP_KEYS: Tuple[str, ...] = ("timestamp", "time", "ts", "t")
+VALUE_KEYS: Tuple[str, ...] = ("value", "v", "y")
+
+_unloaded: object = object()
+_pandas: Any = _unloaded
+
+
+def _load_pandas() -> Any:
+    """Imports pandas on first use, None when it is not installed"""
+    global _pandas
+    if _pandas is _unloaded:
+        try:
+            import pandas  # type: ignore
+        except ImportError:
+            pandas = None
+        _pandas = pandas
+    return _pandas
+
+
+def _require_pandas(caller: str) -> Any:
+    pandas: Any = _load_pandas()
+    if pandas is None:
+        error_msg: str = f"{caller} requires pandas and NumPy, install gremlinapi[analytics]"
+        log.error(error_msg)
+        raise ImportError(error_msg)
+    return pandas
+
+
+def _lookup(item: dict, path: str) -> Any:
+    value: Any = item
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _items(body: Any) -> list:
+    """The list in a list response, or in the items of a paged one"""
+    if isinstance(body, dict):
+        body = body.get("items", [])
+    return body if isinstance(body, list) else []
+
+
+def run_failed(stage: Optional[str]) -> Optional[bool]:
+    """
+    Whether a run with stage failed, None while it is still running and for
+    stages which are neither successful nor failed, such as Halted
+    """
+    if stage in SUCCESSFUL_STAGES:
+        return False
+    if stage in FAILED_STAGES:
+        return True
+    return None
+
+
+def scenario_run_columns(runs: Any) -> Dict[str, list]:
+    """
+    Columns of the runs in a list_scenarios_runs or list_scenario_runs
+    response, one value per run, plus `failed` from the run's stage
+    """
+    items: list = _items(runs)
+    columns: Dict[str, list] = {}
+    for column, paths in RUN_FIELDS.items():
+        values: list = []
+        for run in items:
+            value: Any = None
+            for path in paths:
+                value = _lookup(run, path)
+                if value is not None:
+                    break
+            values.append(value)
+        columns[column] = values
+    columns["failed"] = [run_failed(stage) for stage in columns["stage"]]
+    return columns
+
+
+def _point(point: Any) -> Optional[Tuple[Any, Any]]:
+    """(timestamp, value) of a [timestamp, value] pair or a point object"""
+    if isinstance(point, (list, tuple)) and len(point) == 2:
+        return point[0], point[1]
+    if isinstance(point, dict):
+        timestamp: Any = next((point[k] for k in TIMESTAMP_KEYS if k in point), None)
+        value: Any = next((point[k] for k in VALUE_KEYS if k in point), None)
+        if timestamp is not None:
+            return timestamp, value
+    return None
+
+
+def _series(node: Any, name: str) -> Iterable[Tuple[str, list]]:
+    """Every (metric name, points) in a metrics response, however it is nested"""
+    if isinstance(node, dict):
+        for key in POINT_KEYS:
+            if isinstance(node.get(key), list):
+                label: Any = node.get("name") or node.get("metric") or node.get("metricName")
+                yield str(label or name or key), node[key]
+                return
+        for key, value in node.items():
+            if isinstance(value, (dict, list)):
+                yield from _series(value, f"{name}.{key}" if name else key)
+    elif isinstance(node, list):
+        if node and all(_point(point) is not None for point in node):
+            yield name or "value", node
+        else:
+            for item in node:
+                yield from _series(item, name)
+
+
+def metric_columns(body: Any, **labels: Any) -> Dict[str, list]:
+    """
+    Columns of every point in an attack or scenario run metrics response:
+    the labels, the metric name, the timestamp and the value
+    """
+    metrics: List[str] = []
+    timestamps: list = []
+    values: list = []
+    for metric, points in _series(body, ""):
+        for point in points:
+            parsed: Optional[Tuple[Any, Any]] = _point(point)
+            if parsed is not None:
+                metrics.append(metric)
+                timestamps.append(parsed[0])
+                values.append(parsed[1])
+    columns: Dict[str, list] = {
+        label: [value] * len(metrics) for label, value in labels.items()
+    }
+    columns.update({"metric": metrics, "timestamp": timestamps, "value": values})
+    return columns
+
+
+def _extend(columns: Dict[str, list], more: Dict[str, list]) -> None:
+    for column, values in more.items():
+        columns.setdefault(column, []).extend(values)
+
+
+class GremlinAnalytics(object):
+    @classmethod
+    def _timestamps(cls, values: Any) -> Any:
+        """UTC datetimes of ISO strings or of epoch seconds or milliseconds"""
+        pandas: Any = _load_pandas()
+        if pandas.api.types.is_numeric_dtype(values):
+            unit: str = "ms" if values.abs().max() > 1e11 else "s"
+            return pandas.to_datetime(values, unit=unit, utc=True)
+        return pandas.to_datetime(values, utc=True, errors="coerce")
+
+    @classmethod
+    def runs_frame(cls, runs: Any) -> Any:
+        """
+        One row per scenario run, with UTC times, `duration_seconds` and
+        `failed` (True, False, or missing while the run is active and for
+        halted or unknown stages)
+        """
+        pandas: Any = _require_pandas("runs_frame")
+        frame: Any = pandas.DataFrame(scenario_run_columns(runs))
+        for column in ("created_at", "start_time", "end_time"):
+            frame[column] = cls._timestamps(frame[column])
+        frame["duration_seconds"] = (
+            frame["end_time"] - frame["start_time"]
+        ).dt.total_seconds()
+        frame["failed"] = frame["failed"].astype("boolean")
+        return frame
+
+    @classmethod
+    def attack_metrics_frame(cls, metrics: Mapping[str, Any]) -> Any:
+        """One row per point of the get_attack_metrics responses, by attack id"""
+        pandas: Any = _require_pandas("attack_metrics_frame")
+        columns: Dict[str, list] = {"attack_id": []}
+        for attack_id, body in metrics.items():
+            _extend(columns, metric_columns(body, attack_id=attack_id))
+        return cls._metrics_frame(pandas, columns)
+
+    @classmethod
+    def scenario_run_metrics_frame(cls, metrics: Mapping[Tuple[str, Any], Any]) -> Any:
+        """
+        One row per point of the get_scenario_run_metrics responses, by
+        (scenario id, run number)
+        """
+        pandas: Any = _require_pandas("scenario_run_metrics_frame")
+        columns: Dict[str, list] = {"scenario_id": [], "run_number": []}
+        for (scenario_id, run_number), body in metrics.items():
+            _extend(
+                columns,
+                metric_columns(body, scenario_id=scenario_id, run_number=run_number),
+            )
+        return cls._metrics_frame(pandas, columns)
+
+    @classmethod
+    def _metrics_frame(cls, pandas: Any, columns: Dict[str, list]) -> Any:
+        for column in ("metric", "timestamp", "value"):
+            columns.setdefault(column, [])
+        frame: Any = pandas.DataFrame(columns)
+        frame["timestamp"] = cls._timestamps(frame["timestamp"])
+        frame["value"] = pandas.to_numeric(frame["value"], errors="coerce")
+        return frame
+
+    @classmethod
+    def _keys(
+        cls, pandas: Any, by: Union[str, Sequence[str], None], freq: Optional[str], on: str
+    ) -> list:
+        keys: list = [by] if isinstance(by, str) else list(by or ())
+        if freq:
+            keys.insert(0, pandas.Grouper(key=on, freq=freq))
+        if not keys:
+            error_msg: str = "Aggregations need a column to group by or a freq"
+            log.error(error_msg)
+            raise GremlinParameterError(error_msg)
+        return keys
+
+    @classmethod
+    def percentiles(
+        cls,
+        frame: Any,
+        by: Union[str, Sequence[str], None] = "metric",
+        column: str = "value",
+        q: Sequence[float] = (0.5, 0.9, 0.95, 0.99),
+        freq: Optional[str] = None,
+        on: str = "timestamp",
+    ) -> Any:
+        """
+        count, mean and the q quantiles of column, as p50, p90, ... columns,
+        for each group of by and, with a pandas freq such as "D" or "W", for
+        each time bucket of on
+        """
+        pandas: Any = _require_pandas("percentiles")
+        grouped: Any = frame.groupby(cls._keys(pandas, by, freq, on))[column]
+        quantiles: Any = grouped.quantile(list(q)).unstack(-1)
+        quantiles.columns = [f"p{quantile * 100:g}" for quantile in quantiles.columns]
+        summary: Any = pandas.DataFrame({"count": grouped.count(), "mean": grouped.mean()})
+        return summary.join(quantiles)
+
+    @classmethod
+    def failure_rates(
+        cls,
+        runs: Any,
+        by: Union[str, Sequence[str], None] = "scenario_id",
+        freq: Optional[str] = None,
+        on: str = "created_at",
+    ) -> Any:
+        """
+        runs, failures and failure_rate of the finished runs of a runs_frame
+        for each scenario_id (or team_id, ...) and, with freq, time bucket
+        """
+        pandas: Any = _require_pandas("failure_rates")
+        finished: Any = runs[runs["failed"].notna()].astype({"failed": bool})
+        grouped: Any = finished.groupby(cls._keys(pandas, by, freq, on))["failed"]
+        return pandas.DataFrame(
+            {
+                "runs": grouped.size(),
+                "failures": grouped.sum(),
+                "failure_rate": grouped.mean(),
+            }
+        )
@@ -12,7 +12,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -33,12 +33,13 @@ class GremlinAPIapikeys(GremlinAPI):
         ),
         ("teamId",),
     )
+    @api_endpoint
     def create_apikey(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "description": cls._error_if_not_param("description", **kwargs),
@@ -46,34 +47,36 @@ class GremlinAPIapikeys(GremlinAPI):
         }
         endpoint: str = cls._optional_team_endpoint(f"/apikeys", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_apikeys", ("",), ("teamId",))
+    @api_endpoint
     def list_apikeys(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/apikeys", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("revoke_apikey", ("identifier",), ("teamId",))
+    @api_endpoint
     def revoke_apikey(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/apikeys/{identifier}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+
+from gremlinapi.alfi import GremlinALFI
+from gremlinapi.apikeys import GremlinAPIapikeys
+from gremlinapi.attacks import GremlinAPIAttacks
+from gremlinapi.clients import GremlinAPIClients
+from gremlinapi.companies import GremlinAPICompanies
+from gremlinapi.containers import GremlinAPIContainers
+from gremlinapi.contracts import GremlinAPIContracts
+from gremlinapi.executions import GremlinAPIExecutions
+from gremlinapi.gremlinapi import GremlinAPI, APISteps
+from gremlinapi.halts import GremlinAPIHalts
+from gremlinapi.http_clients import AsyncGremlinAPIHttpClient, GremlinAPIHttpClient
+from gremlinapi.instrumentation import (
+    endpoint_template,
+    request_endpoint,
+    request_operation,
+)
+from gremlinapi.kubernetes import (
+    GremlinAPIKubernetesAttacks,
+    GremlinAPIKubernetesTargets,
+)
+from gremlinapi.metadata import GremlinAPIMetadata
+from gremlinapi.metrics import GremlinAPIMetrics
+from gremlinapi.oauth import GremlinAPIOAUTH
+from gremlinapi.orgs import GremlinAPIOrgs
+from gremlinapi.providers import GremlinAPIProviders
+from gremlinapi.reliability_tests import GremlinAPIReliabilityTests
+from gremlinapi.reports import GremlinAPIReports, GremlinAPIReportsSecurity
+from gremlinapi.saml import GremlinAPISaml
+from gremlinapi.scenarios import GremlinAPIScenarios, GremlinAPIScenariosRecommended
+from gremlinapi.schedules import GremlinAPISchedules
+from gremlinapi.templates import GremlinAPITemplates
+from gremlinapi.users import (
+    GremlinAPIUsers,
+    GremlinAPIUsersAuth,
+    GremlinAPIUsersAuthMFA,
+)
+
+from typing import Any, Callable, Optional, Type
+
+log = logging.getLogger("GremlinAPI.client")
+
+
+class AsyncGremlinAPI(object):
+    """
+    Base class for the asyncio counterparts of the GremlinAPI endpoint classes.
+
+    Subclasses name the synchronous class they mirror in `_sync_api` and get
+    a coroutine for each of its public endpoint methods. The `api_steps` of
+    an endpoint method, see api_endpoint, build each request and
+    post-process its response as they do for the synchronous method, and
+    only the HTTP requests are awaited on the async client. Methods without
+    steps, which call other endpoints, are run on the loop's default
+    executor instead.
+    """
+
+    _sync_api: Type[GremlinAPI] = GremlinAPI
+
+    def __init_subclass__(cls, **kwargs: dict) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+        for name in dir(cls._sync_api):
+            if name.startswith("_") or hasattr(GremlinAPI, name) or name in vars(cls):
+                continue
+            attr: Any = getattr(cls._sync_api, name)
+            if not callable(attr) or inspect.isgeneratorfunction(attr):
+                # Paginating iterators stay synchronous
+                continue
+            setattr(cls, name, classmethod(cls._async_endpoint(name)))
+
+    @staticmethod
+    def _async_endpoint(name: str) -> Callable:
+        async def endpoint(
+            cls,
+            https_client: Optional[Type[AsyncGremlinAPIHttpClient]] = None,
+            **kwargs: dict,
+        ) -> Any:
+            return await cls._call(name, https_client, **kwargs)
+
+        endpoint.__name__ = name
+        endpoint.__qualname__ = name
+        return endpoint
+
+    @classmethod
+    async def _call(
+        cls,
+        name: str,
+        https_client: Optional[Type[AsyncGremlinAPIHttpClient]] = None,
+        **kwargs: dict,
+    ) -> Any:
+        if https_client is None:
+            https_client = AsyncGremlinAPIHttpClient
+        sync_method: Callable = getattr(cls._sync_api, name)
+        api_steps: Optional[Callable[..., APISteps]] = getattr(
+            sync_method, "api_steps", None
+        )
+        if api_steps is None:
+            return await cls._run_in_executor(sync_method, **kwargs)
+
+        steps: APISteps = api_steps(cls._sync_api, https_client=https_client, **kwargs)
+        token: Any = request_operation.set(sync_method.__qualname__)
+        try:
+            result: Any = None
+            error: Optional[Exception] = None
+            while True:
+                try:
+                    if error is None:
+                        (method, endpoint, payload) = steps.send(result)
+                    else:
+                        (method, endpoint, payload) = steps.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                (result, error) = (None, None)
+                route: Any = request_endpoint.set(endpoint_template(endpoint, kwargs))
+                try:
+                    result = await https_client.api_call(method, endpoint, **payload)
+                except Exception as e:
+                    error = e
+                finally:
+                    request_endpoint.reset(route)
+        finally:
+            request_operation.reset(token)
+
+    @classmethod
+    async def _run_in_executor(cls, sync_method: Callable, **kwargs: dict) -> Any:
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"Running {sync_method.__qualname__} on the default executor")
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # Executor threads do not inherit contextvars, copy them so calls made
+        # inside a GremlinClient keep its settings
+        return await loop.run_in_executor(
+            None,
+            functools.partial(contextvars.copy_context().run, sync_method, **kwargs),
+        )
+
+
+class AsyncGremlinALFI(AsyncGremlinAPI):
+    _sync_api = GremlinALFI
+
+
+class AsyncGremlinAPIapikeys(AsyncGremlinAPI):
+    _sync_api = GremlinAPIapikeys
+
+
+class AsyncGremlinAPIAttacks(AsyncGremlinAPI):
+    _sync_api = GremlinAPIAttacks
+
+
+class AsyncGremlinAPIClients(AsyncGremlinAPI):
+    _sync_api = GremlinAPIClients
+
+
+class AsyncGremlinAPICompanies(AsyncGremlinAPI):
+    _sync_api = GremlinAPICompanies
+
+
+class AsyncGremlinAPIContainers(AsyncGremlinAPI):
+    _sync_api = GremlinAPIContainers
+
+
+class AsyncGremlinAPIContracts(AsyncGremlinAPI):
+    _sync_api = GremlinAPIContracts
+
+
+class AsyncGremlinAPIExecutions(AsyncGremlinAPI):
+    _sync_api = GremlinAPIExecutions
+
+
+class AsyncGremlinAPIHalts(AsyncGremlinAPI):
+    _sync_api = GremlinAPIHalts
+
+
+class AsyncGremlinAPIKubernetesAttacks(AsyncGremlinAPI):
+    _sync_api = GremlinAPIKubernetesAttacks
+
+
+class AsyncGremlinAPIKubernetesTargets(AsyncGremlinAPI):
+    _sync_api = GremlinAPIKubernetesTargets
+
+
+class AsyncGremlinAPIMetadata(AsyncGremlinAPI):
+    _sync_api = GremlinAPIMetadata
+
+
+class AsyncGremlinAPIMetrics(AsyncGremlinAPI):
+    _sync_api = GremlinAPIMetrics
+
+
+class AsyncGremlinAPIOAUTH(AsyncGremlinAPI):
+    _sync_api = GremlinAPIOAUTH
+
+
+class AsyncGremlinAPIOrgs(AsyncGremlinAPI):
+    _sync_api = GremlinAPIOrgs
+
+
+class AsyncGremlinAPIProviders(AsyncGremlinAPI):
+    _sync_api = GremlinAPIProviders
+
+
+class AsyncGremlinAPIReliabilityTests(AsyncGremlinAPI):
+    _sync_api = GremlinAPIReliabilityTests
+
+
+class AsyncGremlinAPIReports(AsyncGremlinAPI):
+    _sync_api = GremlinAPIReports
+
+
+class AsyncGremlinAPIReportsSecurity(AsyncGremlinAPI):
+    _sync_api = GremlinAPIReportsSecurity
+
+
+class AsyncGremlinAPISaml(AsyncGremlinAPI):
+    _sync_api = GremlinAPISaml
+
+
+class AsyncGremlinAPIScenarios(AsyncGremlinAPI):
+    _sync_api = GremlinAPIScenarios
+
+
+class AsyncGremlinAPIScenariosRecommended(AsyncGremlinAPI):
+    _sync_api = GremlinAPIScenariosRecommended
+
+
+class AsyncGremlinAPISchedules(AsyncGremlinAPI):
+    _sync_api = GremlinAPISchedules
+
+
+class AsyncGremlinAPITemplates(AsyncGremlinAPI):
+    _sync_api = GremlinAPITemplates
+
+
+class AsyncGremlinAPIUsers(AsyncGremlinAPI):
+    _sync_api = GremlinAPIUsers
+
+
+class AsyncGremlinAPIUsersAuth(AsyncGremlinAPI):
+    _sync_api = GremlinAPIUsersAuth
+
+
+class AsyncGremlinAPIUsersAuthMFA(AsyncGremlinAPI):
+    _sync_api = GremlinAPIUsersAuthMFA
@@ -5,6 +5,7 @@
 import json
 import logging
 import re
+import weakref
 
 from gremlinapi.exceptions import (
     GremlinCommandTargetError,
@@ -14,14 +15,40 @@ from gremlinapi.exceptions import (
 
 from typing import Type, Optional, Union, Dict, TypedDict, Any, Pattern
 
-from gremlinapi.clients import GremlinAPIClients as clients
-from gremlinapi.containers import GremlinAPIContainers as containers
+from gremlinapi.clients import active_client_inventory
+from gremlinapi.containers import container_inventory
+from gremlinapi.inventory import HOST_NATIVE_TAGS
 from gremlinapi.providers import GremlinAPIProviders as providers
 
 log = logging.getLogger("GremlinAPI.client")
 
 
-class GremlinAttackTargetHelper(object):
+# Objects to tell when a helper is assigned to, by helper, see _watch
+_helper_watchers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class _GremlinRevisionedHelper(object):
+    """
+    Counts assignments to a helper's attributes in _revision, so scenario
+    nodes know when to rebuild a model they cached from it, and calls
+    _helper_changed on the objects watching the helper
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_revision":
+            self.__dict__["_revision"] = self.__dict__.get("_revision", 0) + 1
+            for watcher in list(_helper_watchers.get(self, ())):
+                watcher._helper_changed(self)
+
+    def _watch(self, watcher: Any) -> None:
+        _helper_watchers.setdefault(self, weakref.WeakSet()).add(watcher)
+
+    def _unwatch(self, watcher: Any) -> None:
+        _helper_watchers.get(self, set()).discard(watcher)
+
+
+class GremlinAttackTargetHelper(_GremlinRevisionedHelper):
     def __init__(self, *args: tuple, **kwargs: dict):
         self._strategy_type: str = ""
         self._exact: int = 0
@@ -172,7 +199,7 @@ class GremlinAttackTargetHelper(object):
         return repr(self)
 
 
-class GremlinAttackCommandHelper(object):
+class GremlinAttackCommandHelper(_GremlinRevisionedHelper):
     def __init__(self, *args: tuple, **kwargs: dict):
         self._length: int = 60
         self._commandType: str = ""
@@ -350,12 +377,11 @@ class GremlinAttackHelper(object):
 class GremlinTargetHosts(GremlinAttackTargetHelper):
     def __init__(self, *args: tuple, **kwargs: dict):
         super().__init__(*args, **kwargs)
-        self._active_clients: list = list()
-        self._active_identifiers: list = list()
+        self._active_identifiers: set = set()
         self._active_tags: dict = dict()
         self._ids: list = list()
         self._multiSelectTags: dict = dict()
-        self._nativeTags: dict = {"os-type": "os_type", "os-version": "os_version"}
+        self._nativeTags: dict = dict(HOST_NATIVE_TAGS)
         self._target_all_hosts: bool = True
         self.target_all_hosts = kwargs.get("target_all_hosts", True)  # type: ignore
         if not self.target_all_hosts:
@@ -438,46 +464,16 @@ class GremlinTargetHosts(GremlinAttackTargetHelper):
             self._target_all_hosts = False
 
     def _filter_active_identifiers(self) -> None:
-        if not len(self._active_identifiers) > 0:
-            self._load_active_clients()
-            for _client in self._active_clients:
-                self._active_identifiers.append(_client["identifier"])
+        self._active_identifiers = active_client_inventory.identifiers()
 
     def _filter_active_tags(self) -> None:
-        if not len(self._active_tags) > 0:
-            self._load_active_clients()
-            for _client in self._active_clients:
-                for _tag in self._nativeTags:
-                    if not self._active_tags.get(_tag):
-                        self._active_tags[_tag] = list()
-                    if _client.get(_tag) not in self._active_tags[_tag]:
-                        self._active_tags[_tag].append(_client.get(_tag))
-                for _tag in _client.get("tags"):
-                    if not self._active_tags.get(_tag):
-                        self._active_tags[_tag] = list()
-                    _tag_value: str = _client["tags"].get(_tag)
-                    if isinstance(_tag_value, str):
-                        if _tag_value not in self._active_tags[_tag]:
-                            self._active_tags[_tag].append(_tag_value)
-                    elif isinstance(_tag_value, list):
-                        for _inner_tag_value in _client["tags"].get(_tag):
-                            if _inner_tag_value not in self._active_tags[_tag]:
-                                self._active_tags[_tag].append(
-                                    _inner_tag_value)
-
-    def _load_active_clients(self) -> None:
-        if not len(self._active_clients) > 0:
-            self._active_clients = clients.list_active_clients()
+        self._active_tags = active_client_inventory.values_by_key()
 
     def _valid_identifier(self, identifier: str = None) -> bool:
-        if not self._active_identifiers:
-            self._filter_active_identifiers()
-        if identifier in self._active_identifiers:
-            return True
-        return False
+        return active_client_inventory.has_identifier(identifier)
 
     def _valid_tag_pair(self, tagKey: str = None, tagValue: str = None) -> bool:
-        return tagValue in self._active_tags.get(tagKey, [])
+        return active_client_inventory.has_value(tagKey, tagValue)
 
     def api_model(self) -> dict:
         model: dict = super().api_model()
@@ -505,8 +501,7 @@ class GremlinTargetHosts(GremlinAttackTargetHelper):
 class GremlinTargetContainers(GremlinAttackTargetHelper):
     def __init__(self, *args: tuple, **kwargs: dict):
         super().__init__(*args, **kwargs)
-        self._active_containers: list = list()
-        self._active_identifiers: list = list()
+        self._active_identifiers: set = set()
         self._active_labels: dict = dict()
         self._ids: list = list()
         self._multiSelectLabels: dict = dict()
@@ -603,45 +598,16 @@ class GremlinTargetContainers(GremlinAttackTargetHelper):
             self._target_all_containers = False
 
     def _filter_active_identifiers(self) -> None:
-        if not len(self._active_identifiers) > 0:
-            self._load_active_containers()
-            for _container in self._active_containers:
-                self._active_identifiers.append(_container["identifier"])
+        self._active_identifiers = container_inventory.identifiers()
 
     def _filter_active_labels(self) -> None:
-        if not len(self._active_labels) > 0:
-            self._load_active_containers()
-            for _container in self._active_containers:
-                for _label in _container.get("container_labels"):
-                    if not self._active_labels.get(_label):
-                        self._active_labels[_label] = list()
-                    _label_value = _container["container_labels"].get(_label)
-                    if isinstance(_label_value, str):
-                        if _label_value not in self._active_labels[_label]:
-                            self._active_labels[_label].append(_label_value)
-                    elif isinstance(_label_value, list):
-                        for _inner_label_value in _container["container_labels"].get(_label):
-                            if _inner_label_value not in self._active_labels[_label]:
-                                self._active_labels[_label].append(
-                                    _inner_label_value)
-
-    def _load_active_containers(self) -> None:
-        if not len(self._active_containers) > 0:
-            self._active_containers = containers.list_containers()
+        self._active_labels = container_inventory.values_by_key()
 
     def _valid_identifier(self, identifier: str = None) -> bool:
-        if not self._active_identifiers:
-            self._filter_active_identifiers()
-        if identifier in self._active_identifiers:
-            return True
-        return False
+        return container_inventory.has_identifier(identifier)
 
     def _valid_label_pair(self, labelKey: Any = None, labelValue: Any = None) -> bool:
-        if not self._active_labels:
-            self._filter_active_labels()
-        if labelValue in self._active_labels.get(labelKey, []):
-            return True
-        return False
+        return container_inventory.has_value(labelKey, labelValue)
 
     def api_model(self) -> dict:
         model: dict = super().api_model()
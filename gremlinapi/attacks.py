@@ -5,6 +5,8 @@
 import json
 import logging
 
+from urllib.parse import quote
+
 from gremlinapi.cli import register_cli_action
 from gremlinapi.exceptions import (
     GremlinParameterError,
@@ -14,13 +16,13 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.attack_helpers import GremlinAttackHelper
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
 )
-from typing import Union, Type
+from typing import Union, Type, Iterator
 
 log = logging.getLogger("GremlinAPI.client")
 
@@ -40,13 +42,18 @@ class GremlinAPIAttacks(GremlinAPI):
                 endpoint += f"source={source}&"
             if page_size and isinstance(page_size, int):
                 endpoint += f"pageSize={page_size}&"
+        page_token: str = cls._info_if_not_param("pageToken", **kwargs)
+        if page_token:
+            endpoint = cls._add_query_param(
+                endpoint, "pageToken", quote(str(page_token), safe="")
+            )
         return cls._optional_team_endpoint(endpoint, **kwargs)
 
     @classmethod
-    def _error_if_not_attack_body(cls, **kwargs: dict) -> str:
-        body: str = cls._error_if_not_param("body", **kwargs)
+    def _error_if_not_attack_body(cls, **kwargs: dict) -> Union[dict, str]:
+        body: GremlinAttackHelper = cls._error_if_not_param("body", **kwargs)  # type: ignore
         if issubclass(type(body), GremlinAttackHelper):
-            return str(body)
+            return body.api_model()
         else:
             error_msg: str = f"Body present but not of type {type(GremlinAttackHelper)}"
             log.warning(error_msg)
@@ -54,42 +61,45 @@ class GremlinAPIAttacks(GremlinAPI):
 
     @classmethod
     @register_cli_action("create_attack", ("body",), ("teamId",))
+    @api_endpoint
     def create_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
-        data: str = cls._error_if_not_attack_body(**kwargs)
+        data: Union[dict, str] = cls._error_if_not_attack_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint("/attacks/new", **kwargs)
         i_payload: dict = {"headers": https_client.header(), "body": data}
         payload: dict = cls._payload(**i_payload)
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_active_attacks", ("",), ("source", "pageSize", "teamId"))
+    @api_endpoint
     def list_active_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._list_endpoint("/attacks/active", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_attacks", ("",), ("source", "pageSize", "teamId"))
+    @api_endpoint
     def list_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         """
         :param https_client:
         :param kwargs: { source(adhoc or scenario, query), pageSize(int32, query), teamId(string, query) }
@@ -98,19 +108,20 @@ class GremlinAPIAttacks(GremlinAPI):
         method: str = "GET"
         endpoint: str = cls._list_endpoint("/attacks", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action(
         "list_complete_attacks", ("",), ("source", "pageSize", "teamId")
     )
+    @api_endpoint
     def list_completed_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         """
         :param https_client:
         :param kwargs: { source(adhoc or scenario, query), pageSize(int32, query), teamId(string, query) }
@@ -119,49 +130,84 @@ class GremlinAPIAttacks(GremlinAPI):
         method: str = "GET"
         endpoint: str = cls._list_endpoint("/attacks/completed", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
+    @classmethod
+    def iter_attacks(
+        cls,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        prefetch: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Yields attacks one at a time, following page tokens as needed.
+
+        :param prefetch: request the next page in the background
+        :param kwargs: { source(adhoc or scenario, query), pageSize(int32, query), teamId(string, query) }
+        """
+        yield from cls._iter_pages(cls.list_attacks, https_client, prefetch, **kwargs)
+
+    @classmethod
+    def iter_completed_attacks(
+        cls,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        prefetch: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Yields completed attacks one at a time, following page tokens as needed.
+
+        :param prefetch: request the next page in the background
+        :param kwargs: { source(adhoc or scenario, query), pageSize(int32, query), teamId(string, query) }
+        """
+        yield from cls._iter_pages(
+            cls.list_completed_attacks, https_client, prefetch, **kwargs
+        )
+
     @classmethod
     @register_cli_action("get_attack", ("guid",), ("teamId",))
+    @api_endpoint
     def get_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/attacks/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_all_attacks", ("",), ("teamId",))
+    @api_endpoint
     def halt_all_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         endpoint: str = cls._optional_team_endpoint("/attacks", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_attack", ("guid",), ("teamId",))
+    @api_endpoint
     def halt_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/attacks/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Cassette files holding API calls recorded by GremlinAPIRecordingClient and
+played back by GremlinAPIReplayClient.
+
+A cassette is JSON lines, gzip compressed when its path ends in ".gz": a
+header line, then one line per call with the method, the endpoint below
+`GremlinAPIConfig.base_uri`, a digest of the request body, the response
+status, content type and body, and the wall time the call took. Request
+headers are never written, response bodies are written verbatim, so a
+cassette recorded across a login holds the bearer token it returned.
+"""
+
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+
+from collections import deque
+from datetime import datetime, timezone
+
+from gremlinapi import exceptions
+from gremlinapi.config import GremlinAPIConfig
+from gremlinapi.exceptions import GremlinAPIException, GremlinReplayError
+from gremlinapi.util import get_version
+
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
+
+log = logging.getLogger("GremlinAPI.client")
+
+CASSETTE_FORMAT: int = 1
+
+_open_lock: threading.Lock = threading.Lock()
+_cassettes: Dict[Tuple[str, str], "GremlinAPICassette"] = {}
+
+
+def request_digest(kwargs: dict) -> Optional[str]:
+    """Short digest of the body or form data of an api_call, None without one"""
+    payload: Any = kwargs.get("body", kwargs.get("data"))
+    if not payload:
+        return None
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    elif not isinstance(payload, (bytes, bytearray)):
+        payload = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+def relative_endpoint(endpoint: str) -> str:
+    base_uri: str = str(GremlinAPIConfig.base_uri)
+    if endpoint.startswith(base_uri):
+        return endpoint[len(base_uri) :]
+    return endpoint
+
+
+class GremlinAPICassette(object):
+    """
+    One cassette file, opened for recording or for replay. Use open() to
+    share one instance per path between threads and GremlinClients.
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            error_msg: str = f"Cassette mode must be record or replay, received {mode}"
+            log.error(error_msg)
+            raise ValueError(error_msg)
+        self.path: str = path
+        self.mode: str = mode
+        self._lock: threading.Lock = threading.Lock()
+        self._writer: Optional[IO[str]] = None
+        self._entries: Dict[Tuple[str, str, Optional[str]], Deque[dict]] = {}
+        self._last: Dict[Tuple[str, str, Optional[str]], dict] = {}
+        if mode == "record":
+            self._writer = self._open("wt")
+            self._write(
+                {
+                    "gremlinapi_cassette": CASSETTE_FORMAT,
+                    "sdk": get_version(),
+                    "created": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+        else:
+            for entry in self.entries():
+                key: Tuple[str, str, Optional[str]] = self._key(
+                    entry["method"], entry["endpoint"], entry.get("request")
+                )
+                self._entries.setdefault(key, deque()).append(entry)
+
+    @classmethod
+    def open(cls, path: str, mode: str) -> "GremlinAPICassette":
+        """The open cassette for path and mode, opening it on first use"""
+        cassette: Optional[GremlinAPICassette] = _cassettes.get((path, mode))
+        if cassette is None:
+            with _open_lock:
+                cassette = _cassettes.get((path, mode))
+                if cassette is None:
+                    cassette = _cassettes[(path, mode)] = cls(path, mode)
+        return cassette
+
+    @classmethod
+    def close_all(cls) -> None:
+        with _open_lock:
+            cassettes: List[GremlinAPICassette] = list(_cassettes.values())
+            _cassettes.clear()
+        for cassette in cassettes:
+            cassette.close()
+
+    def _open(self, mode: str) -> IO[str]:
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")  # type: ignore
+        return open(self.path, mode, encoding="utf-8")
+
+    @staticmethod
+    def _key(
+        method: str, endpoint: str, digest: Optional[str]
+    ) -> Tuple[str, str, Optional[str]]:
+        return method.upper(), relative_endpoint(endpoint), digest
+
+    def _write(self, entry: dict) -> None:
+        if self._writer is None:
+            error_msg: str = f"Cassette {self.path} is not open for recording"
+            log.error(error_msg)
+            raise GremlinReplayError(error_msg)
+        self._writer.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._writer.flush()
+
+    def entries(self) -> List[dict]:
+        """Every recorded call in the file, in the order they completed"""
+        entries: List[dict] = []
+        with self._open("rt") as f:
+            for line in f:
+                if line.strip():
+                    entry: dict = json.loads(line)
+                    if "gremlinapi_cassette" not in entry:
+                        entries.append(entry)
+        return entries
+
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        digest: Optional[str],
+        resp: Any,
+        duration: float,
+    ) -> None:
+        entry: dict = {
+            "method": method.upper(),
+            "endpoint": relative_endpoint(endpoint),
+            "status": getattr(resp, "status_code", None) or getattr(resp, "status", 200),
+            "duration": round(duration, 6),
+        }
+        if digest:
+            entry["request"] = digest
+        content_type: Optional[str] = resp.headers.get("Content-Type")
+        if content_type:
+            entry["content_type"] = content_type
+        content: Any = getattr(resp, "content", None)
+        if content is None:
+            content = getattr(resp, "data", b"")
+        try:
+            entry["body"] = (content or b"").decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_base64"] = base64.b64encode(content).decode("ascii")
+        with self._lock:
+            self._write(entry)
+
+    def record_error(
+        self,
+        method: str,
+        endpoint: str,
+        digest: Optional[str],
+        error: GremlinAPIException,
+        duration: float,
+    ) -> None:
+        entry: dict = {
+            "method": method.upper(),
+            "endpoint": relative_endpoint(endpoint),
+            "error": error.__class__.__name__,
+            "args": [str(arg) for arg in error.args],
+            "duration": round(duration, 6),
+        }
+        if digest:
+            entry["request"] = digest
+        with self._lock:
+            self._write(entry)
+
+    def match(self, method: str, endpoint: str, digest: Optional[str]) -> dict:
+        """
+        The next recorded call with the same method, endpoint and request
+        body. Once every recording of a call has been replayed its last one
+        is repeated, so polling loops can run longer than they did.
+        """
+        key: Tuple[str, str, Optional[str]] = self._key(method, endpoint, digest)
+        with self._lock:
+            queue: Optional[Deque[dict]] = self._entries.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            entry: Optional[dict] = self._last.get(key)
+        if entry is None:
+            error_msg: str = f"No recording of {key[0]} {key[1]} in cassette {self.path}"
+            log.error(error_msg)
+            raise GremlinReplayError(error_msg)
+        return entry
+
+    @staticmethod
+    def entry_body(entry: dict) -> bytes:
+        if "body_base64" in entry:
+            return base64.b64decode(entry["body_base64"])
+        return entry.get("body", "").encode("utf-8")
+
+    @staticmethod
+    def entry_error(entry: dict) -> GremlinAPIException:
+        """The exception a recorded call raised, with its original message"""
+        error_class: Any = getattr(exceptions, entry["error"], None)
+        if not (
+            isinstance(error_class, type) and issubclass(error_class, GremlinAPIException)
+        ):
+            error_class = GremlinAPIException
+        error: GremlinAPIException = error_class.__new__(error_class)
+        error.args = tuple(entry.get("args", ()))
+        return error
+
+    def close(self) -> None:
+        with self._lock:
+            writer: Optional[IO[str]] = self._writer
+            self._writer = None
+        if writer is not None:
+            writer.close()
+
+
+atexit.register(GremlinAPICassette.close_all)
@@ -12,8 +12,9 @@ import sys
 
 from gremlinapi.config import GremlinAPIConfig
 from gremlinapi.exceptions import GremlinAuthError
+from gremlinapi.instrumentation import request_operation
 
-from typing import Callable, Union
+from typing import Any, Callable, Union
 
 log = logging.getLogger("GremlinAPI.client")
 
@@ -24,9 +25,16 @@ def register_cli_action(
     cls_names: str, required: tuple = tuple(), optional: tuple = tuple()
 ) -> Callable:
     def wrap(f) -> Callable:
+        operation: str = f.__qualname__
+
         @functools.wraps(f)
         def wrapped_f(*args: tuple, **kwargs: dict) -> Callable:
-            return f(*args, **kwargs)
+            # Names the requests this method makes in instrumentation events
+            token: Any = request_operation.set(operation)
+            try:
+                return f(*args, **kwargs)
+            finally:
+                request_operation.reset(token)
 
         in_obj = True
         classes: Union[str, tuple] = cls_names
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+import contextlib
+import functools
+import inspect
+import logging
+
+from gremlinapi.config import GremlinAPIConfig, GremlinAPIConfigScope
+from gremlinapi.exceptions import GremlinParameterError
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+log = logging.getLogger("GremlinAPI.client")
+
+
+class GremlinClientEndpoint(object):
+    """An endpoint class whose methods run with the settings of one GremlinClient"""
+
+    def __init__(self, client: "GremlinClient", endpoint: type):
+        self._client: GremlinClient = client
+        self._endpoint: type = endpoint
+
+    def __getattr__(self, name: str) -> Any:
+        attribute: Any = getattr(self._endpoint, name)
+        if not callable(attribute) or inspect.isclass(attribute):
+            return attribute
+        bound: Callable = self._client.bind(attribute)
+        self.__dict__[name] = bound
+        return bound
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._endpoint.__name__})"
+
+
+class GremlinClient(object):
+    """
+    Gremlin API client with its own configuration, connection pool, target
+    inventories and bearer token manager, so one process can work for several
+    teams or companies at once.
+
+    Settings are named after the GremlinAPIConfig attributes and default to
+    their current values, except the client cache, which starts empty, and
+    the credentials and identity settings, which are never inherited.
+
+        client = GremlinClient(api_key=api_key, team_id=team_id)
+        client.Attacks.list_active_attacks()
+        await client.AsyncScenarios.list_scenarios()
+
+    The endpoint classes are exposed under the names gremlinapi exports them
+    as. Anything else, attack and scenario helpers included, sees the client's
+    settings while it is active:
+
+        with client.activate():
+            GremlinTargetHosts(strategy_type="Random", ...)
+
+    Activation is held in a contextvar, so it follows the current thread or
+    asyncio task and never leaks into other threads using other clients.
+    """
+
+    # Rate limits protect the API as a whole and stay shared by every client
+    process_wide_settings: Tuple[str, ...] = (
+        "rate_limit_burst",
+        "rate_limit_endpoint_qps",
+        "rate_limit_qps",
+    )
+    # Who the client acts as, never taken from the process wide configuration
+    # so a client cannot send another tenant's credentials
+    identity_settings: Tuple[str, ...] = (
+        "api_key",
+        "bearer_expires",
+        "bearer_timestamp",
+        "bearer_token",
+        "company_name",
+        "password",
+        "team_id",
+        "user",
+        "user_mfa_token_value",
+    )
+
+    def __init__(self, **settings: Any):
+        defaults: Dict[str, Any] = vars(GremlinAPIConfig())
+        names: list = [
+            name[1:]
+            for name in defaults
+            if name[1:] not in self.process_wide_settings
+        ]
+        unknown: list = sorted(set(settings) - set(names))
+        if unknown:
+            error_msg: str = f"Unsupported GremlinClient settings: {unknown}"
+            log.error(error_msg)
+            raise GremlinParameterError(error_msg)
+        values: Dict[str, Any] = {
+            name: defaults[f"_{name}"]
+            if name in self.identity_settings
+            else getattr(GremlinAPIConfig, name)
+            for name in names
+        }
+        values["client_cache"] = {}
+        values.update(settings)
+        self._scope: GremlinAPIConfigScope = GremlinAPIConfigScope(values)
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """This client's GremlinAPIConfig values, by attribute name"""
+        return self._scope.settings
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["GremlinClient"]:
+        """Routes GremlinAPIConfig and the shared caches to this client"""
+        with self._scope.activate():
+            yield self
+
+    def bind(self, func: Callable) -> Callable:
+        """
+        Wraps func so that it, and any generator or coroutine it returns,
+        runs with this client active
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _bound_coroutine(*args: Any, **kwargs: Any) -> Any:
+                with self.activate():
+                    return await func(*args, **kwargs)
+
+            return _bound_coroutine
+
+        @functools.wraps(func)
+        def _bound(*args: Any, **kwargs: Any) -> Any:
+            with self.activate():
+                result: Any = func(*args, **kwargs)
+            if inspect.isgenerator(result):
+                return self._iterate(result)
+            return result
+
+        return _bound
+
+    def _iterate(self, generator: Iterator[Any]) -> Iterator[Any]:
+        while True:
+            with self.activate():
+                try:
+                    item: Any = next(generator)
+                except StopIteration:
+                    return
+            yield item
+
+    def __getattr__(self, name: str) -> Any:
+        import gremlinapi
+        from gremlinapi.gremlinapi import GremlinAPI
+
+        endpoint: Any = None
+        if name in gremlinapi._lazy_attributes:
+            endpoint = getattr(gremlinapi, name)
+        if not inspect.isclass(endpoint) or not (
+            issubclass(endpoint, GremlinAPI) or hasattr(endpoint, "_sync_api")
+        ):
+            raise AttributeError(
+                f"{self.__class__.__name__} has no endpoint {name!r}, use activate() for helpers"
+            )
+        namespace: GremlinClientEndpoint = GremlinClientEndpoint(self, endpoint)
+        self.__dict__[name] = namespace
+        return namespace
+
+    def login(
+        self,
+        email: str,
+        password: str,
+        company_name: str,
+        token: Optional[str] = None,
+        auto_refresh: bool = False,
+    ) -> None:
+        """gremlinapi.login, storing the bearer token on this client only"""
+        import gremlinapi
+
+        with self.activate():
+            gremlinapi.login(
+                email=email,
+                password=password,
+                company_name=company_name,
+                token=token,
+                auto_refresh=auto_refresh,
+            )
+
+    def close(self) -> None:
+        """Stops this client's background threads and closes its connection pools"""
+        from gremlinapi.http_clients import (
+            GremlinAPIHttp2Client,
+            GremlinAPIPooledRequestsClient,
+        )
+        from gremlinapi.inventory import GremlinAPITTLCache
+        from gremlinapi.token_manager import GremlinAPITokenManager
+
+        with self.activate():
+            GremlinAPITokenManager.stop()
+            GremlinAPIPooledRequestsClient.close()
+            GremlinAPIHttp2Client.close()
+            for state in self._scope.states():
+                if isinstance(state, GremlinAPITTLCache):
+                    state.stop_background_refresh()
+
+    async def aclose(self) -> None:
+        """close(), and closes this client's AsyncClient on the running event loop"""
+        from gremlinapi.http_clients import AsyncGremlinAPIHttpClient
+
+        self.close()
+        with self.activate():
+            await AsyncGremlinAPIHttpClient.aclose()
+
+    def __enter__(self) -> "GremlinClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
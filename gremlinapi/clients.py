@@ -2,9 +2,12 @@
 #
 # Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
 
+import contextvars
 import logging
 
-from typing import Union, Type, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from typing import Union, Type, Any, Callable, Dict, Iterable, Optional
 
 from gremlinapi.cli import register_cli_action
 from gremlinapi.exceptions import (
@@ -16,7 +19,13 @@ from gremlinapi.exceptions import (
 )
 from gremlinapi.http_clients import GremlinAPIHttpClient
 from gremlinapi.config import GremlinAPIConfig
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
+from gremlinapi.inventory import (
+    HOST_NATIVE_TAGS,
+    GremlinClientInventory,
+    GremlinScopedCache,
+    GremlinTargetInventory,
+)
 from gremlinapi.http_clients import get_gremlin_httpclient
 
 log = logging.getLogger("GremlinAPI.client")
@@ -25,76 +34,167 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIClients(GremlinAPI):
     @classmethod
     @register_cli_action("activate_client", ("guid",), ("teamId",))
+    @api_endpoint
     def activate_client(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/clients/{guid}/activate", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("deactivate_client", ("guid",), ("teamId",))
+    @api_endpoint
     def deactivate_client(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/clients/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_active_clients", ("",), ("teamId",))
+    @api_endpoint
     def list_active_clients(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/clients/active", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_clients", ("",), ("teamId",))
+    @api_endpoint
     def list_clients(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/clients", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
+    @classmethod
+    def _bulk_client_action(
+        cls,
+        action: Callable,
+        guids: Iterable[str],
+        team_id: Optional[str] = None,
+        concurrency: int = 8,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+    ) -> Dict[str, dict]:
+        """
+        Runs `action` for every guid on a bounded pool of worker threads which
+        share the connections of `https_client`. A failure is recorded
+        against its guid and does not stop the remaining calls.
+
+        :return: {"results": {guid: response body}, "errors": {guid: exception}}
+        """
+        guids = list(dict.fromkeys(guids))
+        kwargs: dict = {"teamId": team_id} if team_id else {}
+        results: Dict[str, Any] = dict()
+        errors: Dict[str, Exception] = dict()
+        if not guids:
+            return {"results": results, "errors": errors}
+        if concurrency < 1:
+            error_msg: str = f"concurrency must be at least 1, received {concurrency}"
+            log.error(error_msg)
+            raise GremlinParameterError(error_msg)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(guids))) as pool:
+            # Each worker runs in a copy of this context, so calls made inside a
+            # GremlinClient use that client's settings
+            futures: dict = {
+                pool.submit(
+                    contextvars.copy_context().run,
+                    action,
+                    https_client,
+                    guid=guid,
+                    **kwargs,
+                ): guid
+                for guid in guids
+            }
+            for future in as_completed(futures):
+                guid: str = futures[future]
+                try:
+                    results[guid] = future.result()
+                except Exception as e:
+                    log.warning(f"{action.__name__} failed for client {guid}: {e}")
+                    errors[guid] = e
+        return {"results": results, "errors": errors}
+
+    @classmethod
+    def bulk_activate(
+        cls,
+        guids: Iterable[str],
+        team_id: Optional[str] = None,
+        concurrency: int = 8,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+    ) -> Dict[str, dict]:
+        """
+        Activates many clients concurrently.
+
+        :return: {"results": {guid: response body}, "errors": {guid: exception}}
+        """
+        return cls._bulk_client_action(
+            cls.activate_client, guids, team_id, concurrency, https_client
+        )
+
+    @classmethod
+    def bulk_deactivate(
+        cls,
+        guids: Iterable[str],
+        team_id: Optional[str] = None,
+        concurrency: int = 8,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+    ) -> Dict[str, dict]:
+        """
+        Deactivates many clients concurrently.
+
+        :return: {"results": {guid: response body}, "errors": {guid: exception}}
+        """
+        return cls._bulk_client_action(
+            cls.deactivate_client, guids, team_id, concurrency, https_client
+        )
+
     @classmethod
     def get_update_client_target_cache(cls) -> [dict]:
-        if (not GremlinAPIConfig.client_cache) or (type(GremlinAPIConfig.client_cache) == type(property())):
-            GremlinAPIConfig.client_cache = GremlinAPIClients.list_clients()
-        # Collects all containers
-        total_containers = []
-        active_clients = GremlinAPIConfig.client_cache['active']
-        for ac in active_clients:
-            for container in ac['containers']:
-                total_containers.append(container)
-        inactive_clients = GremlinAPIConfig.client_cache['inactive']
-        for iac in inactive_clients:
-            for container in iac['containers']:
-                total_containers.append(container)
-        idle_clients = GremlinAPIConfig.client_cache['idle']
-        for ic in idle_clients:
-            for container in ic['containers']:
-                total_containers.append(container)
-        return total_containers
+        """
+        Returns every container of every client, from the client inventory
+        cache which reloads list_clients once `client_cache_ttl` has elapsed.
+        """
+        return client_inventory.containers()
+
+    @classmethod
+    def invalidate_client_target_cache(cls) -> None:
+        """Forces the next client cache lookup to reload list_clients"""
+        client_inventory.invalidate()
+
+
+client_inventory: GremlinScopedCache = GremlinScopedCache(
+    lambda: GremlinClientInventory(lambda: GremlinAPIClients.list_clients())
+)
+active_client_inventory: GremlinScopedCache = GremlinScopedCache(
+    lambda: GremlinTargetInventory(
+        lambda: GremlinAPIClients.list_active_clients(),
+        "tags",
+        native_keys=tuple(HOST_NATIVE_TAGS),
+    )
+)
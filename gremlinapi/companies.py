@@ -15,7 +15,7 @@ from gremlinapi.exceptions import (
 
 from typing import Type
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
 
 from typing import Union, Any
@@ -26,39 +26,42 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPICompanies(GremlinAPI):
     @classmethod
     @register_cli_action("get_company", ("identifier",), ("",))
+    @api_endpoint
     def get_company(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         endpoint: str = f"/companies/{identifier}"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_company_clients", ("identifier",), ("",))
+    @api_endpoint
     def list_company_clients(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         endpoint: str = f"/companies/{identifier}/clients"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("invite_company_user", ("identifier", "body"), ("",))
+    @api_endpoint
     def invite_company_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         data: Union[list, dict] = cls._error_if_not_json_body(**kwargs)
@@ -66,22 +69,23 @@ class GremlinAPICompanies(GremlinAPI):
             data = [dict(data)]
         endpoint: str = f"/companies/{identifier}/invites"
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})  # type: ignore
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("delete_company_invite", ("identifier", "email"), ("",))
+    @api_endpoint
     def delete_company_invite(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = f"/companies/{identifier}/invites/{email}"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -94,11 +98,12 @@ class GremlinAPICompanies(GremlinAPI):
             "defaultMfaProvider",
         ),
     )
+    @api_endpoint
     def company_mfa_prefs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         data: dict = {
@@ -111,23 +116,24 @@ class GremlinAPICompanies(GremlinAPI):
         data = {k: v for k, v in data.items() if v is not None}
         endpoint: str = f"/companies/{identifier}/mfaPrefs"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("update_company_prefs", ("identifier",), ("domain",))
+    @api_endpoint
     def update_company_prefs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         data: dict = {"domain": cls._info_if_not_param("domain", **kwargs)}
         data = {k: v for k, v in data.items() if v is not None}
         endpoint: str = f"/companies/{identifier}/prefs"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -136,11 +142,12 @@ class GremlinAPICompanies(GremlinAPI):
         ("identifier",),
         ("enabled", "entityId", "idpUrl", "certificate", "forced"),
     )
+    @api_endpoint
     def update_company_saml_props(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         data: dict = {
@@ -153,21 +160,22 @@ class GremlinAPICompanies(GremlinAPI):
         data = {k: v for k, v in data.items() if v is not None}
         endpoint: str = f"/companies/{identifier}/saml/props"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_company_users", ("identifier",), ("",))
+    @api_endpoint
     def list_company_users(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         endpoint: str = f"/companies/{identifier}/users"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -179,18 +187,19 @@ class GremlinAPICompanies(GremlinAPI):
         ),
         ("body",),
     )
+    @api_endpoint
     def update_company_user_role(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         email: str = cls._error_if_not_email(**kwargs)
         data: Any = cls._warn_if_not_json_body(**kwargs)
         endpoint: str = f"​/companies​/{identifier}​/users​/{email}"
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -202,17 +211,18 @@ class GremlinAPICompanies(GremlinAPI):
         ),
         ("",),
     )
+    @api_endpoint
     def activate_company_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = f"​/companies​/{identifier}​/users​/{email}​/active"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -224,26 +234,28 @@ class GremlinAPICompanies(GremlinAPI):
         ),
         ("",),
     )
+    @api_endpoint
     def deactivate_company_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = f"​/companies​/{identifier}​/users​/{email}​/active"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
+    @api_endpoint
     def auth_toggles(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> int:
+    ) -> APISteps[int]:
         """
         Authentication Toggles
 
@@ -270,5 +282,5 @@ class GremlinAPICompanies(GremlinAPI):
             "claimsRequired": kwargs.get("claimsRequired", False),
         }
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return resp.status_code
@@ -3,30 +3,129 @@
 # Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
 
 
+import contextlib
 import logging
+import threading
 
+from contextvars import ContextVar
 from datetime import datetime, timezone
 
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 log = logging.getLogger("GremlinAPI.client")
 
 
-class GremlinAPIConfig(object):
+class GremlinAPIConfigScope(object):
+    """
+    Settings and per client state of one GremlinClient. While a scope is
+    active in the current thread or task, GremlinAPIConfig reads and writes
+    of its settings go to the scope instead of the class.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings: Dict[str, Any] = settings
+        self._state: Dict[Any, Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def state(self, owner: Any, factory: Callable[[], Any]) -> Any:
+        """This scope's own state for owner, built by factory on first use"""
+        state: Any = self._state.get(owner)
+        if state is None:
+            with self._lock:
+                state = self._state.get(owner)
+                if state is None:
+                    state = self._state[owner] = factory()
+        return state
+
+    def states(self) -> list:
+        return list(self._state.values())
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["GremlinAPIConfigScope"]:
+        token: Any = _active_scope.set(self)
+        try:
+            yield self
+        finally:
+            _active_scope.reset(token)
+
+
+_active_scope: ContextVar[Optional[GremlinAPIConfigScope]] = ContextVar(
+    "gremlinapi_config_scope", default=None
+)
+
+
+def active_scope() -> Optional[GremlinAPIConfigScope]:
+    return _active_scope.get()
+
+
+def scoped_state(owner: Any, default: Any, factory: Callable[[], Any]) -> Any:
+    """
+    default outside a GremlinClient, otherwise the active client's own state
+    for owner, built by factory the first time that client needs it
+    """
+    scope: Optional[GremlinAPIConfigScope] = _active_scope.get()
+    if scope is None:
+        return default
+    return scope.state(owner, factory)
+
+
+class _GremlinAPIConfigType(type):
+    def __getattribute__(cls, name: str) -> Any:
+        scope: Optional[GremlinAPIConfigScope] = _active_scope.get()
+        if scope is not None and name in scope.settings:
+            return scope.settings[name]
+        return type.__getattribute__(cls, name)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        scope: Optional[GremlinAPIConfigScope] = _active_scope.get()
+        if scope is not None and name in scope.settings:
+            scope.settings[name] = value
+        else:
+            type.__setattr__(cls, name, value)
+
+
+class GremlinAPIConfig(object, metaclass=_GremlinAPIConfigType):
     def __init__(self):
         self._api_key = None
         self._base_uri = None
         self._bearer_expires = None
+        self._bearer_refresh_margin = 300
         self._bearer_timestamp = None
         self._bearer_token = None
+        self._cassette = None
+        self._cassette_mode = None
+        self._cassette_time_scale = 1.0
         self._client_cache = {}
+        self._client_cache_ttl = 300
         self._company_name = None
+        self._http_connect_timeout = 10.0
+        self._http2 = False
+        self._http_keep_alive = True
+        self._http_pool_block = False
+        self._http_pool_connections = 10
+        self._http_pool_enabled = False
+        self._http_pool_maxsize = 10
         self._http_proxy = False
+        self._http_read_timeout = 60.0
         self._https_proxy = False
+        self._instrumentation_enabled = True
+        self._json_codec = None
         self._max_bearer_interval = None
         self._override_blast_radius = None
         self._override_node_count = None
         self._password = None
+        self._rate_limit_burst = None
+        self._rate_limit_endpoint_qps = {}
+        self._rate_limit_qps = None
+        self._report_cache = None
+        self._retry_backoff_factor = 0.5
+        self._retry_backoff_max = 30.0
+        self._retry_jitter = True
+        self._retry_max_attempts = 3
+        self._retry_methods = ("HEAD", "GET", "PUT", "DELETE")
+        self._retry_respect_retry_after = True
+        self._retry_status_codes = (429, 502, 503, 504)
+        self._target_inventory_ttl = 300
         self._team_id = None
         self._user = None
         self._user_mfa_token_value = None
@@ -63,6 +162,16 @@ class GremlinAPIConfig(object):
         """
         self._bearer_expires = bearer_expires
 
+    @property
+    def bearer_refresh_margin(self) -> float:
+        """Seconds before the bearer token expires that the token manager renews it"""
+        return self._bearer_refresh_margin
+
+    @bearer_refresh_margin.setter
+    def bearer_refresh_margin(self, bearer_refresh_margin: float) -> float:
+        self._bearer_refresh_margin = bearer_refresh_margin
+        return self.bearer_refresh_margin
+
     @property
     def bearer_timestamp(self) -> str:
         return self._bearer_timestamp
@@ -81,6 +190,36 @@ class GremlinAPIConfig(object):
         self._bearer_token = bearer_token
         return self.bearer_token
 
+    @property
+    def cassette(self) -> str:
+        """Path of the cassette GremlinAPIRecordingClient writes and GremlinAPIReplayClient reads"""
+        return self._cassette
+
+    @cassette.setter
+    def cassette(self, cassette: str) -> str:
+        self._cassette = cassette
+        return self.cassette
+
+    @property
+    def cassette_mode(self) -> str:
+        """record or replay every API call through the cassette, None to use the network"""
+        return self._cassette_mode
+
+    @cassette_mode.setter
+    def cassette_mode(self, cassette_mode: str) -> str:
+        self._cassette_mode = cassette_mode
+        return self.cassette_mode
+
+    @property
+    def cassette_time_scale(self) -> float:
+        """Multiplier of the recorded wall time of replayed calls, 0 replays without delay"""
+        return self._cassette_time_scale
+
+    @cassette_time_scale.setter
+    def cassette_time_scale(self, cassette_time_scale: float) -> float:
+        self._cassette_time_scale = cassette_time_scale
+        return self.cassette_time_scale
+
     @property
     def client_cache(self) -> dict:
         if not self._client_cache:
@@ -92,6 +231,16 @@ class GremlinAPIConfig(object):
         self._client_cache = client_cache
         return self.client_cache
 
+    @property
+    def client_cache_ttl(self) -> float:
+        """Seconds before the client cache is reloaded, None keeps it for the life of the process"""
+        return self._client_cache_ttl
+
+    @client_cache_ttl.setter
+    def client_cache_ttl(self, client_cache_ttl: float) -> float:
+        self._client_cache_ttl = client_cache_ttl
+        return self.client_cache_ttl
+
     @property
     def company_name(self) -> str:
         """Company Name for login"""
@@ -102,6 +251,76 @@ class GremlinAPIConfig(object):
         self._company_name = company_name
         return self.company_name
 
+    @property
+    def http_connect_timeout(self) -> float:
+        """Seconds to wait for a connection to the API, None waits forever"""
+        return self._http_connect_timeout
+
+    @http_connect_timeout.setter
+    def http_connect_timeout(self, http_connect_timeout: float) -> float:
+        self._http_connect_timeout = http_connect_timeout
+        return self.http_connect_timeout
+
+    @property
+    def http2(self) -> bool:
+        """Send requests over HTTP/2 with httpx, multiplexed on one connection"""
+        return self._http2
+
+    @http2.setter
+    def http2(self, http2: bool) -> bool:
+        self._http2 = http2
+        return self.http2
+
+    @property
+    def http_keep_alive(self) -> bool:
+        """Reuse pooled connections between requests"""
+        return self._http_keep_alive
+
+    @http_keep_alive.setter
+    def http_keep_alive(self, http_keep_alive: bool) -> bool:
+        self._http_keep_alive = http_keep_alive
+        return self.http_keep_alive
+
+    @property
+    def http_pool_block(self) -> bool:
+        """Block when the per-host connection limit is reached instead of opening extra connections"""
+        return self._http_pool_block
+
+    @http_pool_block.setter
+    def http_pool_block(self, http_pool_block: bool) -> bool:
+        self._http_pool_block = http_pool_block
+        return self.http_pool_block
+
+    @property
+    def http_pool_connections(self) -> int:
+        """Number of per-host connection pools to cache"""
+        return self._http_pool_connections
+
+    @http_pool_connections.setter
+    def http_pool_connections(self, http_pool_connections: int) -> int:
+        self._http_pool_connections = http_pool_connections
+        return self.http_pool_connections
+
+    @property
+    def http_pool_enabled(self) -> bool:
+        """Route API calls through the shared, pooled requests session"""
+        return self._http_pool_enabled
+
+    @http_pool_enabled.setter
+    def http_pool_enabled(self, http_pool_enabled: bool) -> bool:
+        self._http_pool_enabled = http_pool_enabled
+        return self.http_pool_enabled
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Maximum number of connections kept open per host"""
+        return self._http_pool_maxsize
+
+    @http_pool_maxsize.setter
+    def http_pool_maxsize(self, http_pool_maxsize: int) -> int:
+        self._http_pool_maxsize = http_pool_maxsize
+        return self.http_pool_maxsize
+
     @property
     def http_proxy(self) -> str:
         return self._http_proxy
@@ -111,6 +330,16 @@ class GremlinAPIConfig(object):
         self._http_proxy = http_proxy
         return self.http_proxy
 
+    @property
+    def http_read_timeout(self) -> float:
+        """Seconds to wait for the API to send a response, None waits forever"""
+        return self._http_read_timeout
+
+    @http_read_timeout.setter
+    def http_read_timeout(self, http_read_timeout: float) -> float:
+        self._http_read_timeout = http_read_timeout
+        return self.http_read_timeout
+
     @property
     def https_proxy(self) -> str:
         return self._https_proxy
@@ -120,6 +349,26 @@ class GremlinAPIConfig(object):
         self._https_proxy = https_proxy
         return self.https_proxy
 
+    @property
+    def instrumentation_enabled(self) -> bool:
+        """Record latency metrics and run instrumentation hooks for every API call"""
+        return self._instrumentation_enabled
+
+    @instrumentation_enabled.setter
+    def instrumentation_enabled(self, instrumentation_enabled: bool) -> bool:
+        self._instrumentation_enabled = instrumentation_enabled
+        return self.instrumentation_enabled
+
+    @property
+    def json_codec(self) -> str:
+        """JSON backend for request and response bodies: orjson, ujson, json, or None for the fastest installed"""
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, json_codec: str) -> str:
+        self._json_codec = json_codec
+        return self.json_codec
+
     @property
     def max_bearer_interval(self) -> int:
         return self._max_bearer_interval
@@ -161,6 +410,126 @@ class GremlinAPIConfig(object):
         self._password = password
         return self.password
 
+    @property
+    def rate_limit_burst(self) -> int:
+        """Requests allowed in a burst above the rate limit, defaults to one second of requests"""
+        return self._rate_limit_burst
+
+    @rate_limit_burst.setter
+    def rate_limit_burst(self, rate_limit_burst: int) -> int:
+        self._rate_limit_burst = rate_limit_burst
+        return self.rate_limit_burst
+
+    @property
+    def rate_limit_endpoint_qps(self) -> dict:
+        """Requests per second allowed for each endpoint prefix, e.g. {'/clients': 5}"""
+        return self._rate_limit_endpoint_qps
+
+    @rate_limit_endpoint_qps.setter
+    def rate_limit_endpoint_qps(self, rate_limit_endpoint_qps: dict) -> dict:
+        self._rate_limit_endpoint_qps = rate_limit_endpoint_qps
+        return self.rate_limit_endpoint_qps
+
+    @property
+    def rate_limit_qps(self) -> float:
+        """Requests per second allowed across all endpoints, None disables the limit"""
+        return self._rate_limit_qps
+
+    @rate_limit_qps.setter
+    def rate_limit_qps(self, rate_limit_qps: float) -> float:
+        self._rate_limit_qps = rate_limit_qps
+        return self.rate_limit_qps
+
+    @property
+    def report_cache(self) -> str:
+        """Path of the SQLite file GremlinReportEngine keeps ended report periods in, None disables it"""
+        return self._report_cache
+
+    @report_cache.setter
+    def report_cache(self, report_cache: str) -> str:
+        self._report_cache = report_cache
+        return self.report_cache
+
+    @property
+    def retry_backoff_factor(self) -> float:
+        """Base delay in seconds, doubled after each failed attempt"""
+        return self._retry_backoff_factor
+
+    @retry_backoff_factor.setter
+    def retry_backoff_factor(self, retry_backoff_factor: float) -> float:
+        self._retry_backoff_factor = retry_backoff_factor
+        return self.retry_backoff_factor
+
+    @property
+    def retry_backoff_max(self) -> float:
+        """Upper bound in seconds for a single backoff or Retry-After delay"""
+        return self._retry_backoff_max
+
+    @retry_backoff_max.setter
+    def retry_backoff_max(self, retry_backoff_max: float) -> float:
+        self._retry_backoff_max = retry_backoff_max
+        return self.retry_backoff_max
+
+    @property
+    def retry_jitter(self) -> bool:
+        """Randomize backoff delays so concurrent clients do not retry in lockstep"""
+        return self._retry_jitter
+
+    @retry_jitter.setter
+    def retry_jitter(self, retry_jitter: bool) -> bool:
+        self._retry_jitter = retry_jitter
+        return self.retry_jitter
+
+    @property
+    def retry_max_attempts(self) -> int:
+        """Total attempts per request, including the first, 1 disables retries"""
+        return self._retry_max_attempts
+
+    @retry_max_attempts.setter
+    def retry_max_attempts(self, retry_max_attempts: int) -> int:
+        self._retry_max_attempts = retry_max_attempts
+        return self.retry_max_attempts
+
+    @property
+    def retry_methods(self) -> tuple:
+        """HTTP methods which are safe to retry"""
+        return self._retry_methods
+
+    @retry_methods.setter
+    def retry_methods(self, retry_methods: tuple) -> tuple:
+        self._retry_methods = retry_methods
+        return self.retry_methods
+
+    @property
+    def retry_respect_retry_after(self) -> bool:
+        """Wait for the delay given by a Retry-After response header"""
+        return self._retry_respect_retry_after
+
+    @retry_respect_retry_after.setter
+    def retry_respect_retry_after(self, retry_respect_retry_after: bool) -> bool:
+        self._retry_respect_retry_after = retry_respect_retry_after
+        return self.retry_respect_retry_after
+
+    @property
+    def retry_status_codes(self) -> tuple:
+        """HTTP status codes which are retried"""
+        return self._retry_status_codes
+
+    @retry_status_codes.setter
+    def retry_status_codes(self, retry_status_codes: tuple) -> tuple:
+        self._retry_status_codes = retry_status_codes
+        return self.retry_status_codes
+
+    @property
+    def target_inventory_ttl(self) -> float:
+        """Seconds before the host and container target indexes are rebuilt, None keeps them for the life of the process"""
+        return self._target_inventory_ttl
+
+    @target_inventory_ttl.setter
+    def target_inventory_ttl(self, target_inventory_ttl: float) -> float:
+        self._target_inventory_ttl = target_inventory_ttl
+        return self.target_inventory_ttl
+
     @property
     def team_id(self) -> str:
         return self._team_id
@@ -15,8 +15,9 @@ from gremlinapi.exceptions import (
 
 from typing import Type
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
+from gremlinapi.inventory import GremlinScopedCache, GremlinTargetInventory
 
 
 log = logging.getLogger("GremlinAPI.client")
@@ -25,13 +26,21 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIContainers(GremlinAPI):
     @classmethod
     @register_cli_action("list_containers", ("",), ("teamId",))
+    @api_endpoint
     def list_containers(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/containers", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
+
+
+container_inventory: GremlinScopedCache = GremlinScopedCache(
+    lambda: GremlinTargetInventory(
+        lambda: GremlinAPIContainers.list_containers(), "container_labels"
+    )
+)
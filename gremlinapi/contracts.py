@@ -15,7 +15,7 @@ from gremlinapi.exceptions import (
 
 from typing import Type
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
 
 
@@ -25,15 +25,16 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIContracts(GremlinAPI):
     @classmethod
     @register_cli_action("update_contract", ("identifier", "body"), ("",))
+    @api_endpoint
     def update_contract(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PATCH"
         identifier: str = cls._error_if_not_param("identifier", **kwargs)
         data: dict = cls._error_if_not_json_body(**kwargs)
         endpoint: str = f"/companies/{identifier}/contracts/current"
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
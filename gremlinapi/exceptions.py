@@ -42,6 +42,11 @@ class GremlinCommandTargetError(GremlinAPIException):
         super(GremlinCommandTargetError, self).__init__(message)
 
 
+class GremlinReplayError(GremlinAPIException):
+    def __init__(self, message: str):
+        super(GremlinReplayError, self).__init__(message)
+
+
 class ProxyError(GremlinAPIException):
     def __init__(self, uri: str, method: str, **kwargs: dict):
         message: str = f"Error for {method} to {uri}, please verify proxy configuration"
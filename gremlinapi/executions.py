@@ -13,9 +13,9 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from typing import Type
+from typing import Type, Iterator
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
 
 
@@ -28,17 +28,34 @@ class GremlinAPIExecutions(GremlinAPI):
         task_id: str = cls._info_if_not_param("taskId", **kwargs)
         if task_id:
             endpoint += f"/?taskId={task_id}"
+        endpoint = cls._optional_page_endpoint(endpoint, **kwargs)
         return cls._optional_team_endpoint(endpoint, **kwargs)
 
     @classmethod
     @register_cli_action("list_executions", ("",), ("taskId", "teamId"))
+    @api_endpoint
     def list_executions(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_taskid_endpoint("/executions", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
+
+    @classmethod
+    def iter_executions(
+        cls,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        prefetch: bool = False,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """
+        Yields executions one at a time, following page tokens as needed.
+
+        :param prefetch: request the next page in the background
+        :param kwargs: { taskId, pageSize, teamId }
+        """
+        yield from cls._iter_pages(cls.list_executions, https_client, prefetch, **kwargs)
@@ -2,10 +2,16 @@
 #
 # Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
 
+import contextvars
+import functools
+import inspect
 import json
 import logging
 import time
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
+
 from gremlinapi.config import GremlinAPIConfig as config
 
 from gremlinapi.exceptions import (
@@ -17,13 +23,91 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from typing import Optional, Dict, Any, Union, Type
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Union,
+    Type,
+    Callable,
+    Generator,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
 from gremlinapi.exceptions import GremlinParameterError
+from gremlinapi.instrumentation import endpoint_template, request_endpoint
 
 log = logging.getLogger("GremlinAPI.client")
 
+# Response fields which may hold the items and the next page token of a paginated list
+PAGE_ITEM_KEYS: Tuple[str, ...] = ("items", "results")
+PAGE_TOKEN_KEYS: Tuple[str, ...] = ("next_page_token", "nextPageToken", "pageToken")
+
+T = TypeVar("T")
+
+# The steps of an endpoint method: a generator which yields each request as
+# (method, endpoint, api_call kwargs), is sent back its (response, body) and
+# returns the method's result
+APISteps = Generator[Tuple[str, str, dict], Tuple[Any, Any], T]
+
+
+def send_api_steps(
+    steps: APISteps[T],
+    api_call: Callable[..., Tuple[Any, Any]],
+    params: Optional[Dict[str, Any]] = None,
+) -> T:
+    """
+    Runs steps, sending each request it yields with api_call. The params the
+    endpoint method was called with name the identifiers in each request's
+    route for instrumentation, see endpoint_template.
+    """
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            if error is None:
+                (method, endpoint, payload) = steps.send(result)
+            else:
+                (method, endpoint, payload) = steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        (result, error) = (None, None)
+        token: Any = request_endpoint.set(endpoint_template(endpoint, params))
+        try:
+            result = api_call(method, endpoint, **payload)
+        except Exception as e:
+            error = e
+        finally:
+            request_endpoint.reset(token)
+
+
+def api_endpoint(steps: Callable[..., APISteps[T]]) -> Callable[..., T]:
+    """
+    Endpoint method built from steps, which build each request and
+    post-process its response without sending it. The method sends the
+    requests with its https_client; AsyncGremlinAPI awaits the same steps,
+    kept as `api_steps`, on the async client.
+    """
+    parameters: List[inspect.Parameter] = list(
+        inspect.signature(steps).parameters.values()
+    )
+    position: int = [p.name for p in parameters].index("https_client")
+    default: Any = parameters[position].default
+
+    @functools.wraps(steps)
+    def endpoint(*args: Any, **kwargs: Any) -> T:
+        https_client: Any = kwargs.get("https_client", default)
+        if len(args) > position:
+            https_client = args[position]
+        return send_api_steps(steps(*args, **kwargs), https_client.api_call, kwargs)
+
+    endpoint.api_steps = steps  # type: ignore
+    return endpoint
+
 
 class GremlinAPI(object):
     def __init__(self):
@@ -104,6 +188,77 @@ class GremlinAPI(object):
             endpoint = cls._required_team_endpoint(endpoint, **kwargs)
         return endpoint
 
+    @classmethod
+    def _optional_page_endpoint(cls, endpoint: str, **kwargs: dict) -> str:
+        endpoint = cls._add_query_param(
+            endpoint, "pageSize", cls._info_if_not_param("pageSize", **kwargs)
+        )
+        # Tokens are opaque and may hold reserved characters such as + / = &
+        page_token: str = cls._info_if_not_param("pageToken", **kwargs)
+        if page_token:
+            endpoint = cls._add_query_param(
+                endpoint, "pageToken", quote(str(page_token), safe="")
+            )
+        return endpoint
+
+    @classmethod
+    def _page_items(cls, page: Any) -> Tuple[List[Any], Optional[str]]:
+        """Splits one page of a list response into its items and the next page token"""
+        if isinstance(page, list):
+            return page, None
+        if not isinstance(page, dict):
+            return ([page] if page else []), None
+        token: Optional[str] = next(
+            (page[key] for key in PAGE_TOKEN_KEYS if page.get(key)), None
+        )
+        for key in PAGE_ITEM_KEYS:
+            if isinstance(page.get(key), list):
+                return page[key], token
+        return [page], token
+
+    @classmethod
+    def _iter_pages(
+        cls,
+        list_method: Callable,
+        https_client: Type[GremlinAPIHttpClient],
+        prefetch: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every item of a paginated list endpoint, requesting the
+        following page with its pageToken once the current one is consumed.
+
+        With prefetch, the next page is requested on a background thread while
+        the current page is being processed. At most two pages are held.
+        """
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1) if prefetch else None
+        )
+        try:
+            page: Any = list_method(https_client, **kwargs)
+            while True:
+                (items, token) = cls._page_items(page)
+                next_page: Optional[Future] = None
+                if token:
+                    kwargs["pageToken"] = token  # type: ignore
+                    if executor:
+                        next_page = executor.submit(
+                            contextvars.copy_context().run,
+                            list_method,
+                            https_client,
+                            **dict(kwargs),
+                        )
+                yield from items
+                if not token:
+                    return
+                if next_page:
+                    page = next_page.result()
+                else:
+                    page = list_method(https_client, **kwargs)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
     @classmethod
     def _optional_team_endpoint(cls, endpoint: str, **kwargs: dict) -> str:
         if "teamId" in kwargs:
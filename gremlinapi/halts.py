@@ -13,7 +13,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -27,14 +27,15 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIHalts(GremlinAPI):
     @classmethod
     @register_cli_action("halt_all_attacks", ("",), ("teamId", "body"))
+    @api_endpoint
     def halt_all_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         **kwargs: dict
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = cls._warn_if_not_json_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint("/halts", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
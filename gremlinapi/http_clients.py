@@ -2,10 +2,22 @@
 #
 # Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
 
-import json
+import asyncio
+import contextvars
+import functools
 import logging
+import random
+import threading
+import time
+import weakref
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
 
 from gremlinapi.exceptions import (
+    GremlinAPIException,
+    GremlinReplayError,
     ProxyError,
     ClientError,
     HTTPTimeout,
@@ -13,14 +25,34 @@ from gremlinapi.exceptions import (
     HTTPBadHeader,
 )
 
-from gremlinapi.config import GremlinAPIConfig
+from gremlinapi import json_codec
+from gremlinapi.cassette import GremlinAPICassette, request_digest
+from gremlinapi.config import GremlinAPIConfig, scoped_state
+from gremlinapi.instrumentation import GremlinAPIInstrumentation
+from gremlinapi.rate_limiter import GremlinAPIRateLimiter
+from gremlinapi.token_manager import GremlinAPITokenManager
 from gremlinapi.util import get_version
 
-from typing import Tuple, Union, Optional, Any, Dict, Callable, Type
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import requests  # type: ignore
+import requests.adapters  # type: ignore
 import urllib3  # type: ignore
 
+_unloaded: object = object()
+_httpx: Any = _unloaded
+
 # try:
 #     import requests
 #     import requests.adapters
@@ -30,16 +62,78 @@ import urllib3  # type: ignore
 
 log: logging.Logger = logging.getLogger("GremlinAPI.client")
 
+_config_defaults: GremlinAPIConfig = GremlinAPIConfig()
+
+
+def _load_httpx() -> Any:
+    """Imports httpx on first use of the async client, None when it is not installed"""
+    global _httpx
+    if _httpx is _unloaded:
+        try:
+            import httpx  # type: ignore
+        except ImportError:
+            httpx = None
+        _httpx = httpx
+    return _httpx
+
+
+def __getattr__(name: str) -> Any:
+    if name == "httpx":
+        return _load_httpx()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class GremlinAPIHttpClient(object):
     @classmethod
     def api_call(
         cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
     ) -> Tuple[Union[requests.Response, urllib3.HTTPResponse], dict]:
+        """
+        Entry point of every client, which answers from the cassette in
+        record and replay mode and otherwise sends the call with _api_call
+        """
+        cassette_call: Optional[Callable] = cls._cassette_call()
+        if cassette_call is not None:
+            return cassette_call(method, endpoint, *args, **kwargs)
+        return cls._transport()._api_call(method, endpoint, *args, **kwargs)
+
+    @classmethod
+    def _api_call(
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[Union[requests.Response, urllib3.HTTPResponse], dict]:
+        """Sends the call over the network, implemented by each transport"""
+        return GremlinAPIHttpClient._transport()._api_call(
+            method, endpoint, *args, **kwargs
+        )
+
+    @classmethod
+    def _cassette_call(cls) -> Optional[Callable]:
+        """
+        The cassette client call answering for `GremlinAPIConfig.cassette_mode`,
+        None when not recording or replaying or when cls is a cassette client
+        """
+        if issubclass(cls, (GremlinAPIRecordingClient, GremlinAPIReplayClient)):
+            return None
+        cassette_mode: Any = GremlinAPIConfig.cassette_mode
+        if cassette_mode == "replay":
+            return GremlinAPIReplayClient._api_call
+        if cassette_mode == "record":
+            return functools.partial(GremlinAPIRecordingClient.record, cls._transport())
+        return None
+
+    @classmethod
+    def _transport(cls) -> Type["GremlinAPIHttpClient"]:
+        """The client sending requests over the network for the current configuration"""
+        if cls is not GremlinAPIHttpClient:
+            return cls
+        if GremlinAPIConfig.http2 is True:
+            return GremlinAPIHttp2Client
         if requests:
-            return GremlinAPIRequestsClient.api_call(method, endpoint, *args, **kwargs)
+            if GremlinAPIConfig.http_pool_enabled is True:
+                return GremlinAPIPooledRequestsClient
+            return GremlinAPIRequestsClient
         else:
-            return GremlinAPIurllibClient.api_call(method, endpoint, *args, **kwargs)
+            return GremlinAPIurllibClient
 
     @classmethod
     def base_uri(cls, uri: str) -> str:
@@ -47,16 +141,71 @@ class GremlinAPIHttpClient(object):
             uri = f"{GremlinAPIConfig.base_uri}{uri}"
         return uri
 
+    # (api_key, bearer_token) the cached headers were built from, the headers,
+    # and the same headers with a JSON Content-Type, swapped in as one tuple
+    _header_state: Tuple[Tuple[Any, Any], Mapping[str, str], Mapping[str, str]] = (
+        (None, None),
+        MappingProxyType({}),
+        MappingProxyType({}),
+    )
+    _user_agent: str = f"gremlin-sdk-python/{get_version()}"
+
+    @classmethod
+    def header(cls, *args: tuple, **kwargs: dict) -> Mapping[str, str]:
+        """
+        Read only request headers for the configured credentials. The mapping
+        is built once per api_key / bearer_token value and shared by every
+        call, explicit `api_key` or `bearer_token` arguments bypass the cache.
+        """
+        api_key: Any = kwargs.get("api_key", "")
+        bearer_token: Any = kwargs.get("bearer_token", "")
+        if api_key or bearer_token:
+            if not (api_key and bearer_token):
+                if GremlinAPIConfig.bearer_token:
+                    bearer_token = str(GremlinAPIConfig.bearer_token)
+                if GremlinAPIConfig.api_key:
+                    api_key = str(GremlinAPIConfig.api_key)
+            return MappingProxyType(cls._build_header(api_key, bearer_token))
+        config_api_key: Any = GremlinAPIConfig.api_key
+        config_bearer_token: Any = GremlinAPIConfig.bearer_token
+        state: Tuple[Tuple[Any, Any], Mapping[str, str], Mapping[str, str]] = (
+            GremlinAPIHttpClient._header_state
+        )
+        if (
+            not state[1]
+            or config_api_key is not state[0][0]
+            or config_bearer_token is not state[0][1]
+        ):
+            state = cls._cache_header(config_api_key, config_bearer_token)
+        return state[1]
+
+    @classmethod
+    def _cache_header(
+        cls, api_key: Any, bearer_token: Any
+    ) -> Tuple[Tuple[Any, Any], Mapping[str, str], Mapping[str, str]]:
+        header: dict = cls._build_header(
+            str(api_key) if api_key else "", str(bearer_token) if bearer_token else ""
+        )
+        state: Tuple[Tuple[Any, Any], Mapping[str, str], Mapping[str, str]] = (
+            (api_key, bearer_token),
+            MappingProxyType(header),
+            MappingProxyType({**header, "Content-Type": "application/json"}),
+        )
+        GremlinAPIHttpClient._header_state = state
+        return state
+
     @classmethod
-    def header(cls, *args: tuple, **kwargs: dict) -> dict:
-        api_key: Union[dict, str] = kwargs.get("api_key", "")
-        bearer_token: Union[dict, str] = kwargs.get("bearer_token", "")
+    def invalidate_header(cls) -> None:
+        """Drops the cached headers, they are rebuilt on the next call"""
+        GremlinAPIHttpClient._header_state = (
+            (None, None),
+            MappingProxyType({}),
+            MappingProxyType({}),
+        )
+
+    @classmethod
+    def _build_header(cls, api_key: str, bearer_token: str) -> dict:
         header: dict = dict()
-        if not (api_key and bearer_token):
-            if GremlinAPIConfig.bearer_token:
-                bearer_token = str(GremlinAPIConfig.bearer_token)
-            if GremlinAPIConfig.api_key:
-                api_key = str(GremlinAPIConfig.api_key)
         if api_key and not bearer_token:
             if "Key" in api_key:
                 header["Authorization"] = api_key
@@ -71,9 +220,322 @@ class GremlinAPIHttpClient(object):
             error_msg: str = f"Missing API Key or Bearer Token, none supplied: {api_key}, {bearer_token}"
             log.error(error_msg)
             # raise HTTPBadHeader(error_msg)
-        header["X-Gremlin-Agent"] = f"gremlin-sdk-python/{get_version()}"
+        header["X-Gremlin-Agent"] = cls._user_agent
         return header
 
+    @classmethod
+    def _reauthorized_header(
+        cls, headers: Optional[Mapping[str, str]]
+    ) -> Mapping[str, str]:
+        """headers with the Authorization of the currently configured credentials"""
+        fresh: Mapping[str, str] = cls.header()
+        if not headers:
+            return fresh
+        return {**headers, "Authorization": fresh.get("Authorization", "")}
+
+    @classmethod
+    def _json_header(cls, headers: Mapping[str, str]) -> Mapping[str, str]:
+        """headers with a JSON Content-Type, prebuilt for the cached headers"""
+        if "Content-Type" in headers:
+            return headers
+        state: Tuple[Tuple[Any, Any], Mapping[str, str], Mapping[str, str]] = (
+            GremlinAPIHttpClient._header_state
+        )
+        if headers is state[1]:
+            return state[2]
+        return {**headers, "Content-Type": "application/json"}
+
+    @classmethod
+    def _httpx(cls, http2: bool = False) -> Any:
+        """The httpx module, raising ImportError when it or, for HTTP/2, h2 is missing"""
+        httpx: Any = _load_httpx()
+        if httpx is None:
+            error_msg: str = f"{cls.__name__} requires the httpx library, install gremlinapi[async]"
+            log.error(error_msg)
+            raise ImportError(error_msg)
+        if http2:
+            try:
+                import h2  # type: ignore
+            except ImportError:
+                error_msg = "HTTP/2 requires the h2 library, install gremlinapi[http2]"
+                log.error(error_msg)
+                raise ImportError(error_msg)
+        return httpx
+
+    @classmethod
+    def _httpx_options(cls, transport: Callable, http2: bool) -> dict:
+        """httpx.Client / AsyncClient arguments shared by the httpx transports"""
+        httpx: Any = _load_httpx()
+        maxsize: int = int(cls._config_setting("http_pool_maxsize"))
+        keep_alive: bool = bool(cls._config_setting("http_keep_alive"))
+        limits: "httpx.Limits" = httpx.Limits(
+            max_connections=maxsize,
+            max_keepalive_connections=maxsize if keep_alive else 0,
+        )
+        mounts: dict = {
+            f"{scheme}://": transport(proxy=proxy, limits=limits, http2=http2)
+            for scheme, proxy in cls.proxies().items()
+        }
+        return {
+            "limits": limits,
+            "mounts": mounts,
+            "http2": http2,
+            "follow_redirects": False,
+        }
+
+    @classmethod
+    def _config_setting(cls, name: str, default: Any = None) -> Any:
+        value: Any = getattr(GremlinAPIConfig, name, default)
+        if isinstance(value, property):
+            # Unset config attributes are still property objects on the class,
+            # fall back to the default a GremlinAPIConfig instance starts with
+            value = getattr(_config_defaults, f"_{name}", default)
+        return value
+
+    @classmethod
+    def timeout(cls) -> Tuple[Optional[float], Optional[float]]:
+        """(connect, read) timeout in seconds for a single request attempt"""
+        return (
+            cls._config_setting("http_connect_timeout"),
+            cls._config_setting("http_read_timeout"),
+        )
+
+    @classmethod
+    def _should_retry(
+        cls, method: str, attempt: int, status_code: Optional[int] = None
+    ) -> bool:
+        if attempt >= int(cls._config_setting("retry_max_attempts")):
+            return False
+        if method.upper() not in cls._config_setting("retry_methods"):
+            return False
+        if status_code is None:
+            return True
+        return status_code in cls._config_setting("retry_status_codes")
+
+    @classmethod
+    def _retry_delay(cls, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt: the server provided
+        Retry-After when present, otherwise exponential backoff, either capped
+        at retry_backoff_max.
+        """
+        backoff_max: float = float(cls._config_setting("retry_backoff_max"))
+        if retry_after and cls._config_setting("retry_respect_retry_after"):
+            try:
+                return min(max(0.0, float(retry_after)), backoff_max)
+            except ValueError:
+                try:
+                    retry_at: datetime = parsedate_to_datetime(retry_after)
+                    seconds: float = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    return min(max(0.0, seconds), backoff_max)
+                except (TypeError, ValueError):
+                    log.info(f"Ignoring unparsable Retry-After header: {retry_after}")
+        delay: float = min(
+            float(cls._config_setting("retry_backoff_factor")) * 2 ** (attempt - 1),
+            backoff_max,
+        )
+        if cls._config_setting("retry_jitter"):
+            delay = random.uniform(0, delay)
+        return delay
+
+    @classmethod
+    def _timeout_error(
+        cls, uri: str, method: str, timeout: Tuple[Any, Any], connect: bool
+    ) -> HTTPTimeout:
+        if connect:
+            description: str = f"{timeout[0]}s waiting to connect"
+        else:
+            description = f"{timeout[1]}s waiting for a response"
+        log.warning(f"{method} to {uri} timed out after {description}")
+        return HTTPTimeout(uri, method, description)
+
+    @classmethod
+    def _attempts(
+        cls,
+        method: str,
+        uri: str,
+        data: Any,
+        headers: Optional[Mapping[str, str]],
+        timeout: Tuple[Any, Any],
+        timeout_errors: Tuple[Type[BaseException], ...],
+        connect_timeout: Type[BaseException],
+    ) -> Generator[Tuple[str, Any], Any, Any]:
+        """
+        The attempt loop of every transport: rate limiting, retries with
+        backoff, one replay with a new token after a 401, the HTTPError of a
+        failed response and its instrumentation. It yields the steps its
+        driver performs, ("acquire", uri), ("send", headers), ("sleep",
+        seconds) and ("reauthorize", stale bearer token), is sent their
+        result or thrown their exception, and returns the final response.
+        """
+        with GremlinAPIInstrumentation.measure(
+            cls.__name__, method, uri, data
+        ) as event:
+            bearer_token: Any = GremlinAPIConfig.bearer_token
+            replayed: bool = False
+            attempt: int = 0
+            while True:
+                attempt += 1
+                event.attempts += 1
+                yield "acquire", uri
+                try:
+                    resp: Any = yield "send", headers
+                except timeout_errors as e:
+                    connect: bool = isinstance(e, connect_timeout)
+                    if cls._should_retry(method, attempt):
+                        delay: float = cls._retry_delay(attempt)
+                        log.warning(
+                            f"{method} to {uri} timed out, retrying in {delay:.2f}s (attempt {attempt})"
+                        )
+                        yield "sleep", delay
+                        continue
+                    raise cls._timeout_error(uri, method, timeout, connect) from e
+                if (
+                    resp.status_code == 401
+                    and not replayed
+                    and (yield "reauthorize", bearer_token)
+                ):
+                    log.warning(
+                        f"{method} to {uri} was unauthorized, replaying with a new token"
+                    )
+                    (replayed, attempt) = (True, attempt - 1)
+                    bearer_token = GremlinAPIConfig.bearer_token
+                    headers = cls._reauthorized_header(headers)
+                    continue
+                if resp.status_code >= 400 and cls._should_retry(
+                    method, attempt, resp.status_code
+                ):
+                    delay = cls._retry_delay(attempt, resp.headers.get("Retry-After"))
+                    log.warning(
+                        f"{method} to {uri} returned {resp.status_code}, retrying in {delay:.2f}s (attempt {attempt})"
+                    )
+                    yield "sleep", delay
+                    continue
+                break
+
+            event.response(resp)
+            if resp.status_code >= 400:
+                # requests calls the reason phrase reason, httpx reason_phrase
+                reason: Any = getattr(resp, "reason_phrase", None) or getattr(
+                    resp, "reason", None
+                )
+                error_msg: str = f"error {resp.status_code} : {reason} - {resp.text}"
+                log.warning(error_msg)
+                if log.getEffectiveLevel() == logging.DEBUG:
+                    log.debug(f"{uri}\n{data}")
+                raise HTTPError(error_msg)
+            return resp
+
+    @classmethod
+    def _run_attempts(
+        cls,
+        attempts: Generator[Tuple[str, Any], Any, Any],
+        send: Callable[[Optional[Mapping[str, str]]], Any],
+    ) -> Any:
+        """Drives _attempts, sending each attempt with send(headers)"""
+        result: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                if error is None:
+                    (step, argument) = attempts.send(result)
+                else:
+                    (step, argument) = attempts.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            (result, error) = (None, None)
+            try:
+                if step == "send":
+                    result = send(argument)
+                elif step == "sleep":
+                    time.sleep(argument)
+                elif step == "acquire":
+                    GremlinAPIRateLimiter.acquire(argument)
+                else:
+                    result = GremlinAPITokenManager.replay_unauthorized(argument)
+            except Exception as e:
+                error = e
+
+    @classmethod
+    async def _run_attempts_async(
+        cls,
+        attempts: Generator[Tuple[str, Any], Any, Any],
+        send: Callable[[Optional[Mapping[str, str]]], Awaitable[Any]],
+    ) -> Any:
+        """Drives _attempts on the running event loop, awaiting send(headers)"""
+        result: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                if error is None:
+                    (step, argument) = attempts.send(result)
+                else:
+                    (step, argument) = attempts.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            (result, error) = (None, None)
+            try:
+                if step == "send":
+                    result = await send(argument)
+                elif step == "sleep":
+                    await asyncio.sleep(argument)
+                elif step == "acquire":
+                    await GremlinAPIRateLimiter.acquire_async(argument)
+                else:
+                    # A refresh logs in synchronously, keep it off the loop
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        contextvars.copy_context().run,
+                        GremlinAPITokenManager.replay_unauthorized,
+                        argument,
+                    )
+            except Exception as e:
+                error = e
+
+    @classmethod
+    def _request_data(cls, kwargs: dict) -> Union[dict, str, bytes]:
+        """
+        Pops the request payload out of the api_call kwargs, JSON encoding
+        `body` and setting its Content-Type. Form `data` is returned as is.
+        """
+        data: Union[dict, str, bytes] = {}
+        if "data" in kwargs:
+            data = kwargs.pop("data")
+        elif "body" in kwargs:
+            kwargs["headers"] = cls._json_header(kwargs.get("headers") or {})
+            data = kwargs.pop("body")
+            if not isinstance(data, (str, bytes)):
+                data = json_codec.dumpb(data)
+            if log.getEffectiveLevel() == logging.DEBUG:
+                log.debug(f"body: {data!r}")
+        return data
+
+    @classmethod
+    def _response_body(cls, resp: Any, raw_content: Any = None) -> Any:
+        body: Any = None
+        if raw_content:
+            body = resp.content
+        else:
+            try:
+                body = cls._json_body(resp)
+            except ValueError:
+                # No JSON in response
+                try:
+                    body = str(resp.content, resp.encoding)
+                except TypeError:
+                    # Response must be empty, return something nice
+                    body = "Success"
+        return body
+
+    @classmethod
+    def _json_body(cls, resp: Any) -> Any:
+        # Decodes the raw bytes with the configured codec, leaving responses
+        # without buffered content to their own json()
+        content: Any = resp.content
+        if content and isinstance(content, (bytes, bytearray)):
+            return json_codec.loads(content)
+        return resp.json()
+
     @classmethod
     def proxies(cls) -> dict:
         if requests:
@@ -97,10 +559,8 @@ class GremlinAPIRequestsClient(GremlinAPIHttpClient):
         return proxies
 
     @classmethod
-    def api_call(
-        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
-    ) -> Tuple[requests.Response, dict]:
-        request_methods: Dict[str, Callable] = {
+    def request_methods(cls) -> Dict[str, Callable]:
+        return {
             "HEAD": requests.head,
             "GET": requests.get,
             "POST": requests.post,
@@ -108,55 +568,423 @@ class GremlinAPIRequestsClient(GremlinAPIHttpClient):
             "DELETE": requests.delete,
             "PATCH": requests.patch,
         }
+
+    @classmethod
+    def _api_call(
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[requests.Response, dict]:
+        request_methods: Dict[str, Callable] = cls.request_methods()
         uri: str = cls.base_uri(endpoint)
         client: Union[Callable, Any] = request_methods.get(method.upper())
         raw_content: dict = kwargs.pop("raw_content", {})
-        data: Union[dict, str] = {}
-        if "data" in kwargs:
-            data = kwargs.pop("data")
-        elif "body" in kwargs:
-            if "Content-Type" not in kwargs["headers"]:
-                kwargs["headers"]["Content-Type"] = "application/json"
-            data = kwargs.pop("body")
-            if not isinstance(data, str):
-                data = json.dumps(data)
-            if log.getEffectiveLevel() == logging.DEBUG:
-                log.debug(f"body: {data}")
+        data: Union[dict, str, bytes] = cls._request_data(kwargs)
 
         kwargs["proxies"] = cls.proxies()
         if log.getEffectiveLevel() == logging.DEBUG:
             log.debug(f"httpd client kwargs: {kwargs}")
 
-        if data:
-            resp: requests.Response = client(
-                uri, data=data, allow_redirects=False, **kwargs
-            )
-        else:
-            resp = client(uri, allow_redirects=False, **kwargs)
+        timeout: Tuple[Any, Any] = cls.timeout()
 
-        if resp.status_code >= 400:
-            if resp.reason:
-                error_msg: str = f"error {resp.status_code} : {resp.reason} - {resp.text}"
-            log.warning(error_msg)
-            if log.getEffectiveLevel() == logging.DEBUG:
-                log.debug(f"{uri}\n{data}\n{kwargs}")
-            raise HTTPError(error_msg)
-        body: Any = None
-        if raw_content:
-            body = resp.content
-        else:
-            try:
-                body = resp.json()
-            except ValueError:
-                # No JSON in response
-                try:
-                    body = str(resp.content, resp.encoding)
-                except TypeError:
-                    # Response must be empty, return something nice
-                    body = "Success"
+        def _send(headers: Optional[Mapping[str, str]]) -> requests.Response:
+            if headers is not kwargs.get("headers"):
+                kwargs["headers"] = headers
+            if data:
+                return client(
+                    uri, data=data, allow_redirects=False, timeout=timeout, **kwargs
+                )
+            return client(uri, allow_redirects=False, timeout=timeout, **kwargs)
+
+        resp: requests.Response = cls._run_attempts(
+            cls._attempts(
+                method,
+                uri,
+                data,
+                kwargs.get("headers"),
+                timeout,
+                (requests.exceptions.Timeout,),
+                requests.exceptions.ConnectTimeout,
+            ),
+            _send,
+        )
+        return resp, cls._response_body(resp, raw_content)
+
+
+class _GremlinAPIPoolState(object):
+    """Pooled session or client of one GremlinClient, mirrors the class level attributes"""
+
+    def __init__(self):
+        self._session: Optional[requests.Session] = None
+        self._session_lock: threading.Lock = threading.Lock()
+
+
+class GremlinAPIPooledRequestsClient(GremlinAPIRequestsClient):
+    """
+    Dispatches API calls through a single, process wide requests.Session so
+    TCP and TLS connections to the API are kept alive and reused between calls.
+
+    The session is created lazily on first use, sized from GremlinAPIConfig,
+    and shared by every thread. Use close() to release the pooled connections
+    and reset() to rebuild the pool after changing the pool configuration.
+    """
+
+    _session: Optional[requests.Session] = None
+    _session_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        session: requests.Session = requests.Session()
+        adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=int(cls._config_setting("http_pool_connections")),
+            pool_maxsize=int(cls._config_setting("http_pool_maxsize")),
+            pool_block=bool(cls._config_setting("http_pool_block")),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not cls._config_setting("http_keep_alive"):
+            session.headers["Connection"] = "close"
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"Created pooled http session: {session}")
+        return session
+
+    @classmethod
+    def _pool(cls) -> Any:
+        """The class itself, or the active GremlinClient's own pool state"""
+        return scoped_state(
+            GremlinAPIPooledRequestsClient,
+            GremlinAPIPooledRequestsClient,
+            _GremlinAPIPoolState,
+        )
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        pool: Any = cls._pool()
+        if pool._session is None:
+            with pool._session_lock:
+                if pool._session is None:
+                    pool._session = cls._build_session()
+        return pool._session
+
+    @classmethod
+    def close(cls) -> None:
+        pool: Any = cls._pool()
+        with pool._session_lock:
+            session: Optional[requests.Session] = pool._session
+            pool._session = None
+        if session is not None:
+            session.close()
+
+    @classmethod
+    def reset(cls) -> requests.Session:
+        cls.close()
+        return cls.session()
+
+    @classmethod
+    def request_methods(cls) -> Dict[str, Callable]:
+        session: requests.Session = cls.session()
+        return {
+            "HEAD": session.head,
+            "GET": session.get,
+            "POST": session.post,
+            "PUT": session.put,
+            "DELETE": session.delete,
+            "PATCH": session.patch,
+        }
+
+
+class GremlinAPIHttp2Client(GremlinAPIHttpClient):
+    """
+    Synchronous transport built on httpx.Client with HTTP/2 enabled, requires
+    the optional http2 dependencies (`pip install gremlinapi[http2]`).
+
+    One client is shared by every thread, so concurrent requests to the API,
+    through the configured proxy as well, are multiplexed as streams over a
+    single connection rather than each taking a pooled connection. Selected
+    with `GremlinAPIConfig.http2` or `get_gremlin_httpclient(http2=True)`.
+    """
+
+    _session: Any = None
+    _session_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def _pool(cls) -> Any:
+        """The class itself, or the active GremlinClient's own client state"""
+        return scoped_state(
+            GremlinAPIHttp2Client, GremlinAPIHttp2Client, _GremlinAPIPoolState
+        )
+
+    @classmethod
+    def _build_client(cls) -> "httpx.Client":
+        httpx: Any = cls._httpx(http2=True)
+        return httpx.Client(**cls._httpx_options(httpx.HTTPTransport, True))
+
+    @classmethod
+    def client(cls) -> "httpx.Client":
+        pool: Any = cls._pool()
+        if pool._session is None or pool._session.is_closed:
+            with pool._session_lock:
+                if pool._session is None or pool._session.is_closed:
+                    pool._session = cls._build_client()
+        return pool._session
+
+    @classmethod
+    def close(cls) -> None:
+        pool: Any = cls._pool()
+        with pool._session_lock:
+            client: Any = pool._session
+            pool._session = None
+        if client is not None:
+            client.close()
 
+    @classmethod
+    def _api_call(  # type: ignore
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[Any, dict]:
+        uri: str = cls.base_uri(endpoint)
+        raw_content: dict = kwargs.pop("raw_content", {})
+        data: Union[dict, str, bytes] = cls._request_data(kwargs)
+        request_kwargs: dict = {"headers": kwargs.get("headers", None)}
+        if isinstance(data, (str, bytes)):
+            request_kwargs["content"] = data
+        elif data:
+            request_kwargs["data"] = data
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"http2 client kwargs: {kwargs}")
+
+        httpx: Any = cls._httpx()
+        timeout: Tuple[Any, Any] = cls.timeout()
+        request_kwargs["timeout"] = httpx.Timeout(
+            None, connect=timeout[0], read=timeout[1]
+        )
+
+        def _send(headers: Optional[Mapping[str, str]]) -> Any:
+            request_kwargs["headers"] = headers
+            return cls.client().request(method.upper(), uri, **request_kwargs)
+
+        resp: Any = cls._run_attempts(
+            cls._attempts(
+                method,
+                uri,
+                data,
+                request_kwargs["headers"],
+                timeout,
+                (httpx.TimeoutException,),
+                httpx.ConnectTimeout,
+            ),
+            _send,
+        )
+        return resp, cls._response_body(resp, raw_content)
+
+
+class GremlinAPIRecordingClient(GremlinAPIHttpClient):
+    """
+    Sends every call over the configured transport and appends the request
+    and its response, or the error it raised, to the cassette at
+    `GremlinAPIConfig.cassette`. Selected for every call with
+    `GremlinAPIConfig.cassette_mode = "record"`, or passed as https_client.
+    """
+
+    @classmethod
+    def cassette(cls) -> GremlinAPICassette:
+        path: Any = cls._config_setting("cassette")
+        if not path:
+            error_msg: str = "Recording requires GremlinAPIConfig.cassette, the cassette path"
+            log.error(error_msg)
+            raise GremlinReplayError(error_msg)
+        return GremlinAPICassette.open(str(path), "record")
+
+    @classmethod
+    def _api_call(
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[Any, dict]:
+        return cls.record(
+            GremlinAPIHttpClient._transport(), method, endpoint, *args, **kwargs
+        )
+
+    @classmethod
+    def record(
+        cls,
+        transport: Type[GremlinAPIHttpClient],
+        method: str,
+        endpoint: str,
+        *args: tuple,
+        **kwargs: dict,
+    ) -> Tuple[Any, dict]:
+        """Sends the call with transport and records it to the cassette"""
+        cassette: GremlinAPICassette = cls.cassette()
+        digest: Optional[str] = request_digest(kwargs)
+        started: float = time.perf_counter()
+        try:
+            (resp, body) = transport._api_call(method, endpoint, *args, **kwargs)
+        except GremlinAPIException as e:
+            cassette.record_error(
+                method, endpoint, digest, e, time.perf_counter() - started
+            )
+            raise
+        cassette.record_response(
+            method, endpoint, digest, resp, time.perf_counter() - started
+        )
         return resp, body
 
+    @classmethod
+    def close(cls) -> None:
+        """Closes every cassette being recorded, completing gzip compressed ones"""
+        GremlinAPICassette.close_all()
+
+
+class GremlinAPIReplayClient(GremlinAPIHttpClient):
+    """
+    Answers every call from the cassette at `GremlinAPIConfig.cassette`
+    without touching the network, matching on method, endpoint and request
+    body. Each response is held back for its recorded wall time multiplied
+    by `GremlinAPIConfig.cassette_time_scale`: 1.0 replays the original
+    timing, 0 replays as fast as possible. Selected for every call with
+    `GremlinAPIConfig.cassette_mode = "replay"`, or passed as https_client.
+    """
+
+    @classmethod
+    def cassette(cls) -> GremlinAPICassette:
+        path: Any = cls._config_setting("cassette")
+        if not path:
+            error_msg: str = "Replay requires GremlinAPIConfig.cassette, the cassette path"
+            log.error(error_msg)
+            raise GremlinReplayError(error_msg)
+        return GremlinAPICassette.open(str(path), "replay")
+
+    @classmethod
+    def _response(cls, uri: str, entry: dict) -> requests.Response:
+        resp: requests.Response = requests.Response()
+        resp.status_code = entry.get("status", 200)
+        resp._content = GremlinAPICassette.entry_body(entry)
+        resp.encoding = "utf-8"
+        resp.url = uri
+        if entry.get("content_type"):
+            resp.headers["Content-Type"] = entry["content_type"]
+        return resp
+
+    @classmethod
+    def _api_call(
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[requests.Response, dict]:
+        uri: str = cls.base_uri(endpoint)
+        raw_content: dict = kwargs.pop("raw_content", {})
+        data: Any = kwargs.get("body", kwargs.get("data"))
+        started: float = time.perf_counter()
+        with GremlinAPIInstrumentation.measure(
+            cls.__name__, method, uri, data
+        ) as event:
+            event.attempts += 1
+            entry: dict = cls.cassette().match(method, endpoint, request_digest(kwargs))
+            delay: float = float(entry.get("duration", 0.0)) * float(
+                cls._config_setting("cassette_time_scale", 1.0)
+            )
+            delay -= time.perf_counter() - started
+            if delay > 0:
+                time.sleep(delay)
+            if "error" in entry:
+                raise GremlinAPICassette.entry_error(entry)
+            resp: requests.Response = cls._response(uri, entry)
+            event.response(resp)
+            return resp, cls._response_body(resp, raw_content)
+
+
+class AsyncGremlinAPIHttpClient(GremlinAPIHttpClient):
+    """
+    asyncio transport built on httpx.AsyncClient, requires the optional httpx
+    dependency (`pip install gremlinapi[async]`).
+
+    One pooled AsyncClient is kept per running event loop, so any number of
+    coroutines on that loop share its connections. Use aclose() to release it.
+    """
+
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    def _loop_clients(cls) -> Any:
+        """AsyncClient per event loop, kept apart for each GremlinClient"""
+        return scoped_state(
+            AsyncGremlinAPIHttpClient, cls._clients, weakref.WeakKeyDictionary
+        )
+
+    @classmethod
+    def _build_client(cls) -> "httpx.AsyncClient":
+        http2: bool = bool(cls._config_setting("http2"))
+        httpx: Any = cls._httpx(http2)
+        return httpx.AsyncClient(
+            **cls._httpx_options(httpx.AsyncHTTPTransport, http2)
+        )
+
+    @classmethod
+    def client(cls) -> "httpx.AsyncClient":
+        cls._httpx(bool(cls._config_setting("http2")))
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        clients: Any = cls._loop_clients()
+        client: Any = clients.get(loop)
+        if client is None or client.is_closed:
+            client = cls._build_client()
+            clients[loop] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        client: Any = cls._loop_clients().pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    async def api_call(  # type: ignore
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[Any, dict]:
+        # Cassettes are read and written synchronously, keep them off the loop
+        cassette_call: Optional[Callable] = GremlinAPIHttpClient._cassette_call()
+        if cassette_call is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                contextvars.copy_context().run,
+                functools.partial(cassette_call, method, endpoint, *args, **kwargs),
+            )
+        return await cls._api_call(method, endpoint, *args, **kwargs)
+
+    @classmethod
+    async def _api_call(  # type: ignore
+        cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
+    ) -> Tuple[Any, dict]:
+        uri: str = cls.base_uri(endpoint)
+        raw_content: dict = kwargs.pop("raw_content", {})
+        data: Union[dict, str, bytes] = cls._request_data(kwargs)
+        request_kwargs: dict = {"headers": kwargs.get("headers", None)}
+        if isinstance(data, (str, bytes)):
+            request_kwargs["content"] = data
+        elif data:
+            request_kwargs["data"] = data
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"async httpd client kwargs: {kwargs}")
+
+        httpx: Any = cls._httpx()
+        timeout: Tuple[Any, Any] = cls.timeout()
+        request_kwargs["timeout"] = httpx.Timeout(
+            None, connect=timeout[0], read=timeout[1]
+        )
+
+        async def _send(headers: Optional[Mapping[str, str]]) -> Any:
+            request_kwargs["headers"] = headers
+            return await cls.client().request(method.upper(), uri, **request_kwargs)
+
+        resp: Any = await cls._run_attempts_async(
+            cls._attempts(
+                method,
+                uri,
+                data,
+                request_kwargs["headers"],
+                timeout,
+                (httpx.TimeoutException,),
+                httpx.ConnectTimeout,
+            ),
+            _send,
+        )
+        return resp, cls._response_body(resp, raw_content)
+
 
 class GremlinAPIurllibClient(GremlinAPIHttpClient):
     """Fallback library in the event requests library is unavailable."""
@@ -164,7 +992,7 @@ class GremlinAPIurllibClient(GremlinAPIHttpClient):
     import urllib3
 
     @classmethod
-    def api_call(
+    def _api_call(
         cls, method: str, endpoint: str, *args: tuple, **kwargs: dict
     ) -> Tuple[urllib3.HTTPResponse, dict]:
 
@@ -175,9 +1003,8 @@ class GremlinAPIurllibClient(GremlinAPIHttpClient):
         if "data" in kwargs:
             form_data: dict = kwargs.pop("data")
         elif "body" in kwargs:
-            if "Content-Type" not in kwargs["headers"]:
-                kwargs["headers"]["Content-Type"] = "application/json"
-            request_body: str = json.dumps(kwargs.pop("body"))
+            kwargs["headers"] = cls._json_header(kwargs.get("headers") or {})
+            request_body: bytes = json_codec.dumpb(kwargs.pop("body"))
 
         uri: str = f"{GremlinAPIConfig.base_uri}{endpoint}"
 
@@ -209,9 +1036,23 @@ class GremlinAPIurllibClient(GremlinAPIHttpClient):
                 )
             raise HTTPError(resp)
 
-        body: dict = json.loads(resp.data)
+        body: dict = json_codec.loads(resp.data)
         return resp, body
 
 
-def get_gremlin_httpclient() -> Type[GremlinAPIHttpClient]:
+def get_gremlin_httpclient(http2: bool = False) -> Type[GremlinAPIHttpClient]:
+    """
+    The http client endpoint methods use, which picks its transport from
+    GremlinAPIConfig on every call. With http2 the HTTP/2 client is returned
+    regardless of the configuration.
+    """
+    if http2:
+        return GremlinAPIHttp2Client
     return GremlinAPIHttpClient
+
+
+def close_gremlin_httpclient() -> None:
+    """Close the shared connection pools and cassettes, they are reopened on the next call"""
+    GremlinAPIPooledRequestsClient.close()
+    GremlinAPIHttp2Client.close()
+    GremlinAPICassette.close_all()
@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Timing and metrics for every API call made through the http clients.
+
+Each call produces a GremlinAPIRequestEvent, which is folded into in-process
+latency histograms and counters per endpoint and then handed to any hooks
+registered with `GremlinAPIInstrumentation.add_hook`. The collected metrics
+export as Prometheus text, and `enable_opentelemetry` turns every event into
+an OpenTelemetry client span.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+
+from contextvars import ContextVar
+from urllib.parse import unquote, urlencode, urlsplit
+
+from gremlinapi.config import GremlinAPIConfig
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+log = logging.getLogger("GremlinAPI.client")
+
+# Upper bounds in seconds of the latency histogram buckets, +Inf is implied
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Qualified name of the endpoint method, e.g. GremlinAPIScenarios.list_scenarios,
+# whose request is in flight. Set by register_cli_action around every call.
+request_operation: ContextVar[Optional[str]] = ContextVar(
+    "gremlinapi_request_operation", default=None
+)
+
+# Route of the request in flight, e.g. /scenarios/{guid}/runs, built by
+# send_api_steps from the parameters of the endpoint method making it
+request_endpoint: ContextVar[Optional[str]] = ContextVar(
+    "gremlinapi_request_endpoint", default=None
+)
+
+
+def endpoint_template(uri: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    The API path of uri with each segment holding the value of one of the
+    endpoint method's params replaced by that param's name, and the query
+    string dropped, `/scenarios/{guid}/runs/{runNumber}` for a scenario run.
+    """
+    path: str = urlsplit(uri).path
+    base_path: str = urlsplit(str(GremlinAPIConfig.base_uri)).path
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path) :]
+    names: Dict[str, str] = {}
+    for name, value in (params or {}).items():
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            names.setdefault(str(value), name)
+    segments: List[str] = []
+    for segment in path.rstrip("/").split("/"):
+        name: Optional[str] = names.get(segment) or names.get(unquote(segment))
+        segments.append(f"{{{name}}}" if segment and name else segment)
+    return "/".join(segments) or "/"
+
+
+def _payload_size(data: Any) -> int:
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, dict) and data:
+        return len(urlencode(data))
+    return 0
+
+
+class GremlinAPIRequestEvent(object):
+    """
+    One API call, from the first attempt to the final response, as handed to
+    instrumentation hooks. `duration` is the wall time in seconds including
+    retries, rate limiting and backoff. `status` is None when no response was
+    received and `error` names the exception the call raised, if any.
+    `endpoint` is the route template of the endpoint method making the call,
+    empty for calls made outside of one.
+    """
+
+    __slots__ = (
+        "client",
+        "method",
+        "uri",
+        "endpoint",
+        "operation",
+        "status",
+        "bytes_sent",
+        "bytes_received",
+        "attempts",
+        "started_at",
+        "duration",
+        "error",
+        "_started",
+    )
+
+    def __init__(self, client: str, method: str, uri: str, bytes_sent: int = 0):
+        self.client: str = client
+        self.method: str = method.upper()
+        self.uri: str = uri
+        self.endpoint: str = request_endpoint.get() or ""
+        self.operation: Optional[str] = request_operation.get()
+        self.status: Optional[int] = None
+        self.bytes_sent: int = bytes_sent
+        self.bytes_received: int = 0
+        self.attempts: int = 0
+        self.started_at: float = time.time()
+        self.duration: float = 0.0
+        self.error: Optional[str] = None
+        self._started: float = time.perf_counter()
+
+    @property
+    def retries(self) -> int:
+        """Attempts beyond the first, including a replay after a token refresh"""
+        return max(0, self.attempts - 1)
+
+    def response(self, resp: Any) -> None:
+        """Records the status and size of the final response"""
+        self.status = getattr(resp, "status_code", None)
+        try:
+            self.bytes_received = len(resp.content or b"")
+        except Exception:
+            self.bytes_received = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"GremlinAPIRequestEvent({self.method} {self.endpoint} status={self.status} "
+            f"duration={self.duration:.4f}s retries={self.retries} "
+            f"sent={self.bytes_sent} received={self.bytes_received})"
+        )
+
+
+class GremlinAPILatencyHistogram(object):
+    """
+    Cumulative latency histogram with fixed bucket bounds, in the layout of a
+    Prometheus histogram. Not thread safe, GremlinAPIInstrumentation
+    serializes updates.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        index: int = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations at or below it) for each bucket and +Inf"""
+        total: int = 0
+        result: List[Tuple[float, int]] = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the q quantile, interpolating within its bucket"""
+        if not self.count:
+            return None
+        rank: float = q * self.count
+        lower: float = 0.0
+        seen: int = 0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1] if self.buckets else None
+
+
+class _GremlinAPIEndpointMetrics(object):
+    def __init__(self):
+        self.latency: GremlinAPILatencyHistogram = GremlinAPILatencyHistogram()
+        self.statuses: Dict[str, int] = {}
+        self.errors: int = 0
+        self.retries: int = 0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+
+
+class GremlinAPIInstrumentation(object):
+    """
+    Process wide registry of request hooks and per endpoint metrics.
+
+    Metrics are keyed by (operation, method, endpoint template), so they
+    show which GremlinAPI* methods dominate the time spent calling the API.
+    Recording is on unless `GremlinAPIConfig.instrumentation_enabled` is
+    False. Hooks run on the calling thread, or the event loop for async
+    calls, right after each call completes and should return quickly; a hook
+    that raises is logged and skipped.
+    """
+
+    _hooks: List[Callable[[GremlinAPIRequestEvent], Any]] = []
+    _metrics: Dict[Tuple[str, str, str], _GremlinAPIEndpointMetrics] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        enabled: Any = getattr(GremlinAPIConfig, "instrumentation_enabled", True)
+        return isinstance(enabled, property) or enabled is not False
+
+    @classmethod
+    def add_hook(
+        cls, hook: Callable[[GremlinAPIRequestEvent], Any]
+    ) -> Callable[[GremlinAPIRequestEvent], Any]:
+        """Calls hook with the GremlinAPIRequestEvent of every completed call"""
+        with cls._lock:
+            cls._hooks = cls._hooks + [hook]
+        return hook
+
+    @classmethod
+    def remove_hook(cls, hook: Callable[[GremlinAPIRequestEvent], Any]) -> None:
+        with cls._lock:
+            cls._hooks = [h for h in cls._hooks if h is not hook]
+
+    @classmethod
+    @contextlib.contextmanager
+    def measure(
+        cls, client: str, method: str, uri: str, data: Any = None
+    ) -> Iterator[GremlinAPIRequestEvent]:
+        """
+        Times the enclosed call, which reports its attempts and final response
+        on the yielded event, and records the event when the block exits.
+        """
+        event: GremlinAPIRequestEvent = GremlinAPIRequestEvent(
+            client, method, uri, _payload_size(data)
+        )
+        try:
+            yield event
+        except BaseException as e:
+            event.error = e.__class__.__name__
+            raise
+        finally:
+            event.duration = time.perf_counter() - event._started
+            cls.record(event)
+
+    @classmethod
+    def record(cls, event: GremlinAPIRequestEvent) -> None:
+        if not cls.is_enabled():
+            return
+        key: Tuple[str, str, str] = (event.operation or "", event.method, event.endpoint)
+        status: str = str(event.status) if event.status is not None else "error"
+        with cls._lock:
+            metrics: Optional[_GremlinAPIEndpointMetrics] = cls._metrics.get(key)
+            if metrics is None:
+                metrics = cls._metrics[key] = _GremlinAPIEndpointMetrics()
+            metrics.latency.observe(event.duration)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if event.error is not None:
+                metrics.errors += 1
+            metrics.retries += event.retries
+            metrics.bytes_sent += event.bytes_sent
+            metrics.bytes_received += event.bytes_received
+        if log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"{event}")
+        for hook in cls._hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                log.warning(f"Instrumentation hook {hook} failed: {e}")
+
+    @classmethod
+    def summary(cls) -> List[dict]:
+        """
+        One dict per (operation, method, endpoint) with its call count,
+        errors, retries, bytes and latency, the most total time first.
+        """
+        rows: List[dict] = []
+        with cls._lock:
+            for (operation, method, endpoint), metrics in cls._metrics.items():
+                latency: GremlinAPILatencyHistogram = metrics.latency
+                rows.append(
+                    {
+                        "operation": operation,
+                        "method": method,
+                        "endpoint": endpoint,
+                        "count": latency.count,
+                        "statuses": dict(metrics.statuses),
+                        "errors": metrics.errors,
+                        "retries": metrics.retries,
+                        "bytes_sent": metrics.bytes_sent,
+                        "bytes_received": metrics.bytes_received,
+                        "total_seconds": latency.sum,
+                        "mean_seconds": latency.sum / latency.count,
+                        "p50_seconds": latency.quantile(0.5),
+                        "p95_seconds": latency.quantile(0.95),
+                        "p99_seconds": latency.quantile(0.99),
+                    }
+                )
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    @classmethod
+    def prometheus_text(cls, prefix: str = "gremlinapi") -> str:
+        """The collected metrics in the Prometheus text exposition format"""
+
+        def _labels(labels: Dict[str, str]) -> str:
+            escaped: List[str] = [
+                '%s="%s"'
+                % (
+                    name,
+                    str(value)
+                    .replace("\\", "\\\\")
+                    .replace('"', '\\"')
+                    .replace("\n", "\\n"),
+                )
+                for name, value in labels.items()
+            ]
+            return "{" + ",".join(escaped) + "}"
+
+        def _bound(bound: float) -> str:
+            return "+Inf" if bound == float("inf") else repr(bound)
+
+        with cls._lock:
+            snapshot: List[Tuple[Dict[str, str], _GremlinAPIEndpointMetrics]] = [
+                ({"operation": key[0], "method": key[1], "endpoint": key[2]}, metrics)
+                for key, metrics in sorted(cls._metrics.items())
+            ]
+            histograms: List[Tuple[Dict[str, str], List[Tuple[float, int]], float]] = [
+                (labels, metrics.latency.cumulative(), metrics.latency.sum)
+                for labels, metrics in snapshot
+            ]
+            statuses: List[Tuple[Dict[str, str], Dict[str, int]]] = [
+                (labels, dict(metrics.statuses)) for labels, metrics in snapshot
+            ]
+            counters: Dict[str, List[Tuple[Dict[str, str], int]]] = {
+                "retries": [(labels, m.retries) for labels, m in snapshot],
+                "sent_bytes": [(labels, m.bytes_sent) for labels, m in snapshot],
+                "received_bytes": [(labels, m.bytes_received) for labels, m in snapshot],
+            }
+
+        lines: List[str] = [
+            f"# HELP {prefix}_request_duration_seconds Wall time of Gremlin API calls including retries",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for labels, buckets, total in histograms:
+            for bound, count in buckets:
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f"{_labels({**labels, 'le': _bound(bound)})} {count}"
+                )
+            lines.append(f"{prefix}_request_duration_seconds_sum{_labels(labels)} {total!r}")
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{_labels(labels)} {buckets[-1][1]}"
+            )
+        lines.extend(
+            [
+                f"# HELP {prefix}_requests_total Gremlin API calls by final status",
+                f"# TYPE {prefix}_requests_total counter",
+            ]
+        )
+        for labels, by_status in statuses:
+            for status, count in sorted(by_status.items()):
+                lines.append(
+                    f"{prefix}_requests_total{_labels({**labels, 'status': status})} {count}"
+                )
+        descriptions: Dict[str, str] = {
+            "retries": "Gremlin API request attempts beyond the first",
+            "sent_bytes": "Bytes of request bodies sent to the Gremlin API",
+            "received_bytes": "Bytes of response bodies received from the Gremlin API",
+        }
+        for name, values in counters.items():
+            lines.append(f"# HELP {prefix}_request_{name}_total {descriptions[name]}")
+            lines.append(f"# TYPE {prefix}_request_{name}_total counter")
+            for labels, value in values:
+                lines.append(f"{prefix}_request_{name}_total{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def enable_opentelemetry(
+        cls, tracer: Any = None
+    ) -> Callable[[GremlinAPIRequestEvent], Any]:
+        """
+        Registers a hook emitting an OpenTelemetry client span for every call,
+        as a child of the span current when the call was made. Uses the
+        "gremlinapi" tracer of the global provider unless one is given, which
+        requires the opentelemetry-api package (`pip install gremlinapi[otel]`).
+        Pass the returned hook to remove_hook to stop emitting spans.
+        """
+        trace: Any = _load_opentelemetry()
+        if tracer is None:
+            if trace is None:
+                error_msg: str = "OpenTelemetry spans require the opentelemetry-api library, install gremlinapi[otel]"
+                log.error(error_msg)
+                raise ImportError(error_msg)
+            tracer = trace.get_tracer("gremlinapi")
+
+        def _span_hook(event: GremlinAPIRequestEvent) -> None:
+            attributes: Dict[str, Union[str, int]] = {
+                "http.request.method": event.method,
+                "url.full": event.uri.split("?", 1)[0],
+                "http.request.body.size": event.bytes_sent,
+                "http.response.body.size": event.bytes_received,
+                "http.request.resend_count": event.retries,
+                "gremlinapi.client": event.client,
+            }
+            if event.status is not None:
+                attributes["http.response.status_code"] = event.status
+            if event.endpoint:
+                attributes["url.template"] = event.endpoint
+            if event.operation:
+                attributes["gremlinapi.operation"] = event.operation
+            if event.error:
+                attributes["error.type"] = event.error
+            options: Dict[str, Any] = {
+                "start_time": int(event.started_at * 1e9),
+                "attributes": attributes,
+            }
+            if trace is not None:
+                options["kind"] = trace.SpanKind.CLIENT
+            span: Any = tracer.start_span(
+                f"{event.method} {event.endpoint}".rstrip(), **options
+            )
+            if trace is not None and (event.error or (event.status or 0) >= 400):
+                span.set_status(trace.Status(trace.StatusCode.ERROR))
+            span.end(end_time=int((event.started_at + event.duration) * 1e9))
+
+        return cls.add_hook(_span_hook)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clears the collected metrics, registered hooks are kept"""
+        with cls._lock:
+            cls._metrics = {}
+
+
+_unloaded: object = object()
+_opentelemetry_trace: Any = _unloaded
+
+
+def _load_opentelemetry() -> Any:
+    """Imports opentelemetry.trace on first use, None when it is not installed"""
+    global _opentelemetry_trace
+    if _opentelemetry_trace is _unloaded:
+        try:
+            from opentelemetry import trace  # type: ignore
+        except ImportError:
+            trace = None
+        _opentelemetry_trace = trace
+    return _opentelemetry_trace
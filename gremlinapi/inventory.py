@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+import contextvars
+import logging
+import threading
+import time
+
+from gremlinapi.config import GremlinAPIConfig, scoped_state
+
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+log = logging.getLogger("GremlinAPI.client")
+
+# Top level host fields which can be selected like tags, mapped to the
+# attribute holding them on a host
+HOST_NATIVE_TAGS: Dict[str, str] = {"os-type": "os_type", "os-version": "os_version"}
+
+
+class GremlinAPITTLCache(object):
+    """
+    Thread safe cache of a single API response which is reloaded once it is
+    older than its time to live.
+
+    The TTL is read on every lookup from the GremlinAPIConfig setting named by
+    `ttl_setting`, unless an explicit `ttl` is given. A TTL of None never
+    expires. Subclasses build their indexes in `_index`, which runs once per
+    load rather than on every lookup.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        ttl_setting: Optional[str] = None,
+    ):
+        self._loader: Callable[[], Any] = loader
+        self._ttl: Optional[float] = ttl
+        self._ttl_setting: Optional[str] = ttl_setting
+        self._value: Any = None
+        self._loaded_at: Optional[float] = None
+        self._generation: int = 0
+        self._lock: threading.RLock = threading.RLock()
+        self._invalidation_hooks: List[Callable[[], None]] = []
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop: threading.Event = threading.Event()
+
+    @property
+    def ttl(self) -> Optional[float]:
+        if self._ttl is not None or not self._ttl_setting:
+            return self._ttl
+        ttl: Any = getattr(GremlinAPIConfig, self._ttl_setting, None)
+        if isinstance(ttl, property):
+            return None
+        return ttl
+
+    @property
+    def generation(self) -> int:
+        """Incremented every time a new value is loaded"""
+        return self._generation
+
+    def is_expired(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        ttl: Optional[float] = self.ttl
+        if ttl is None:
+            return False
+        return time.monotonic() - self._loaded_at >= ttl
+
+    def get(self) -> Any:
+        if self.is_expired():
+            with self._lock:
+                if self.is_expired():
+                    self.refresh()
+        return self._value
+
+    def refresh(self) -> Any:
+        """Reloads the cached value now, regardless of its age"""
+        value: Any = self._loader()
+        with self._lock:
+            self._set(value)
+        return value
+
+    def _set(self, value: Any) -> None:
+        self._index(value)
+        self._value = value
+        self._loaded_at = time.monotonic()
+        self._generation += 1
+
+    def _index(self, value: Any) -> None:
+        pass
+
+    def invalidate(self) -> None:
+        """Drops the cached value, the next lookup reloads it"""
+        with self._lock:
+            self._loaded_at = None
+        for hook in list(self._invalidation_hooks):
+            hook()
+
+    def add_invalidation_hook(self, hook: Callable[[], None]) -> None:
+        """Registers a callable run whenever this cache is invalidated"""
+        self._invalidation_hooks.append(hook)
+
+    def start_background_refresh(self, interval: Optional[float] = None) -> None:
+        """
+        Reloads the cache every `interval` seconds, the TTL by default, on a
+        daemon thread so lookups never wait on the API. A failed reload is
+        logged and the previous value is kept.
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        period: Optional[float] = interval or self.ttl
+        if not period:
+            error_msg: str = "Background refresh requires an interval or a TTL"
+            log.error(error_msg)
+            raise ValueError(error_msg)
+        self._refresh_stop.clear()
+
+        def _refresh_loop() -> None:
+            while not self._refresh_stop.wait(period):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    log.warning(f"Background cache refresh failed: {e}")
+
+        # The copied context keeps the thread in the caller's GremlinClient
+        self._refresh_thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_refresh_loop,),
+            name=f"{self.__class__.__name__}-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        self._refresh_stop.set()
+        if self._refresh_thread:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+
+class GremlinScopedCache(object):
+    """
+    Module level stand in for a cache that each GremlinClient keeps to itself.
+
+    Outside a client every attribute is looked up on one process wide cache.
+    Inside a client it is looked up on that client's own cache, which
+    `factory` builds on first use, so clients never see each other's data.
+    """
+
+    def __init__(self, factory: Callable[[], GremlinAPITTLCache]):
+        self._factory: Callable[[], GremlinAPITTLCache] = factory
+        self._default: GremlinAPITTLCache = factory()
+
+    def cache(self) -> GremlinAPITTLCache:
+        return scoped_state(self, self._default, self._factory)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cache(), name)
+
+
+class GremlinClientInventory(GremlinAPITTLCache):
+    """
+    Caches the list_clients response in GremlinAPIConfig.client_cache along
+    with a flattened list of every container of every client and indexes of
+    those containers by id and by label.
+
+    A response assigned to GremlinAPIConfig.client_cache directly is picked up
+    and indexed on the next lookup.
+    """
+
+    def __init__(self, loader: Callable[[], Any], ttl: Optional[float] = None):
+        super(GremlinClientInventory, self).__init__(
+            loader, ttl=ttl, ttl_setting="client_cache_ttl"
+        )
+        self._containers: List[dict] = []
+        self._containers_by_id: Dict[str, dict] = {}
+        self._container_ids_by_label: Dict[Tuple[str, str], Set[str]] = {}
+
+    def get(self) -> Any:
+        client_cache: Any = GremlinAPIConfig.client_cache
+        if (
+            client_cache
+            and not isinstance(client_cache, property)
+            and client_cache is not self._value
+        ):
+            with self._lock:
+                self._set(client_cache)
+        return super(GremlinClientInventory, self).get()
+
+    def _set(self, value: Any) -> None:
+        super(GremlinClientInventory, self)._set(value)
+        GremlinAPIConfig.client_cache = value
+
+    def _index(self, value: Any) -> None:
+        containers: List[dict] = []
+        for state in ("active", "inactive", "idle"):
+            for client in value.get(state, []):
+                containers.extend(client.get("containers", []))
+        containers_by_id: Dict[str, dict] = {}
+        ids_by_label: Dict[Tuple[str, str], Set[str]] = {}
+        for container in containers:
+            container_id: str = container.get("id", "")
+            containers_by_id[container_id] = container
+            for key, label in container.get("labels", {}).items():
+                ids_by_label.setdefault((key, label), set()).add(container_id)
+        self._containers = containers
+        self._containers_by_id = containers_by_id
+        self._container_ids_by_label = ids_by_label
+
+    def invalidate(self) -> None:
+        with self._lock:
+            GremlinAPIConfig.client_cache = {}
+            self._value = None
+        super(GremlinClientInventory, self).invalidate()
+
+    def containers(self) -> List[dict]:
+        """Every container of every active, inactive and idle client, treat as read only"""
+        self.get()
+        return self._containers
+
+    def container(self, container_id: str) -> Optional[dict]:
+        self.get()
+        return self._containers_by_id.get(container_id)
+
+    def container_ids_with_label(self, key: str, value: str) -> Set[str]:
+        self.get()
+        return self._container_ids_by_label.get((key, value), set())
+
+
+class GremlinTargetInventory(GremlinAPITTLCache):
+    """
+    Indexes a list of hosts or containers by identifier and by attribute
+    key/value pair, so target helpers validate selections with set lookups
+    instead of scanning the list.
+
+    `attributes` names the dict on each target holding its tags or labels and
+    `native_keys` names top level fields indexed alongside them. A single
+    instance is shared by every helper in the process and rebuilt once per
+    `GremlinAPIConfig.target_inventory_ttl`.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        attributes: str,
+        native_keys: Tuple[str, ...] = (),
+        ttl: Optional[float] = None,
+    ):
+        super(GremlinTargetInventory, self).__init__(
+            loader, ttl=ttl, ttl_setting="target_inventory_ttl"
+        )
+        self._attributes: str = attributes
+        self._native_keys: Tuple[str, ...] = native_keys
+        self._identifiers: Set[str] = set()
+        self._values_by_key: Dict[str, List[Any]] = {}
+        self._pairs: Set[Tuple[str, Any]] = set()
+
+    def _index(self, value: Any) -> None:
+        identifiers: Set[str] = set()
+        values_by_key: Dict[str, List[Any]] = {}
+        pairs: Set[Tuple[str, Any]] = set()
+
+        def _add(key: str, attribute_value: Any) -> None:
+            values: List[Any] = values_by_key.setdefault(key, [])
+            if (key, attribute_value) not in pairs:
+                pairs.add((key, attribute_value))
+                values.append(attribute_value)
+
+        for target in value or []:
+            if target.get("identifier") is not None:
+                identifiers.add(target["identifier"])
+            for key in self._native_keys:
+                _add(key, target.get(key))
+            for key, attribute_value in (target.get(self._attributes) or {}).items():
+                values_by_key.setdefault(key, [])
+                if isinstance(attribute_value, str):
+                    _add(key, attribute_value)
+                elif isinstance(attribute_value, list):
+                    for inner_value in attribute_value:
+                        _add(key, inner_value)
+        self._identifiers = identifiers
+        self._values_by_key = values_by_key
+        self._pairs = pairs
+
+    def identifiers(self) -> Set[str]:
+        self.get()
+        return self._identifiers
+
+    def values_by_key(self) -> Dict[str, List[Any]]:
+        """Every distinct value seen for each tag or label key, treat as read only"""
+        self.get()
+        return self._values_by_key
+
+    def has_identifier(self, identifier: Optional[str]) -> bool:
+        return identifier in self.identifiers()
+
+    def has_value(self, key: Any, value: Any) -> bool:
+        self.get()
+        try:
+            return (key, value) in self._pairs
+        except TypeError:
+            return False
+
+
+class GremlinKubernetesTargetInventory(GremlinAPITTLCache):
+    """
+    Indexes the list_kubernetes_targets response by (clusterId, kind,
+    namespace, name), so resolving a Kubernetes attack target is a dict lookup
+    rather than a fresh download and scan of every cluster.
+    """
+
+    def __init__(self, loader: Callable[[], Any], ttl: Optional[float] = None):
+        super(GremlinKubernetesTargetInventory, self).__init__(
+            loader, ttl=ttl, ttl_setting="target_inventory_ttl"
+        )
+        self._objects: Dict[Tuple[str, str, str, str], List[dict]] = {}
+
+    def _index(self, value: Any) -> None:
+        objects: Dict[Tuple[str, str, str, str], List[dict]] = {}
+        for cluster in value or []:
+            cluster_id: str = cluster.get("clusterId")
+            for k8s_object in cluster.get("objects") or []:
+                key: Tuple[str, str, str, str] = (
+                    cluster_id,
+                    k8s_object.get("kind"),
+                    k8s_object.get("namespace"),
+                    k8s_object.get("name"),
+                )
+                objects.setdefault(key, []).append(k8s_object)
+        self._objects = objects
+
+    def objects(
+        self, cluster_id: str, kind: str, namespace: str, name: str
+    ) -> List[dict]:
+        """Every object matching all four fields, treat as read only"""
+        self.get()
+        return self._objects.get((cluster_id, kind, namespace, name), [])
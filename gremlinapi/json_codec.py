@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+JSON encoding and decoding for request and response bodies.
+
+Uses orjson when it is installed, then ujson, then the standard library json
+module. `GremlinAPIConfig.json_codec` selects a backend by name; None or
+"auto" picks the fastest available. Every backend raises a ValueError subclass
+on malformed input.
+"""
+
+import json
+import logging
+
+from gremlinapi.config import GremlinAPIConfig
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import ujson  # type: ignore
+except ImportError:
+    ujson = None  # type: ignore
+
+log = logging.getLogger("GremlinAPI.client")
+
+BACKENDS: Tuple[str, ...] = ("orjson", "ujson", "json")
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _orjson_dumpb(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Integers beyond 64 bits and other types orjson refuses
+        return _json_dumpb(obj)
+
+
+def _ujson_dumpb(obj: Any) -> bytes:
+    return ujson.dumps(
+        obj, ensure_ascii=False, escape_forward_slashes=False
+    ).encode("utf-8")
+
+
+_codecs: Dict[str, Tuple[Callable[[Any], bytes], Callable[[Any], Any]]] = {
+    "json": (_json_dumpb, json.loads)
+}
+if orjson is not None:
+    _codecs["orjson"] = (_orjson_dumpb, orjson.loads)
+if ujson is not None:
+    _codecs["ujson"] = (_ujson_dumpb, ujson.loads)
+
+_unresolved: object = object()
+_configured: Any = _unresolved
+_active: str = "json"
+
+
+def backend() -> str:
+    """Name of the backend in use, re-resolved when the configured codec changes"""
+    global _configured, _active
+    configured: Any = getattr(GremlinAPIConfig, "json_codec", None)
+    if isinstance(configured, property):
+        configured = None
+    if configured == _configured:
+        return _active
+    if configured in (None, "", "auto"):
+        active: str = next(name for name in BACKENDS if name in _codecs)
+    elif configured in _codecs:
+        active = configured
+    else:
+        log.warning(
+            f"JSON codec {configured} is not installed or not supported, using json"
+        )
+        active = "json"
+    (_configured, _active) = (configured, active)
+    return _active
+
+
+def dumpb(obj: Any) -> bytes:
+    """Encodes obj as UTF-8 JSON bytes, ready to send as a request body"""
+    return _codecs[backend()][0](obj)
+
+
+def dumps(obj: Any) -> str:
+    return dumpb(obj).decode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    return _codecs[backend()][1](data)
@@ -13,11 +13,15 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
 )
+from gremlinapi.inventory import (
+    GremlinKubernetesTargetInventory,
+    GremlinScopedCache,
+)
 
 from typing import Union, Type
 
@@ -27,95 +31,108 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIKubernetesAttacks(GremlinAPI):
     @classmethod
     @register_cli_action("list_all_kubernetes_attacks", ("",), ("teamId",))
+    @api_endpoint
     def list_all_kubernetes_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint("/kubernetes/attacks", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_kubernetes_attack", ("uid",), ("teamId",))
+    @api_endpoint
     def get_kubernetes_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         uid: str = cls._error_if_not_param("uid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/kubernetes/attacks/{uid}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_kubernetes_attack", ("uid",), ("teamId",))
+    @api_endpoint
     def halt_kubernetes_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         uid: str = cls._error_if_not_param("uid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/kubernetes/attacks/{uid}/halt", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_all_kubernetes_attacks", ("",), ("teamId",))
+    @api_endpoint
     def halt_all_kubernetes_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         endpoint: str = cls._optional_team_endpoint(
             "/kubernetes/attacks/halt", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("new_kubernetes_attack", ("body",), ("teamId",))
+    @api_endpoint
     def new_kubernetes_attack(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = cls._error_if_not_json_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint("/kubernetes/attacks/new", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
 class GremlinAPIKubernetesTargets(GremlinAPI):
     @classmethod
     @register_cli_action("list_kubernetes_targets", ("",), ("teamId",))
+    @api_endpoint
     def list_kubernetes_targets(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint("/kubernetes/targets", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
+
+
+kubernetes_target_inventory: GremlinScopedCache = GremlinScopedCache(
+    lambda: GremlinKubernetesTargetInventory(
+        lambda: GremlinAPIKubernetesTargets.list_kubernetes_targets()
+    )
+)
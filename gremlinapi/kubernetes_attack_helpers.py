@@ -9,12 +9,15 @@ from gremlinapi.exceptions import (
     GremlinParameterError
 )
 
-from typing import Type, Optional, Union, Dict, Any, Pattern
+from typing import Type, Optional, Union, Dict, Any, List, Pattern
 
 from gremlinapi.clients import GremlinAPIClients as clients
 from gremlinapi.containers import GremlinAPIContainers as containers
 from gremlinapi.providers import GremlinAPIProviders as providers
-from gremlinapi.kubernetes import GremlinAPIKubernetesTargets as kubernetes_targets
+from gremlinapi.kubernetes import (
+    GremlinAPIKubernetesTargets as kubernetes_targets,
+    kubernetes_target_inventory,
+)
 from gremlinapi.attack_helpers import GremlinAttackTargetHelper, GremlinAttackHelper
 
 
@@ -116,31 +119,13 @@ class GremlinKubernetesAttackTarget(object):
 
     def __set_uid(self) -> None:
         '''
-        Pull all targets and refine to exactly a single target.
+        Look up exactly a single target in the shared target inventory.
         Otherwise throw an error
         '''
 
-        target_objects = []
-        all_objects = kubernetes_targets.list_kubernetes_targets()
-        for cluster in all_objects:
-
-            # Targets are exposed as a list of json objects.
-            # Each json object is a k8s cluster and all associated
-            #   k8s objects inside a list called "objects"
-            if cluster['clusterId'] != self._cluster_id:
-                continue
-
-            for object in cluster['objects']:
-
-                if object['kind'] != self._kind:
-                    continue
-                elif object['namespace'] != self._namespace:
-                    continue
-                elif object['name'] != self._name:
-                    continue
-                target_objects.append(object)
-
-            break
+        target_objects = kubernetes_target_inventory.objects(
+            self._cluster_id, self._kind, self._namespace, self._name
+        )
 
         if len(target_objects) != 1:
             target_object_len = len(target_objects)
@@ -157,6 +142,25 @@ class GremlinKubernetesAttackTarget(object):
 
         self._uid = target_objects[0]['uid']
 
+    @classmethod
+    def resolve(cls, targets: List[dict]) -> List["GremlinKubernetesAttackTarget"]:
+        '''
+        Builds a target from each dict of cluster_id, namespace, kind and name
+        against a single fetch of the target inventory. Every target that
+        cannot be resolved is reported together in one error.
+        '''
+        kubernetes_target_inventory.get()
+        resolved: List[GremlinKubernetesAttackTarget] = []
+        errors: List[str] = []
+        for target in targets:
+            try:
+                resolved.append(cls(**target))
+            except GremlinIdentifierError as e:
+                errors.append(str(e))
+        if errors:
+            raise GremlinIdentifierError("\n".join(errors))
+        return resolved
+
     def api_model(self) -> dict:
         model: dict = {
             "clusterId": self._cluster_id,
@@ -13,7 +13,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -27,31 +27,33 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIMetrics(GremlinAPI):
     @classmethod
     @register_cli_action("get_attack_metrics", ("attackId",), ("teamId",))
+    @api_endpoint
     def get_attack_metrics(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         attack_id: str = cls._error_if_not_param("attackId", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/metrics/attacks/{attack_id}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action(
         "get_scenario_run_metrics", ("scenarioId", "scenarioRunNumber"), ("teamId",)
     )
+    @api_endpoint
     def get_scenario_run_metrics(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         scenario_id: str = cls._error_if_not_param("scenarioId", **kwargs)
         scenario_run_number: str = cls._error_if_not_param(
@@ -61,5 +63,5 @@ class GremlinAPIMetrics(GremlinAPI):
             f"/metrics/scenarios/{scenario_id}/runs/{scenario_run_number}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
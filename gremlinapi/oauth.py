@@ -18,7 +18,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -38,13 +38,14 @@ log = logging.getLogger("GremlinAPI.client")
 
 class GremlinAPIOAUTH(GremlinAPI):
     @classmethod
+    @api_endpoint
     def configure(
         cls,
         company_id: str = "",
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> int:
+    ) -> APISteps[int]:
         """
         Configuration of Gremlin OAUTH
 
@@ -93,15 +94,16 @@ class GremlinAPIOAUTH(GremlinAPI):
             "scope": cls._warn_if_not_param("scope", **kwargs),
         }
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return resp.status_code
 
     @classmethod
+    @api_endpoint
     def initiate_oauth(
         cls,
         company_name: str,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
-    ) -> Tuple[str, str]:
+    ) -> APISteps[Tuple[str, str]]:
         """
         Initiates the OAUTH Authentication flow
 
@@ -120,7 +122,7 @@ class GremlinAPIOAUTH(GremlinAPI):
         # Initiates OAUTH login with Gremlin
         # `status_code` 307 is a redirect to the OAUTH provider
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call("GET", endpoint, **payload)
+        (resp, body) = yield "GET", endpoint, payload
         assert resp.status_code == 307
 
         state_cookie = resp.cookies["oauth_state"]
@@ -131,12 +133,13 @@ class GremlinAPIOAUTH(GremlinAPI):
         return state_cookie, oauth_provider_login_url
 
     @classmethod
+    @api_endpoint
     def get_callback_url(
         cls,
         oauth_provider_login_url: str,
         data: dict,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
-    ) -> str:
+    ) -> APISteps[str]:
         """
         Retrieves a valid callback url
 
@@ -163,9 +166,7 @@ class GremlinAPIOAUTH(GremlinAPI):
 
         """
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(
-            "POST", oauth_provider_login_url, **payload
-        )
+        (resp, body) = yield "POST", oauth_provider_login_url, payload
 
         # You have now successfully authenticted with your OAuth provider,
         # now continue the flow by following the redirect your OAuth provider
@@ -175,12 +176,13 @@ class GremlinAPIOAUTH(GremlinAPI):
         return gremlin_callback_url
 
     @classmethod
+    @api_endpoint
     def get_access_token(
         cls,
         state_cookie: str,
         gremlin_callback_url: str,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
-    ) -> str:
+    ) -> APISteps[str]:
         """
         Retrieves a valid access token to access the next piece of the Gremlin OAUTH flow
 
@@ -202,9 +204,7 @@ class GremlinAPIOAUTH(GremlinAPI):
         # redirect URL you are following and it needs to match the
         # value in the cookie. This helps prevent CSRF attacks.
         cookie = {"oauth_state": state_cookie}
-        (resp, body) = https_client.api_call(
-            "GET", gremlin_callback_url, **{"cookies": cookie}
-        )
+        (resp, body) = yield "GET", gremlin_callback_url, {"cookies": cookie}
         # The response from the callback endpoint will contain the `access_token` in JSON
         # This is the end of the OAuth specific flow. This `access_token` can
         # now be exchanged for a Gremlin session.
@@ -215,12 +215,13 @@ class GremlinAPIOAUTH(GremlinAPI):
         return access_token
 
     @classmethod
+    @api_endpoint
     def get_bearer_token(
         cls,
         company_name: str,
         access_token: str,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
-    ) -> str:
+    ) -> APISteps[str]:
         """
         Retrieves a valid bearer token to access the authenticated portions of our API.
 
@@ -243,7 +244,7 @@ class GremlinAPIOAUTH(GremlinAPI):
         }
         payload: dict = cls._payload(**{"data": body})
         endpoint = f"{GREMLIN_SSO_USER_AUTH}?getCompanySession=true"
-        (resp, body) = https_client.api_call("POST", endpoint, **payload)
+        (resp, body) = yield "POST", endpoint, payload
         assert resp.status_code == 200
 
         # The response is a JSON representation of the session.
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+import asyncio
+import logging
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from gremlinapi.config import GremlinAPIConfig
+
+from typing import Any, Dict, List, Optional, Tuple
+
+log = logging.getLogger("GremlinAPI.client")
+
+
+class GremlinAPITokenBucket(object):
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most
+    `capacity` tokens.
+
+    Callers reserve a token up front and then wait outside the lock for the
+    time the reservation is due, so threads and coroutines sharing a bucket
+    are served in order without blocking one another while they wait.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, received {rate}")
+        self.rate: float = float(rate)
+        self.capacity: float = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait before using it"""
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        wait: float = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait: float = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class GremlinAPIRateLimiter(object):
+    """
+    Client side rate limiting shared by every endpoint class.
+
+    `GremlinAPIConfig.rate_limit_qps` caps all outbound requests, and
+    `GremlinAPIConfig.rate_limit_endpoint_qps` maps endpoint prefixes, such
+    as "/clients", to their own limit. A request takes a token from the
+    global bucket and from the bucket of its longest matching prefix.
+    Buckets are rebuilt whenever the configured limits change.
+    """
+
+    _buckets: Dict[Optional[str], GremlinAPITokenBucket] = {}
+    _limits: Tuple[Any, ...] = ()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def _setting(cls, name: str) -> Any:
+        value: Any = getattr(GremlinAPIConfig, name, None)
+        if isinstance(value, property):
+            return None
+        return value
+
+    @classmethod
+    def _configured_limits(cls) -> Tuple[Any, ...]:
+        endpoint_qps: Optional[dict] = cls._setting("rate_limit_endpoint_qps")
+        return (
+            cls._setting("rate_limit_qps"),
+            cls._setting("rate_limit_burst"),
+            tuple(sorted(endpoint_qps.items())) if endpoint_qps else (),
+        )
+
+    @classmethod
+    def _refresh_buckets(cls) -> Dict[Optional[str], GremlinAPITokenBucket]:
+        limits: Tuple[Any, ...] = cls._configured_limits()
+        if limits == cls._limits:
+            return cls._buckets
+        with cls._lock:
+            if limits != cls._limits:
+                (qps, burst, endpoint_qps) = limits
+                buckets: Dict[Optional[str], GremlinAPITokenBucket] = {}
+                if qps:
+                    buckets[None] = GremlinAPITokenBucket(qps, burst)
+                for prefix, prefix_qps in endpoint_qps:
+                    if prefix_qps:
+                        buckets[prefix] = GremlinAPITokenBucket(prefix_qps, burst)
+                cls._buckets = buckets
+                cls._limits = limits
+        return cls._buckets
+
+    @classmethod
+    def _endpoint_path(cls, endpoint: str) -> str:
+        path: str = urlsplit(endpoint).path
+        base_path: str = urlsplit(str(GremlinAPIConfig.base_uri)).path
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path) :]
+        return path
+
+    @classmethod
+    def buckets_for(cls, endpoint: str) -> List[GremlinAPITokenBucket]:
+        buckets: Dict[Optional[str], GremlinAPITokenBucket] = cls._refresh_buckets()
+        if not buckets:
+            return []
+        matched: List[GremlinAPITokenBucket] = []
+        if None in buckets:
+            matched.append(buckets[None])
+        path: str = cls._endpoint_path(endpoint)
+        prefixes: List[str] = [
+            p for p in buckets if p is not None and path.startswith(p)
+        ]
+        if prefixes:
+            matched.append(buckets[max(prefixes, key=len)])
+        return matched
+
+    @classmethod
+    def acquire(cls, endpoint: str) -> float:
+        waited: float = 0.0
+        for bucket in cls.buckets_for(endpoint):
+            waited += bucket.acquire()
+        if waited and log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"Rate limited request to {endpoint} for {waited:.3f}s")
+        return waited
+
+    @classmethod
+    async def acquire_async(cls, endpoint: str) -> float:
+        waited: float = 0.0
+        for bucket in cls.buckets_for(endpoint):
+            waited += await bucket.acquire_async()
+        if waited and log.getEffectiveLevel() == logging.DEBUG:
+            log.debug(f"Rate limited request to {endpoint} for {waited:.3f}s")
+        return waited
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._buckets = {}
+            cls._limits = ()
@@ -1,5 +1,4 @@
 import logging
-import json
 
 from gremlinapi.cli import register_cli_action
 from gremlinapi.exceptions import (
@@ -10,9 +9,10 @@ from gremlinapi.exceptions import (
     HTTPError
 )
 
-from typing import Union, Type
+from typing import Union, Type, Iterator
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi import json_codec
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient
@@ -55,12 +55,13 @@ class GremlinAPIReliabilityTests(GremlinAPI):
 
 
     @classmethod
+    @api_endpoint
     def list_reliability_test_types(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         """
         List all types of reliability tests.
         These types represent the different types of tests/experiments
@@ -69,17 +70,18 @@ class GremlinAPIReliabilityTests(GremlinAPI):
         method = "GET"
         endpoint = cls._required_team_endpoint("/reliability-tests", **kwargs)
         payload = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
     
 
     @classmethod
+    @api_endpoint
     def list_service_reliability_test_runs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         '''
         List all reliability tests that have been run for a particular service ID
         '''
@@ -89,17 +91,18 @@ class GremlinAPIReliabilityTests(GremlinAPI):
             f'/reliability-tests/runs/?serviceId={service_id}', **kwargs
         )
         payload = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
     @classmethod
+    @api_endpoint
     def list_service_reliability_test_runs_by_type(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         '''
         List all reliability tests of a specific type that have been run for a particular service ID
         '''
@@ -114,37 +117,56 @@ class GremlinAPIReliabilityTests(GremlinAPI):
         #else:
         #    endpoint = cls._required_team_endpoint(
         #        f'/reliability-tests/{reliability_test_id}/runs/?serviceId={service_id}&pageSize={page_size}', **kwargs)
-        endpoint = cls._required_team_endpoint(
+        endpoint = cls._optional_page_endpoint(
             f'/reliability-tests/{reliability_test_id}/runs/?serviceId={service_id}', **kwargs)
+        endpoint = cls._required_team_endpoint(endpoint, **kwargs)
         payload = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
     @classmethod
+    def iter_service_reliability_test_runs_by_type(
+        cls,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        prefetch: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        '''
+        Yields the reliability test runs of a specific type for a service one at a time,
+        following page tokens as needed. Set prefetch to request the next page in the background.
+        '''
+        yield from cls._iter_pages(
+            cls.list_service_reliability_test_runs_by_type, https_client, prefetch, **kwargs
+        )
+
+
+    @classmethod
+    @api_endpoint
     def list_reliability_test_notifications(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         '''
         List all reliability test notifications for this team
         '''
         method = "GET"
         endpoint = cls._required_team_endpoint("/reliability-tests/notifications", **kwargs)
         payload = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
     
 
     @classmethod
+    @api_endpoint
     def run_single_reliability_test(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         '''
         Run a single reliability test against a service
         '''
@@ -168,18 +190,19 @@ class GremlinAPIReliabilityTests(GremlinAPI):
                 )
 
         endpoint = cls._required_team_endpoint(f"/reliability-tests/{reliability_test_id}/runs", **kwargs)
-        payload = cls._payload(**{"headers": https_client.header(), "data": json.dumps(data)})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        payload = cls._payload(**{"headers": https_client.header(), "data": json_codec.dumps(data)})
+        (resp, body) = yield method, endpoint, payload
         return body
     
     
     @classmethod
+    @api_endpoint
     def run_all_reliability_tests(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         '''
         Run all reliability tests for a service
         '''
@@ -190,17 +213,18 @@ class GremlinAPIReliabilityTests(GremlinAPI):
         data = {
             'startBaselineRequest': ''
         }
-        payload = cls._payload(**{"headers": https_client.header(), "data": json.dumps(data)})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        payload = cls._payload(**{"headers": https_client.header(), "data": json_codec.dumps(data)})
+        (resp, body) = yield method, endpoint, payload
         return body
     
     @classmethod
+    @api_endpoint
     def get_service_reliability_score(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> int:
+    ) -> APISteps[int]:
         '''
         Retrieve current score for a service
         '''
@@ -208,5 +232,5 @@ class GremlinAPIReliabilityTests(GremlinAPI):
         service_id = cls._error_if_not_param("service_id", **kwargs)
         endpoint = cls._required_team_endpoint(f"/reliability-management/services/{service_id}", **kwargs)
         payload = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body['score']
\ No newline at end of file
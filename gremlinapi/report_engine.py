@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+"""
+Fetches GremlinAPIReports over long date ranges one period at a time.
+
+A range is widened to whole periods (days, Monday to Sunday weeks, or calendar
+months) and every period is requested separately and concurrently. Periods
+which ended before today, in UTC, cannot change any more and are kept in an
+SQLite file at `GremlinAPIConfig.report_cache`, so a dashboard re-run only
+downloads the periods it has not seen and the current one.
+"""
+
+import contextvars
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+
+from gremlinapi import json_codec
+from gremlinapi.config import GremlinAPIConfig
+from gremlinapi.exceptions import GremlinParameterError
+from gremlinapi.http_clients import GremlinAPIHttpClient, get_gremlin_httpclient
+from gremlinapi.reports import GremlinAPIReports
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+log = logging.getLogger("GremlinAPI.client")
+
+PERIODS: Tuple[str, ...] = ("DAYS", "WEEKS", "MONTHS")
+
+# report name: (endpoint method, start and end query parameters, sends period)
+REPORTS: Dict[str, Tuple[Callable, Tuple[str, str], bool]] = {
+    "attacks": (GremlinAPIReports.report_attacks, ("start", "end"), True),
+    "clients": (GremlinAPIReports.report_clients, ("start", "end"), True),
+    "teams": (GremlinAPIReports.report_teams, ("startDate", "endDate"), False),
+    "users": (GremlinAPIReports.report_users, ("start", "end"), True),
+}
+
+_open_lock: threading.Lock = threading.Lock()
+_caches: Dict[str, "GremlinReportCache"] = {}
+
+
+def _as_date(value: Union[str, date, datetime]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        error_msg: str = f"Report dates must be YYYY-MM-DD, received {value}"
+        log.error(error_msg)
+        raise GremlinParameterError(error_msg)
+
+
+def period_bounds(day: date, period: str) -> Tuple[date, date]:
+    """First and last day of the period containing day"""
+    if period == "DAYS":
+        return day, day
+    if period == "WEEKS":
+        first: date = day - timedelta(days=day.weekday())
+        return first, first + timedelta(days=6)
+    first = day.replace(day=1)
+    following: date = (first + timedelta(days=31)).replace(day=1)
+    return first, following - timedelta(days=1)
+
+
+def period_chunks(
+    start: Union[str, date], end: Union[str, date], period: str = "DAYS"
+) -> List[Tuple[date, date]]:
+    """
+    Whole periods covering start to end, both inclusive, as (first day, last
+    day) pairs in order
+    """
+    period = str(period).upper()
+    if period not in PERIODS:
+        error_msg: str = (
+            f"period must be one of {', '.join(PERIODS)}, received {period}"
+        )
+        log.error(error_msg)
+        raise GremlinParameterError(error_msg)
+    first, last = _as_date(start), _as_date(end)
+    if last < first:
+        error_msg = f"Report end {last} is before its start {first}"
+        log.error(error_msg)
+        raise GremlinParameterError(error_msg)
+    chunks: List[Tuple[date, date]] = []
+    chunk_start: date = period_bounds(first, period)[0]
+    while chunk_start <= last:
+        chunk: Tuple[date, date] = period_bounds(chunk_start, period)
+        chunks.append(chunk)
+        chunk_start = chunk[1] + timedelta(days=1)
+    return chunks
+
+
+def report_rows(body: Any, chunk_start: date, chunk_end: date) -> List[dict]:
+    """
+    Table rows of one period's report body: one per element of a list body,
+    a single row for an object, each led by the period's first and last day
+    """
+    items: list = body if isinstance(body, list) else [body] if body else []
+    return [
+        {
+            "period_start": chunk_start,
+            "period_end": chunk_end,
+            **(item if isinstance(item, dict) else {"value": item}),
+        }
+        for item in items
+    ]
+
+
+class GremlinReportCache(object):
+    """
+    Report bodies of periods which have ended, in one SQLite file. Bodies are
+    keyed by the API, company and team they came from, so one file can serve
+    several GremlinClients. Use open() to share one instance per path.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        directory: str = os.path.dirname(os.path.abspath(path))
+        if path != ":memory:" and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self._lock: threading.Lock = threading.Lock()
+        self._db: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS report_chunks ("
+                "scope TEXT NOT NULL, report TEXT NOT NULL, period TEXT NOT NULL, "
+                "start TEXT NOT NULL, end TEXT NOT NULL, body BLOB NOT NULL, "
+                "fetched TEXT NOT NULL, PRIMARY KEY (scope, report, period, start))"
+            )
+
+    @classmethod
+    def open(cls, path: str) -> "GremlinReportCache":
+        """The open cache for path, opening it on first use"""
+        cache: Optional[GremlinReportCache] = _caches.get(path)
+        if cache is None:
+            with _open_lock:
+                cache = _caches.get(path)
+                if cache is None:
+                    cache = _caches[path] = cls(path)
+        return cache
+
+    @classmethod
+    def close_all(cls) -> None:
+        with _open_lock:
+            caches: List[GremlinReportCache] = list(_caches.values())
+            _caches.clear()
+        for cache in caches:
+            cache.close()
+
+    def load(
+        self, scope: str, report: str, period: str, first: date, last: date
+    ) -> Dict[date, Any]:
+        """Cached bodies of the periods starting between first and last, by start"""
+        with self._lock:
+            rows: List[Tuple[str, bytes]] = self._db.execute(
+                "SELECT start, body FROM report_chunks WHERE scope = ? AND report = ? "
+                "AND period = ? AND start BETWEEN ? AND ?",
+                (scope, report, period, first.isoformat(), last.isoformat()),
+            ).fetchall()
+        return {
+            date.fromisoformat(start): json_codec.loads(zlib.decompress(body))
+            for start, body in rows
+        }
+
+    def store(
+        self,
+        scope: str,
+        report: str,
+        period: str,
+        chunks: Iterable[Tuple[date, date, Any]],
+    ) -> None:
+        fetched: str = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO report_chunks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        scope,
+                        report,
+                        period,
+                        chunk_start.isoformat(),
+                        chunk_end.isoformat(),
+                        zlib.compress(json_codec.dumpb(body)),
+                        fetched,
+                    )
+                    for chunk_start, chunk_end, body in chunks
+                ],
+            )
+
+    def clear(self, scope: Optional[str] = None) -> None:
+        """Forgets every cached period, or only those of scope"""
+        with self._lock, self._db:
+            if scope is None:
+                self._db.execute("DELETE FROM report_chunks")
+            else:
+                self._db.execute("DELETE FROM report_chunks WHERE scope = ?", (scope,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class GremlinReportResult(object):
+    """One report over a date range, as the body of each period in order"""
+
+    def __init__(self, report: str, period: str, chunks: List[Tuple[date, date, Any]]):
+        self.report: str = report
+        self.period: str = period
+        self.chunks: List[Tuple[date, date, Any]] = chunks
+        self.cached: int = 0
+        self.fetched: int = 0
+
+    def rows(self) -> List[dict]:
+        rows: List[dict] = []
+        for chunk_start, chunk_end, body in self.chunks:
+            rows.extend(report_rows(body, chunk_start, chunk_end))
+        return rows
+
+    def to_pandas(self) -> Any:
+        """The rows as a pandas DataFrame, requires gremlinapi[reports]"""
+        try:
+            import pandas  # type: ignore
+        except ImportError:
+            error_msg: str = "to_pandas requires pandas, install gremlinapi[reports]"
+            log.error(error_msg)
+            raise ImportError(error_msg)
+        return pandas.DataFrame(self.rows())
+
+    def to_arrow(self) -> Any:
+        """The rows as a pyarrow Table, requires gremlinapi[reports]"""
+        try:
+            import pyarrow  # type: ignore
+        except ImportError:
+            error_msg: str = "to_arrow requires pyarrow, install gremlinapi[reports]"
+            log.error(error_msg)
+            raise ImportError(error_msg)
+        return pyarrow.Table.from_pylist(self.rows())
+
+
+class GremlinReportEngine(object):
+    @classmethod
+    def _scope(cls, team_id: Optional[str]) -> str:
+        if not team_id and type(GremlinAPIConfig.team_id) is str:
+            team_id = GremlinAPIConfig.team_id  # type: ignore
+        company: Any = GremlinAPIConfig.company_name
+        return "|".join(
+            (
+                str(GremlinAPIConfig.base_uri),
+                company if isinstance(company, str) else "",
+                team_id or "",
+            )
+        )
+
+    @classmethod
+    def _cache(cls) -> Optional[GremlinReportCache]:
+        path: Any = GremlinAPIConfig.report_cache
+        if not path or isinstance(path, property):
+            return None
+        return GremlinReportCache.open(os.path.expanduser(path))
+
+    @classmethod
+    def fetch(
+        cls,
+        report: str,
+        start: Union[str, date],
+        end: Union[str, date],
+        period: str = "DAYS",
+        team_id: Optional[str] = None,
+        concurrency: int = 8,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        today: Optional[date] = None,
+    ) -> GremlinReportResult:
+        """
+        Report `report` (attacks, clients, teams or users) for every period
+        from start to end. Periods which ended before today come from the
+        report cache when it holds them and are added to it otherwise, the
+        rest are fetched concurrently on `concurrency` worker threads.
+
+        The range is widened to whole periods: with WEEKS it runs from the
+        Monday on or before start to the Sunday on or after end, with MONTHS
+        from the first day of start's month to the last day of end's month.
+        Each chunk's actual first and last day are in `result.chunks` and in
+        the period_start and period_end of every row.
+
+        Unless given, today is the current date in UTC rather than the local
+        date, so around local midnight the latest period may be cached one
+        day early or late. Pass today to count periods in another time zone.
+        """
+        if report not in REPORTS:
+            error_msg: str = (
+                f"report must be one of {', '.join(REPORTS)}, received {report}"
+            )
+            log.error(error_msg)
+            raise GremlinParameterError(error_msg)
+        if concurrency < 1:
+            error_msg = f"concurrency must be at least 1, received {concurrency}"
+            log.error(error_msg)
+            raise GremlinParameterError(error_msg)
+        period = str(period).upper()
+        chunks: List[Tuple[date, date]] = period_chunks(start, end, period)
+        today = today or datetime.now(timezone.utc).date()
+        scope: str = cls._scope(team_id)
+        cache: Optional[GremlinReportCache] = cls._cache()
+        bodies: Dict[date, Any] = {}
+        if cache is not None:
+            bodies = cache.load(scope, report, period, chunks[0][0], chunks[-1][0])
+            # Only periods which have ended are immutable
+            bodies = {
+                chunk_start: body
+                for chunk_start, body in bodies.items()
+                if period_bounds(chunk_start, period)[1] < today
+            }
+        fetched: Dict[date, Any]
+        errors: List[Exception]
+        missing: List[Tuple[date, date]] = [
+            chunk for chunk in chunks if chunk[0] not in bodies
+        ]
+        result: GremlinReportResult = GremlinReportResult(report, period, [])
+        result.cached = len(chunks) - len(missing)
+        result.fetched = len(missing)
+        if missing:
+            fetched, errors = cls._fetch_chunks(
+                report, period, missing, team_id, concurrency, https_client
+            )
+            bodies.update(fetched)
+            # Periods fetched before a failure are kept for the next attempt
+            if cache is not None:
+                cache.store(
+                    scope,
+                    report,
+                    period,
+                    [
+                        (chunk_start, chunk_end, fetched[chunk_start])
+                        for chunk_start, chunk_end in missing
+                        if chunk_end < today and chunk_start in fetched
+                    ],
+                )
+            if errors:
+                raise errors[0]
+        result.chunks = [
+            (chunk_start, chunk_end, bodies[chunk_start])
+            for chunk_start, chunk_end in chunks
+        ]
+        return result
+
+    @classmethod
+    def _fetch_chunks(
+        cls,
+        report: str,
+        period: str,
+        chunks: List[Tuple[date, date]],
+        team_id: Optional[str],
+        concurrency: int,
+        https_client: Type[GremlinAPIHttpClient],
+    ) -> Tuple[Dict[date, Any], List[Exception]]:
+        """Bodies by first day of the periods fetched, and the failures"""
+        action, (start_param, end_param), sends_period = REPORTS[report]
+        kwargs: dict = {"teamId": team_id} if team_id else {}
+        if sends_period:
+            kwargs["period"] = period
+        bodies: Dict[date, Any] = {}
+        errors: List[Exception] = []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as pool:
+            # Each worker runs in a copy of this context, so calls made inside a
+            # GremlinClient use that client's settings
+            futures: dict = {
+                pool.submit(
+                    contextvars.copy_context().run,
+                    action,
+                    https_client,
+                    **{
+                        start_param: chunk_start.isoformat(),
+                        end_param: chunk_end.isoformat(),
+                    },
+                    **kwargs,
+                ): chunk_start
+                for chunk_start, chunk_end in chunks
+            }
+            for future in as_completed(futures):
+                try:
+                    bodies[futures[future]] = future.result()
+                except Exception as e:
+                    log.warning(f"report_{report} failed for {futures[future]}: {e}")
+                    errors.append(e)
+        return bodies, errors
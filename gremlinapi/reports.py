@@ -15,7 +15,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -30,122 +30,129 @@ log = logging.getLogger("GremlinAPI.client")
 class GremlinAPIReports(GremlinAPI):
     @classmethod
     @register_cli_action("report_attacks", ("",), ("start", "end", "period", "teamId"))
+    @api_endpoint
     def report_attacks(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["start", "end", "period"]
         endpoint: str = cls._build_query_string_option_team_endpoint(
             "/reports/attacks", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("report_clients", ("",), ("start", "end", "period", "teamId"))
+    @api_endpoint
     def report_clients(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["start", "end", "period"]
         endpoint: str = cls._build_query_string_option_team_endpoint(
             "/reports/clients", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action(
         "report_companies", ("",), ("start", "end", "period", "teamId")
     )
+    @api_endpoint
     def report_companies(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["startDate", "endDate"]
         endpoint: str = cls._build_query_string_endpoint(
             "/reports/companies", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
+    @api_endpoint
     def report_pricing(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["startDate", "endDate", "trackingPeriod"]
         endpoint: str = cls._build_query_string_endpoint(
             "/reports/pricing", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("report_teams", ("",), ("start", "end", "period", "teamId"))
+    @api_endpoint
     def report_teams(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["startDate", "endDate"]
         endpoint: str = cls._build_query_string_option_team_endpoint(
             "/reports/teams", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("report_users", ("",), ("start", "end", "period", "teamId"))
+    @api_endpoint
     def report_users(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["start", "end", "period"]
         endpoint: str = cls._build_query_string_option_team_endpoint(
             "/reports/users", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
 class GremlinAPIReportsSecurity(GremlinAPI):
     @classmethod
     @register_cli_action("report_security_access", ("start", "end"), ("",))
+    @api_endpoint
     def report_security_access(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         params: list = ["start", "end"]
         endpoint: str = cls._build_query_string_endpoint(
             "/reports/security/access", params, **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
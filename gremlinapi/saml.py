@@ -15,7 +15,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -31,12 +31,13 @@ log = logging.getLogger("GremlinAPI.client")
 
 class GremlinAPISaml(GremlinAPI):
     @classmethod
+    @api_endpoint
     def acs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> Union[HTTPResponse, Any]:
+    ) -> APISteps[Union[HTTPResponse, Any]]:
         method: str = "POST"
         endpoint: str = "/users/auth/saml/acs"
         data: dict = {
@@ -44,52 +45,55 @@ class GremlinAPISaml(GremlinAPI):
             "RelayState": cls._error_if_not_param("RelayState", **kwargs),
         }
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return resp
 
     @classmethod
     @register_cli_action(
         "samllogin", ("companyName", "destination", "acsHandler"), ("",)
     )
+    @api_endpoint
     def samllogin(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         params: list = ["companyName", "destination", "acsHandler"]
         method: str = "GET"
         endpoint: str = cls._build_query_string_endpoint(
             "/users/auth/saml/login", params, **kwargs
         )
         payload: dict = cls._payload()
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("metadata", ("",), ("",))
+    @api_endpoint
     def metadata(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = "/users/auth/saml/metadata"
         payload: dict = cls._payload()
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
+    @api_endpoint
     def sessions(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         endpoint: str = "/users/auth/saml/sessions"
         data: dict = {"code": cls._error_if_not_param("code", **kwargs)}
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
@@ -6,7 +6,9 @@ import inspect
 import json
 import logging
 import uuid
-from typing import Union, Optional, Tuple
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Dict, IO, Iterator, List, Union, Optional, Set, Tuple
 
 from gremlinapi.exceptions import (
     GremlinCommandTargetError,
@@ -18,9 +20,10 @@ from gremlinapi.config import GremlinAPIConfig as config
 from gremlinapi.attack_helpers import (
     GremlinAttackCommandHelper,
     GremlinAttackTargetHelper,
+    _GremlinRevisionedHelper,
 )
 from gremlinapi.util import deprecated, MAX_NODE_COUNT, MAX_BLAST_RADIUS
-from gremlinapi.clients import GremlinAPIClients as clients
+from gremlinapi.clients import client_inventory
 from gremlinapi.containers import GremlinAPIContainers as containers
 from gremlinapi.providers import GremlinAPIProviders as providers
 
@@ -70,9 +73,48 @@ class GremlinScenarioNode(object):
             raise GremlinParameterError(error_msg)
         self._edges[_node.id] = {"node": _node, "weight": _weight}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any assignment, including through a property setter, may change the
+        # api_model, so it drops the model cached by `data`
+        if name != "_model_cache":
+            self.__dict__["_model_cache"] = None
+        super().__setattr__(name, value)
+        if name in ("target", "_target"):
+            self._target_replaced()
+
+    def _target_replaced(self) -> None:
+        # Watches the new target helper in place of the old one, and has the
+        # graphs holding this node match its targets again
+        target: Any = getattr(self, "target", None)
+        watched: Any = self.__dict__.get("_watched_target")
+        if target is not watched:
+            if isinstance(watched, _GremlinRevisionedHelper):
+                watched._unwatch(self)
+            if isinstance(target, _GremlinRevisionedHelper):
+                target._watch(self)
+            self.__dict__["_watched_target"] = target
+        self._helper_changed(target)
+
+    def _helper_changed(self, helper: Any) -> None:
+        for graph in list(self.__dict__.get("_graphs", ())):
+            graph._uncounted[self] = None
+
+    def _model_key(self) -> tuple:
+        """Revisions of the helpers this node's api_model depends on"""
+        return ()
+
     @property
     def data(self) -> dict:
-        return self.api_model()
+        """
+        A shallow copy of api_model(), which is cached until an attribute of
+        this node, or of its attack helpers, is assigned.
+        """
+        key: tuple = self._model_key()
+        cache: Optional[Tuple[tuple, dict]] = self.__dict__.get("_model_cache")
+        if cache is None or cache[0] != key:
+            cache = (key, self.api_model())
+            self.__dict__["_model_cache"] = cache
+        return dict(cache[1])
 
     @property
     def id(self) -> str:
@@ -235,7 +277,7 @@ class GremlinScenarioGraphHelper(object):
             if not self._nodes.head:
                 _default_edge = False
             if _default_edge:
-                tail_node = self._nodes._nodes[-1]
+                tail_node = self._nodes.tail()
             self._nodes.append(node)
             if _default_edge:
                 self.add_edge(node, tail_node)
@@ -262,7 +304,7 @@ class GremlinScenarioGraphHelper(object):
             self._nodes.remove(node)
 
     def get_last_node(self) -> GremlinScenarioNode:
-        return self._nodes._nodes[-1]
+        return self._nodes.tail()
 
     def add_edge(
         self,
@@ -407,13 +449,16 @@ class GremlinScenarioGraphHelper(object):
             raise GremlinParameterError(error_msg)
         self._name = _name
 
-    def api_model(self) -> dict:
-        log.debug("in api_model")
-        model: dict = {
+    def _model_fields(self) -> dict:
+        return {
             "description": self.description,
             "hypothesis": self.hypothesis,
             "name": self.name,
         }
+
+    def api_model(self) -> dict:
+        log.debug("in api_model")
+        model: dict = self._model_fields()
         if not self.continuous_nodes:
             log.debug("no continuous nodes")
             if self._nodes.head is not None:
@@ -438,12 +483,63 @@ class GremlinScenarioGraphHelper(object):
             )
         return model
 
+    def iterencode(self) -> Iterator[str]:
+        """
+        Encodes api_model() as JSON, yielding each node as the graph is
+        walked instead of building the whole model first. The text is that of
+        json.dumps(self.api_model()) for a linear graph.
+        """
+        encoder: json.JSONEncoder = json.JSONEncoder()
+        model: dict = self._model_fields()
+        if not self.continuous_nodes:
+            if self._nodes.head is None:
+                yield from encoder.iterencode(model)
+                return
+            yield encoder.encode(model)[:-1]
+            yield ', "graph": {"start_id": "0", "nodes": '
+            yield from self._iterencode_nodes(encoder, self._nodes.iter_nodes_linear())
+            yield "}}"
+            return
+        yield encoder.encode(model)[:-1]
+        yield ', "graph": {"start_id": "concurrentNode", "nodes": {"concurrentNode": '
+        concurrent: dict = self.get_nodes_parallel()["concurrentNode"]
+        # branches is the last key, the linear branch is appended to it
+        yield encoder.encode(concurrent)[:-2]
+        yield ', {"nodes": ' if concurrent["branches"] else '{"nodes": '
+        yield from self._iterencode_nodes(
+            encoder,
+            self._nodes.iter_nodes_linear(branch_id=len(self.continuous_nodes)),
+        )
+        yield ', "start_id": "0"}]}}}}'
+
+    @staticmethod
+    def _iterencode_nodes(
+        encoder: json.JSONEncoder, nodes: Iterator[Tuple[str, dict]]
+    ) -> Iterator[str]:
+        separator: str = "{"
+        for (index, data) in nodes:
+            yield "%s%s: " % (separator, encoder.encode(index))
+            yield from encoder.iterencode(data)
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+
+    def dump(self, fp: IO[str]) -> None:
+        """Writes api_model() as JSON to the file like object fp"""
+        for chunk in self.iterencode():
+            fp.write(chunk)
+
     def total_nodes(self) -> int:
         return self._nodes.total_nodes() + self.continuous_nodes.__len__()
 
     def total_targets(self) -> int:
         return self._nodes.total_targets()
 
+    def longest_path(self) -> Tuple[str, str, int]:
+        return self._nodes.longest_path()
+
+    def topological_order(self) -> list:
+        return self._nodes.topological_order()
+
     def __repr__(self) -> str:
         kwargs: dict = {}
         kwargs["name"] = self.name
@@ -612,6 +708,12 @@ class GremlinScenarioILFINode(GremlinScenarioSerialNode):
         model["target_definition"] = self.target.target_definition_graph()
         return model
 
+    def _model_key(self) -> tuple:
+        return (
+            getattr(self._command, "_revision", None),
+            getattr(self._target, "_revision", None),
+        )
+
     @property
     def target(self) -> GremlinAttackTargetHelper:
         return self._target
@@ -831,7 +933,17 @@ class GremlinScenarioStatusCheckNode(GremlinScenarioSerialNode):
 class _GremlinNodeGraph(object):
     def __init__(self):
         self._head: GremlinScenarioNode = None  # type: ignore
-        self._nodes: list = []
+        # Nodes by id, in the order they were added
+        self._node_index: "OrderedDict[str, GremlinScenarioNode]" = OrderedDict()
+        # Directed adjacency maps of the edges added through this graph, from
+        # node_left to node_right, holding the edge weight
+        self._successors: Dict[str, Dict[str, Any]] = {}
+        self._predecessors: Dict[str, Dict[str, Any]] = {}
+        # Blast radius accounting, see total_targets
+        self._node_targets: Dict[GremlinScenarioNode, Set[str]] = {}
+        self._target_refs: Dict[str, int] = {}
+        self._uncounted: Dict[GremlinScenarioNode, None] = {}
+        self._targets_generation: Optional[int] = None
 
     def add_edge(
         self,
@@ -860,6 +972,8 @@ class _GremlinNodeGraph(object):
         self._validate_type(node_right)
         node_left.add_edge(node_right, _weight)
         node_right.add_edge(node_left, _weight)
+        self._successors.setdefault(node_left.id, {})[node_right.id] = _weight
+        self._predecessors.setdefault(node_right.id, {})[node_left.id] = _weight
 
     def remove_edge(
         self,
@@ -885,6 +999,12 @@ class _GremlinNodeGraph(object):
         self._validate_type(node_right)
         node_left._edges.pop(node_right.id)
         node_right._edges.pop(node_left.id)
+        self._unlink(node_left.id, node_right.id)
+        self._unlink(node_right.id, node_left.id)
+
+    def _unlink(self, left_id: str, right_id: str) -> None:
+        self._successors.get(left_id, {}).pop(right_id, None)
+        self._predecessors.get(right_id, {}).pop(left_id, None)
 
     def append(self, new_node: GremlinScenarioNode) -> None:
         """
@@ -905,7 +1025,9 @@ class _GremlinNodeGraph(object):
         self._validate_type(new_node)
         if self.head is None:
             self.head = new_node
-        self._nodes.append(new_node)
+        self._node_index[new_node.id] = new_node
+        new_node.__dict__.setdefault("_graphs", weakref.WeakSet()).add(self)
+        self._uncounted[new_node] = None
 
     def get_node(self, uid: str) -> Optional[GremlinScenarioNode]:
         """
@@ -916,10 +1038,17 @@ class _GremlinNodeGraph(object):
         uid : str
             Node id to retrieve from graph
         """
-        for node in self._nodes:
-            if node.id == uid:
-                return node
-        return None
+        return self._node_index.get(uid)
+
+    def tail(self) -> Optional[GremlinScenarioNode]:
+        """The most recently added node still in the graph"""
+        if not self._node_index:
+            return None
+        return self._node_index[next(reversed(self._node_index))]
+
+    @property
+    def _nodes(self) -> list:
+        return list(self._node_index.values())
 
     def get_nodes_linear(
         self,
@@ -929,10 +1058,27 @@ class _GremlinNodeGraph(object):
         next_index: int = 0,
     ) -> dict:
         """
-        Retrieves all nodes, ordered by their defined edges.
+        Retrieves all nodes, ordered by their defined edges, as a dict of the
+        (index, data) pairs from iter_nodes_linear.
+        """
+        return dict(self.iter_nodes_linear(branch_id, node, parent_id, next_index))
+
+    def iter_nodes_linear(
+        self,
+        branch_id: int = 0,
+        node: GremlinScenarioNode = None,
+        parent_id: str = None,
+        next_index: int = 0,
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Yields every node's index and data, ordered by their defined edges.
 
         Only will work for a linear-defined graph (node -> node_2 -> node_3)
 
+        Walks the graph depth first with an explicit stack, so the length of
+        the chain is not bound by the recursion limit, and reads each node's
+        cached `data`.
+
         Parameters
         ----------
         node : GremlinScenarioNode optional
@@ -943,29 +1089,50 @@ class _GremlinNodeGraph(object):
             Prevents recursion loops
         next_index : int optional
             The next index to use
+
+        Raises
+        ------
+        GremlinGraphError
+            If the graph loops back on a node already on the current path
         """
         if not self.head:
-            return {}
+            return
         if not node:
-            return self.get_nodes_linear(branch_id=branch_id, node=self.head)
+            node = self.head
         self._validate_type(node)
-        node.index = str(next_index)
-        node.next = str(next_index + 1)
-        nodes: dict = {str(next_index): node.data}
-        if branch_id > 0:
-            nodes[str(next_index)]["branchId"] = "concurrentNode-%d" % branch_id
-        for node_id in node._edges:
-            if node_id == parent_id:
+        on_path: Set[int] = set()
+        # Entries are (node, parent_id, index), or (node, None, None) to mark
+        # that every descendant of node has been visited
+        stack: List[Tuple[GremlinScenarioNode, Optional[str], Optional[int]]] = [
+            (node, parent_id, next_index)
+        ]
+        while stack:
+            (current, current_parent_id, index) = stack.pop()
+            if index is None:
+                on_path.discard(id(current))
                 continue
-            nodes.update(
-                self.get_nodes_linear(
-                    branch_id=branch_id,
-                    node=node._edges[node_id]["node"],
-                    parent_id=node.id,
-                    next_index=next_index + 1,
-                )
-            )
-        return nodes
+            if id(current) in on_path:
+                error_msg: str = f"Scenario graph contains a cycle through node {current.id}"
+                log.error(error_msg)
+                raise GremlinGraphError(error_msg)
+            on_path.add(id(current))
+            stack.append((current, None, None))
+            if current.index != str(index):
+                current.index = str(index)
+            if current.next != str(index + 1):
+                current.next = str(index + 1)
+            data: dict = current.data
+            if branch_id > 0:
+                data["branchId"] = "concurrentNode-%d" % branch_id
+            yield str(index), data
+            children: list = [
+                edge["node"]
+                for (node_id, edge) in current._edges.items()
+                if node_id != current_parent_id
+            ]
+            for child in reversed(children):
+                self._validate_type(child)
+                stack.append((child, current.id, index + 1))
 
     def insert_between(
         self,
@@ -973,37 +1140,188 @@ class _GremlinNodeGraph(object):
         node_left: GremlinScenarioNode,
         node_right: GremlinScenarioNode,
     ) -> None:
-        raise NotImplementedError("insert_between NOT IMPLEMENTED")
+        """
+        Replaces the edge between node_left and node_right with edges through
+        node, adding node to the graph if needed. The edge weight is kept on
+        both new edges.
+
+        Parameters
+        ----------
+        node : GremlinScenarioNode
+            Node to insert
+        node_left : GremlinScenarioNode
+            Source side of the existing edge
+        node_right : GremlinScenarioNode
+            Destination side of the existing edge
+
+        Raises
+        ------
+        GremlinGraphError
+            If there is no edge between node_left and node_right
+        """
+        self._validate_type(node)
+        self._validate_type(node_left)
+        self._validate_type(node_right)
+        if node_right.id not in node_left._edges:
+            error_msg: str = f"No edge between nodes {node_left.id} and {node_right.id}"
+            log.error(error_msg)
+            raise GremlinGraphError(error_msg)
+        _weight = node_left._edges[node_right.id]["weight"]
+        if node_right.id in self._predecessors.get(node_left.id, {}):
+            (node_left, node_right) = (node_right, node_left)
+        self.remove_edge(node_left, node_right)
+        if node.id not in self._node_index:
+            self.append(node)
+        self.add_edge(node_left, node, _weight)
+        self.add_edge(node, node_right, _weight)
 
     def total_nodes(self) -> int:
-        return self._nodes.__len__()
+        return self._node_index.__len__()
 
     def total_targets(self) -> int:
-        # Fetches all client containers from the cache
-        total_containers = clients.get_update_client_target_cache()
+        """
+        Counts the distinct containers matched by the label or tag selections
+        of every node.
+
+        Each node is matched against the label index of the client inventory
+        the first time this is called after the node is added, and again only
+        once its target is replaced or assigned to, which marks it as
+        uncounted. Its matches are reference counted so removing it is just
+        as cheap. Everything is recounted when the client inventory is
+        reloaded.
+
+        A label or tag value matches the containers whose label has exactly
+        that value; a single string value is treated as a one item list.
+        """
+        client_inventory.get()
+        if client_inventory.generation != self._targets_generation:
+            self._node_targets = {}
+            self._target_refs = {}
+            self._uncounted = dict.fromkeys(self._node_index.values())
+            self._targets_generation = client_inventory.generation
+        while self._uncounted:
+            node = next(iter(self._uncounted))
+            self._uncount_targets(node)
+            matched: Set[str] = self._matching_container_ids(node)
+            self._node_targets[node] = matched
+            for container_id in matched:
+                log.debug("Adding container id: %s" % container_id)
+                self._target_refs[container_id] = (
+                    self._target_refs.get(container_id, 0) + 1
+                )
+        return len(self._target_refs)
 
-        # Iterates over all nodes, collecting matching container ids
-        matching_container_ids = []
-        for node in self._nodes:
-            # Skips status check and delay nodes as they have no container target(s)
-            if issubclass(type(node), GremlinScenarioStatusCheckNode) or issubclass(type(node), GremlinScenarioDelayNode):
-                continue
-            targets = node.target.target_definition_graph().get('strategy',[]).get('attrs',[])
-            # Can only select Hosts *or* Containers, not both
-            labeltags = targets.get('multiSelectLabels', targets.get('multiSelectTags', {}))
-            for container in total_containers:
-                c_label = container.get('labels', {})
-                for s_lt in labeltags:
-                    if c_label.get(s_lt, "") in labeltags.get(s_lt, ""):
-                        if container.get('id', '') not in matching_container_ids:
-                            log.debug("Adding container id: %s" % container.get('id', ''))
-                            matching_container_ids.append(container.get('id', ''))
-                        # else:
-                        #     log.debug("Container id already added: %s" % container.get('id', ''))
-        return len(matching_container_ids)
+    def _matching_container_ids(self, node: GremlinScenarioNode) -> Set[str]:
+        # Skips status check and delay nodes as they have no container target(s)
+        if issubclass(type(node), GremlinScenarioStatusCheckNode) or issubclass(
+            type(node), GremlinScenarioDelayNode
+        ):
+            return set()
+        target = getattr(node, "target", None)
+        if target is None:
+            return set()
+        targets: dict = (
+            target.target_definition_graph().get("strategy", {}).get("attrs", {})
+        )
+        # Can only select Hosts *or* Containers, not both
+        labeltags: dict = targets.get(
+            "multiSelectLabels", targets.get("multiSelectTags", {})
+        )
+        matched: Set[str] = set()
+        for s_lt, values in labeltags.items():
+            if isinstance(values, str):
+                values = [values]
+            for value in values:
+                matched |= client_inventory.container_ids_with_label(s_lt, value)
+        return matched
+
+    def _uncount_targets(self, node: GremlinScenarioNode) -> None:
+        self._uncounted.pop(node, None)
+        for container_id in self._node_targets.pop(node, ()):
+            refs: int = self._target_refs[container_id] - 1
+            if refs:
+                self._target_refs[container_id] = refs
+            else:
+                del self._target_refs[container_id]
+
+    def _topological_sort(self) -> Tuple[List[GremlinScenarioNode], bool]:
+        # Kahn's algorithm over the directed adjacency maps, ties broken by
+        # the order nodes were added. Returns the sorted nodes and whether
+        # every node could be sorted, which is False when there is a cycle.
+        in_degree: Dict[str, int] = {
+            uid: len(self._predecessors.get(uid, {})) for uid in self._node_index
+        }
+        ready: deque = deque(uid for (uid, degree) in in_degree.items() if not degree)
+        order: List[GremlinScenarioNode] = []
+        while ready:
+            uid: str = ready.popleft()
+            order.append(self._node_index[uid])
+            for successor_id in self._successors.get(uid, {}):
+                in_degree[successor_id] -= 1
+                if not in_degree[successor_id]:
+                    ready.append(successor_id)
+        return (order, len(order) == len(self._node_index))
+
+    def has_cycle(self) -> bool:
+        """True if the edges added through this graph form a directed cycle"""
+        return not self._topological_sort()[1]
+
+    def topological_order(self) -> List[GremlinScenarioNode]:
+        """
+        Every node, ordered so that each edge points from an earlier node to a
+        later one. Runs in O(nodes + edges).
+
+        Raises
+        ------
+        GremlinGraphError
+            If the graph contains a cycle
+        """
+        (order, complete) = self._topological_sort()
+        if not complete:
+            error_msg: str = f"Scenario graph contains a cycle, it has no topological order"
+            log.error(error_msg)
+            raise GremlinGraphError(error_msg)
+        return order
+
+    @staticmethod
+    def _node_duration(node: GremlinScenarioNode) -> int:
+        """Seconds a node runs for, the delay of a delay node or the length of an attack"""
+        if issubclass(type(node), GremlinScenarioDelayNode):
+            return int(node.delay or 0)
+        command = getattr(node, "command", None)
+        if command is not None:
+            return int(getattr(command, "length", 0) or 0)
+        return 0
 
     def longest_path(self) -> Tuple[str, str, int]:
-        raise NotImplementedError("longest_path NOT IMPLEMENTED")
+        """
+        Finds the critical path of the scenario, the chain of nodes with the
+        greatest total duration, in O(nodes + edges).
+
+        Returns
+        -------
+        tuple
+            The id of the first and last node on the path and its duration in
+            seconds, or empty ids and 0 for an empty graph
+
+        Raises
+        ------
+        GremlinGraphError
+            If the graph contains a cycle
+        """
+        best: Dict[str, Tuple[int, str]] = {}
+        longest: Tuple[str, str, int] = ("", "", 0)
+        for node in self.topological_order():
+            (duration, start_id) = max(
+                (best[uid] for uid in self._predecessors.get(node.id, {})),
+                key=lambda path: path[0],
+                default=(0, node.id),
+            )
+            duration += self._node_duration(node)
+            best[node.id] = (duration, start_id)
+            if duration > longest[2] or not longest[0]:
+                longest = (start_id, node.id, duration)
+        return longest
 
     @deprecated("Use add_edge instead")
     def insert_after(
@@ -1077,7 +1395,13 @@ class _GremlinNodeGraph(object):
             for node_id in _node._edges:
                 _node._edges[node_id]["node"]._edges.pop(_node.id)
             _node._edges = {}
-            self._nodes.remove(_node)
+            for successor_id in self._successors.pop(_node.id, {}):
+                self._predecessors.get(successor_id, {}).pop(_node.id, None)
+            for predecessor_id in self._predecessors.pop(_node.id, {}):
+                self._successors.get(predecessor_id, {}).pop(_node.id, None)
+            del self._node_index[_node.id]
+            _node.__dict__.get("_graphs", set()).discard(self)
+            self._uncount_targets(_node)
 
     @property
     def head(self) -> GremlinScenarioNode:
@@ -1091,13 +1415,27 @@ class _GremlinNodeGraph(object):
         self._head = node
 
     def _validate_type(self, _node: GremlinScenarioNode) -> bool:
-        _caller = inspect.stack()[2][3]
         if not issubclass(type(_node), GremlinScenarioNode):
+            # Only name the caller once validation fails, walking the stack is
+            # far more expensive than the check itself
+            _caller = self._caller_name()
             error_msg: str = f"{_caller} expects node to be a subclass of GremlinScenarioNode, received {type(_node)}"
             log.error(error_msg)
             raise GremlinParameterError(error_msg)
         return True
 
+    @staticmethod
+    def _caller_name(depth: int = 3) -> str:
+        """Name of the function `depth` frames above this one"""
+        frame = inspect.currentframe()
+        for _ in range(depth):
+            if frame is None:
+                return "<unknown>"
+            frame = frame.f_back
+        if frame is None:
+            return "<unknown>"
+        return frame.f_code.co_name
+
     def api_model(self) -> dict:
         model: dict = {}
         return model
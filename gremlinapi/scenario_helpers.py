@@ -49,7 +49,7 @@ class GremlinScenarioHelper(object):
             error_msg: str = f"The step must extend from {type(GremlinScenarioStep)}"
             log.error(error_msg)
             raise GremlinParameterError(error_msg)
-        _cur_step_obj: dict = json.loads(str(_step))
+        _cur_step_obj: dict = _step.api_model()
         if len(self._steps) > 0:
             if log.getEffectiveLevel() == logging.DEBUG:
                 log.debug("checking last step")
@@ -125,17 +125,20 @@ class GremlinScenarioHelper(object):
         log.warning(error_msg)
         raise NotImplementedError(error_msg)
 
-    @deprecated(
-        "GremlinScenarioHelper class is deprecated, plesae use GremlinScenarioGraphHelper instead"
-    )
-    def __repr__(self) -> str:
+    def api_model(self) -> dict:
         model: dict = {
             "description": self.description,
             "hypothesis": self.hypothesis,
             "name": self.name,
             "steps": self.steps,
         }
-        return json.dumps(model)
+        return model
+
+    @deprecated(
+        "GremlinScenarioHelper class is deprecated, plesae use GremlinScenarioGraphHelper instead"
+    )
+    def __repr__(self) -> str:
+        return json.dumps(self.api_model())
 
 
 class GremlinScenarioStep(object):
@@ -163,12 +166,15 @@ class GremlinScenarioStep(object):
             log.error(error_msg)
             raise GremlinParameterError(error_msg)
 
+    def api_model(self) -> dict:
+        model: dict = {"delay": self.delay}
+        return model
+
     @deprecated(
         "GremlinScenarioStep class is deprecated, plesae use GremlinScenarioGraphHelper instead"
     )
     def __repr__(self) -> str:
-        model: dict = {"delay": self.delay}
-        return json.dumps(model)
+        return json.dumps(self.api_model())
 
 
 class GremlinILFIStep(GremlinScenarioStep):
@@ -212,11 +218,8 @@ class GremlinILFIStep(GremlinScenarioStep):
             log.error(error_msg)
             raise GremlinParameterError(error_msg)
 
-    @deprecated(
-        "GremlinILFIStep class is deprecated, plesae use GremlinScenarioGraphHelper instead"
-    )
-    def __repr__(self) -> str:
-        model: dict = json.loads(super().__repr__())
+    def api_model(self) -> dict:
+        model: dict = super().api_model()
         model["attacks"] = [
             {
                 "attackType": "ILFI",
@@ -225,7 +228,13 @@ class GremlinILFIStep(GremlinScenarioStep):
             }
         ]
         model["id"] = str(uuid.uuid3(uuid.NAMESPACE_X500, str(model["attacks"])))
-        return json.dumps(model)
+        return model
+
+    @deprecated(
+        "GremlinILFIStep class is deprecated, plesae use GremlinScenarioGraphHelper instead"
+    )
+    def __repr__(self) -> str:
+        return json.dumps(self.api_model())
 
 
 class GremlinALFIStep(GremlinScenarioStep):
@@ -246,5 +255,4 @@ class GremlinALFIStep(GremlinScenarioStep):
         "GremlinALFIStep class is deprecated, plesae use GremlinScenarioGraphHelper instead"
     )
     def __repr__(self) -> str:
-        model: dict = json.loads(super().__repr__())
-        return json.dumps(model)
+        return json.dumps(self.api_model())
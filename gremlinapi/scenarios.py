@@ -13,14 +13,15 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from typing import Union, Type
+from typing import Union, Type, Iterator
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
 )
 from gremlinapi.scenario_graph_helpers import GremlinScenarioGraphHelper
+from gremlinapi.scenario_helpers import GremlinScenarioHelper
 
 
 log = logging.getLogger("GremlinAPI.client")
@@ -31,10 +32,10 @@ class GremlinAPIScenarios(GremlinAPI):
     def _error_if_not_scenario_body(
         cls,
         **kwargs: dict,
-    ) -> str:
+    ) -> Union[dict, str]:
         body: GremlinScenarioGraphHelper = cls._error_if_not_param("body", **kwargs)  # type: ignore
-        if issubclass(type(body), GremlinScenarioGraphHelper):
-            return str(body)
+        if issubclass(type(body), (GremlinScenarioGraphHelper, GremlinScenarioHelper)):
+            return body.api_model()
         else:
             error_msg: str = (
                 f"Body present but not of type {type(GremlinScenarioGraphHelper)}"
@@ -44,96 +45,102 @@ class GremlinAPIScenarios(GremlinAPI):
 
     @classmethod
     @register_cli_action("list_scenarios", ("",), ("teamId",))
+    @api_endpoint
     def list_scenarios(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint("/scenarios", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("create_scenario", ("body",), ("teamId",))
+    @api_endpoint
     def create_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
-        data: str = cls._error_if_not_scenario_body(**kwargs)
+        data: Union[dict, str] = cls._error_if_not_scenario_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint("/scenarios", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})  # type: ignore
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_scenario", ("guid",), ("teamId",))
+    @api_endpoint
     def get_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("update_scenario", ("guid", "body"), ("teamId",))
+    @api_endpoint
     def update_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         data: dict = cls._error_if_not_json_body(**kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/{guid}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("archive_scenario", ("guid",), ("teamId",))
+    @api_endpoint
     def archive_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/scenarios/{guid}/archive", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("restore_scenario", ("guid",), ("teamId",))
+    @api_endpoint
     def restore_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/scenarios/{guid}/restore", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -146,12 +153,13 @@ class GremlinAPIScenarios(GremlinAPI):
             "teamId",
         ),
     )
+    @api_endpoint
     def list_scenario_runs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         timeset: str = ""
@@ -165,7 +173,7 @@ class GremlinAPIScenarios(GremlinAPI):
             f"/scenarios/{guid}/runs/?{timeset}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -178,12 +186,13 @@ class GremlinAPIScenarios(GremlinAPI):
             "teamId",
         ),
     )
+    @api_endpoint
     def list_scenarios_runs(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         timeset: str = ""
         state_query: str = ""
@@ -196,13 +205,31 @@ class GremlinAPIScenarios(GremlinAPI):
             timeset += f"endDate={end}"
         if state:
             state_query += f"&state={state}"
-        endpoint: str = cls._optional_team_endpoint(
+        endpoint: str = cls._optional_page_endpoint(
             f"/scenarios/runs/?{timeset}{state_query}", **kwargs
         )
+        endpoint = cls._optional_team_endpoint(endpoint, **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
+    @classmethod
+    def iter_scenarios_runs(
+        cls,
+        https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
+        prefetch: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Yields scenario runs one at a time, following page tokens as needed.
+
+        :param prefetch: request the next page in the background
+        :param kwargs: { startDate, endDate, state, pageSize, teamId }
+        """
+        yield from cls._iter_pages(
+            cls.list_scenarios_runs, https_client, prefetch, **kwargs
+        )
+
     @classmethod
     @register_cli_action(
         "run_scenario",
@@ -212,18 +239,19 @@ class GremlinAPIScenarios(GremlinAPI):
             "body",
         ),
     )
+    @api_endpoint
     def run_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         data: dict = cls._warn_if_not_json_body(**kwargs, default=dict())
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/{guid}/runs", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -235,12 +263,13 @@ class GremlinAPIScenarios(GremlinAPI):
         ),
         ("teamId",),
     )
+    @api_endpoint
     def get_scenario_run_details(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         run_number: int = cls._error_if_not_param("runNumber", **kwargs)  # type: ignore
@@ -248,7 +277,7 @@ class GremlinAPIScenarios(GremlinAPI):
             f"/scenarios/{guid}/runs/{run_number}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -261,12 +290,13 @@ class GremlinAPIScenarios(GremlinAPI):
         ),
         ("teamId",),
     )
+    @api_endpoint
     def update_scenario_result_flags(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         run_number: int = cls._error_if_not_param("runNumber", **kwargs)  # type: ignore
@@ -275,7 +305,7 @@ class GremlinAPIScenarios(GremlinAPI):
             f"/scenarios/{guid}/runs/{run_number}/resultFlags", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -288,12 +318,13 @@ class GremlinAPIScenarios(GremlinAPI):
         ),
         ("teamId",),
     )
+    @api_endpoint
     def update_scenario_result_notes(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         run_number: int = cls._error_if_not_param("runNumber", **kwargs)  # type: ignore
@@ -303,77 +334,82 @@ class GremlinAPIScenarios(GremlinAPI):
         )
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
         # Content-Type must be text/plain for this endpoint
-        payload['headers']['Content-Type'] = 'text/plain'
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        payload["headers"] = {**payload["headers"], "Content-Type": "text/plain"}
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_scenario_schedules", ("guid",), ("teamId",))
+    @api_endpoint
     def list_scenario_schedules(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/scenarios/{guid}/schedules", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_active_scenarios", ("",), ("teamId",))
+    @api_endpoint
     def list_active_scenarios(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/active", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_archived_scenarios", ("",), ("teamId",))
+    @api_endpoint
     def list_archived_scenarios(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/archived", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_draft_scenarios", ("",), ("teamId",))
+    @api_endpoint
     def list_draft_scenarios(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/drafts", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("halt_scenario", ("guid", "runNumber"), ("teamId",))
+    @api_endpoint
     def halt_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         run_number: int = cls._error_if_not_param("runNumber", **kwargs)  # type: ignore
@@ -381,52 +417,55 @@ class GremlinAPIScenarios(GremlinAPI):
             f"/scenarios/halt/{guid}/runs/{run_number}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
 class GremlinAPIScenariosRecommended(GremlinAPI):
     @classmethod
     @register_cli_action("list_recommended_scenarios", ("",), ("teamId",))
+    @api_endpoint
     def list_recommended_scenarios(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/scenarios/recommended", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_recommended_scenario", ("guid",), ("teamId",))
+    @api_endpoint
     def get_recommended_scenario(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         guid: str = cls._error_if_not_param("guid", **kwargs)
         endpoint: str = cls._optional_team_endpoint(
             f"/scenarios/recommended/{guid}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action(
         "get_recommended_scenario_static", ("staticEndpointName",), ("teamId",)
     )
+    @api_endpoint
     def get_recommended_scenario_static(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         static_endpoint_name: str = cls._error_if_not_param(
             "staticEndpointName", **kwargs
@@ -435,5 +474,5 @@ class GremlinAPIScenariosRecommended(GremlinAPI):
             f"/scenarios/recommended/static/{static_endpoint_name}", **kwargs
         )
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
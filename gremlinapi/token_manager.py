@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 Kyle Hultman <kyle@gremlin.com>, Gremlin Inc <sales@gremlin.com>
+
+import contextvars
+import logging
+import threading
+
+from datetime import datetime, timedelta, timezone
+
+from gremlinapi.config import GremlinAPIConfig, scoped_state
+
+from typing import Any, Callable, Optional
+
+log = logging.getLogger("GremlinAPI.client")
+
+# Set while a refresher runs, so a 401 on the login itself is not answered
+# with another refresh
+_refreshing: contextvars.ContextVar = contextvars.ContextVar(
+    "gremlinapi_token_refreshing", default=False
+)
+
+
+class _GremlinAPITokenState(object):
+    def __init__(self):
+        self.refresher: Optional[Callable[[], Any]] = None
+        self.lock: threading.Lock = threading.Lock()
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.refresh_stop: threading.Event = threading.Event()
+
+
+class GremlinAPITokenManager(object):
+    """
+    Keeps the bearer token in GremlinAPIConfig fresh for long running processes.
+
+    Once started with a refresher, a callable that logs in again and stores
+    the new token in GremlinAPIConfig, a daemon thread renews the token
+    `bearer_refresh_margin` seconds before `bearer_expires`, or before
+    `bearer_timestamp` + `max_bearer_interval` when that comes first.
+
+    Refreshes are serialized: callers that find the token they used already
+    replaced wait for the in-flight refresh and reuse its result, so a burst
+    of 401 responses across threads logs in once. The http clients replay a
+    request once after a 401 while the manager is running, except requests
+    made by the refresher itself. Each GremlinClient runs its own manager.
+    """
+
+    _default_state: _GremlinAPITokenState = _GremlinAPITokenState()
+    # Longest the background thread sleeps before checking the expiry again,
+    # which also spaces out attempts after a failed refresh
+    poll_interval: float = 30.0
+
+    @classmethod
+    def _setting(cls, name: str) -> Any:
+        value: Any = getattr(GremlinAPIConfig, name, None)
+        if isinstance(value, property):
+            return None
+        return value
+
+    @classmethod
+    def _state(cls) -> _GremlinAPITokenState:
+        return scoped_state(
+            GremlinAPITokenManager, cls._default_state, _GremlinAPITokenState
+        )
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._state().refresher is not None
+
+    @classmethod
+    def expires_at(cls) -> Optional[datetime]:
+        """When the current token stops being usable, None when unknown"""
+        deadlines: list = []
+        expires: Any = cls._setting("bearer_expires")
+        if isinstance(expires, datetime):
+            deadlines.append(expires)
+        timestamp: Any = cls._setting("bearer_timestamp")
+        interval: Any = cls._setting("max_bearer_interval")
+        if isinstance(timestamp, datetime) and interval:
+            deadlines.append(timestamp + timedelta(seconds=float(interval)))
+        return min(deadlines) if deadlines else None
+
+    @classmethod
+    def seconds_until_refresh(cls) -> Optional[float]:
+        expires: Optional[datetime] = cls.expires_at()
+        if expires is None:
+            return None
+        margin: float = float(cls._setting("bearer_refresh_margin") or 0)
+        return (expires - datetime.now(timezone.utc)).total_seconds() - margin
+
+    @classmethod
+    def refresh(cls, stale_token: Any = None) -> Any:
+        """
+        Runs the refresher and returns the new bearer token. When `stale_token`
+        is given and the configured token has already moved past it, the
+        current token is returned without logging in again.
+        """
+        state: _GremlinAPITokenState = cls._state()
+        refresher: Optional[Callable[[], Any]] = state.refresher
+        if refresher is None:
+            error_msg: str = "The token manager has no refresher, call start() first"
+            log.error(error_msg)
+            raise ValueError(error_msg)
+        with state.lock:
+            if (
+                stale_token is not None
+                and GremlinAPIConfig.bearer_token != stale_token
+            ):
+                return GremlinAPIConfig.bearer_token
+            if log.getEffectiveLevel() == logging.DEBUG:
+                log.debug("Refreshing bearer token")
+            token: contextvars.Token = _refreshing.set(True)
+            try:
+                refresher()
+            finally:
+                _refreshing.reset(token)
+            return GremlinAPIConfig.bearer_token
+
+    @classmethod
+    def replay_unauthorized(cls, stale_token: Any) -> bool:
+        """
+        Called by the http clients after a 401, True when a fresh token is now
+        configured and the request should be sent again
+        """
+        if not cls.is_running() or _refreshing.get():
+            return False
+        try:
+            return cls.refresh(stale_token) != stale_token
+        except Exception as e:
+            log.warning(f"Bearer token refresh after 401 failed: {e}")
+            return False
+
+    @classmethod
+    def start(cls, refresher: Callable[[], Any]) -> None:
+        """Registers the refresher and starts renewing the token in the background"""
+        cls.stop()
+        state: _GremlinAPITokenState = cls._state()
+        state.refresher = refresher
+        stop: threading.Event = threading.Event()
+        state.refresh_stop = stop
+
+        def _refresh_loop() -> None:
+            while True:
+                wait: Optional[float] = cls.seconds_until_refresh()
+                if wait is not None and wait <= 0:
+                    try:
+                        cls.refresh(GremlinAPIConfig.bearer_token)
+                        wait = cls.seconds_until_refresh()
+                    except Exception as e:
+                        log.warning(f"Background bearer token refresh failed: {e}")
+                        wait = None
+                if wait is None or wait <= 0:
+                    wait = cls.poll_interval
+                if stop.wait(min(wait, cls.poll_interval)):
+                    return
+
+        # The copied context keeps the thread in the caller's GremlinClient
+        state.refresh_thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_refresh_loop,),
+            name=f"{cls.__name__}-refresh",
+            daemon=True,
+        )
+        state.refresh_thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        state: _GremlinAPITokenState = cls._state()
+        state.refresh_stop.set()
+        if state.refresh_thread:
+            state.refresh_thread.join()
+            state.refresh_thread = None
+        state.refresher = None
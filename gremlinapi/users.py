@@ -15,7 +15,7 @@ from gremlinapi.exceptions import (
     HTTPError,
 )
 
-from gremlinapi.gremlinapi import GremlinAPI
+from gremlinapi.gremlinapi import GremlinAPI, APISteps, api_endpoint
 from gremlinapi.http_clients import (
     get_gremlin_httpclient,
     GremlinAPIHttpClient,
@@ -39,121 +39,129 @@ class GremlinAPIUsers(GremlinAPI):
 
     @classmethod
     @register_cli_action("list_user", ("",), ("teamId",))
+    @api_endpoint
     def list_users(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/users", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("add_user_to_team", ("body",), ("teamId",))
+    @api_endpoint
     def add_user_to_team(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: Union[list, dict] = cls._error_if_not_json_body(**kwargs)
         if isinstance(data, dict):
             data = [dict(data)]
         endpoint: str = cls._optional_team_endpoint(f"/users", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})  # type: ignore
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("update_user", ("email", "role"), ("teamId",))
+    @api_endpoint
     def update_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PUT"
         email: str = cls._error_if_not_email(**kwargs)
         role: str = cls._error_if_not_valid_role_statement(**kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/users/{email}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": role})  # type: ignore
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("deactivate_user", ("email",), ("teamId",))
+    @api_endpoint
     def deactivate_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/users/{email}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("list_active_user", ("",), ("teamId",))
+    @api_endpoint
     def list_active_users(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = cls._optional_team_endpoint(f"/users/active", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("invite_user", ("email",), ("teamId",))
+    @api_endpoint
     def invite_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/users/invite", **kwargs)
         data: dict = {"email": email}
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("revoke_user_invite", ("email",), ("teamId",))
+    @api_endpoint
     def revoke_user_invite(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = cls._optional_team_endpoint(f"/users/invite/{email}", **kwargs)
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action(
         "renew_user_authorization", ("email", "orgId", "renewToken"), ("",)
     )
+    @api_endpoint
     def renew_user_authorization(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         email: str = cls._error_if_not_email(**kwargs)
         org_id: str = kwargs.get("orgId", None)  # type: ignore
@@ -169,7 +177,7 @@ class GremlinAPIUsers(GremlinAPI):
         data: dict = {"email": email, "orgId": org_id, "renewToken": renew_token}
         endpoint: str = f"/users/renew"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -178,12 +186,13 @@ class GremlinAPIUsers(GremlinAPI):
         ("email", "companyId", "teamId", "renewToken"),
         ("",),
     )
+    @api_endpoint
     def renew_user_authorization_rbac(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         email: str = cls._error_if_not_email(**kwargs)
         company_id: str = kwargs.get("companyId", None)  # type: ignore
@@ -205,53 +214,56 @@ class GremlinAPIUsers(GremlinAPI):
         }
         endpoint: str = f"/users/renew/rbac"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_user_self", ("",), ("",))
+    @api_endpoint
     def get_user_self(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = f"/users/self"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("update_user_self", ("body",), ("",))
+    @api_endpoint
     def update_user_self(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "PATCH"
         data: dict = cls._error_if_not_json_body(**kwargs)
         endpoint: str = f"/users/self"
         payload: dict = cls._payload(**{"headers": https_client.header(), "body": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_user_session", ("",), ("getCompanySession",))
+    @api_endpoint
     def get_user_session(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         get_company_session: str = kwargs.get("getCompanySession", None)  # type: ignore
         endpoint: str = f"/users/sessions"
         if get_company_session:
             endpoint += f"/?getCompanySession=true"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
 
@@ -266,12 +278,13 @@ class GremlinAPIUsersAuth(GremlinAPI):
         ),
         ("getCompanySession",),
     )
+    @api_endpoint
     def auth_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "email": cls._error_if_not_param("email", **kwargs),
@@ -283,7 +296,7 @@ class GremlinAPIUsersAuth(GremlinAPI):
         endpoint: str = "/users/auth"
         if get_company_session:
             endpoint += "/?getCompanySession=true"
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -292,12 +305,13 @@ class GremlinAPIUsersAuth(GremlinAPI):
         ("accessToken", "email", "provider", "companyName"),
         ("getCompanySession",),
     )
+    @api_endpoint
     def auth_user_sso(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "accessToken": cls._error_if_not_param("accessToken", **kwargs),
@@ -310,49 +324,52 @@ class GremlinAPIUsersAuth(GremlinAPI):
         endpoint: str = "/users/auth"
         if get_company_session:
             endpoint += "/?getCompanySession=true"
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("invalidate_session", ("",), ("",))
+    @api_endpoint
     def invalidate_session(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "DELETE"
         endpoint: str = "/users/auth"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_company_affiliations", ("email",), ("",))
+    @api_endpoint
     def get_company_affiliations(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = f"/users/auth/emailCompanies/?email={email}"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("get_saml_metadata", ("",), ("",))
+    @api_endpoint
     def get_saml_metadata(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = "/users/auth/saml/metadata"
-        (resp, body) = https_client.api_call(method, endpoint)
+        (resp, body) = yield method, endpoint, {}
         return body
 
 
@@ -368,12 +385,13 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         ),
         ("getCompanySession",),
     )
+    @api_endpoint
     def auth_user(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "email": kwargs.get("email", None),
@@ -386,7 +404,7 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         endpoint: str = "/users/auth/mfa/auth"
         if get_company_session:
             endpoint += "/?getCompanySession=true"
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -401,30 +419,32 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
 
     @classmethod
     @register_cli_action("get_mfa_status", ("email",), ("",))
+    @api_endpoint
     def get_mfa_status(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         email: str = cls._error_if_not_email(**kwargs)
         endpoint: str = f"/users/auth/mfa/{email}/enabled"
-        (resp, body) = https_client.api_call(method, endpoint)
+        (resp, body) = yield method, endpoint, {}
         return body
 
     @classmethod
     @register_cli_action("get_user_mfa_status", ("",), ("",))
+    @api_endpoint
     def get_user_mfa_status(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "GET"
         endpoint: str = "/users/auth/mfa/info"
         payload: dict = cls._payload(**{"headers": https_client.header()})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -437,12 +457,13 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         ),
         ("",),
     )
+    @api_endpoint
     def disable_mfa(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "email": cls._error_if_not_email(**kwargs),
@@ -451,22 +472,23 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         }
         endpoint: str = "/users/auth/mfa/disable"
         payload: dict = cls._payload(**{"data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
     @register_cli_action("force_disable_mfa", ("email",), ("",))
+    @api_endpoint
     def force_disable_mfa(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {"email": cls._error_if_not_email(**kwargs)}
         endpoint: str = "/users/auth/mfa/forceDisable"
         payload: dict = cls._payload(**{"headers": https_client.header(), "data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -479,12 +501,13 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         ),
         ("",),
     )
+    @api_endpoint
     def enable_mfa(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "email": cls._error_if_not_email(**kwargs),
@@ -493,7 +516,7 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         }
         endpoint: str = "/users/auth/mfa/enable"
         payload: dict = cls._payload(**{"data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
 
     @classmethod
@@ -505,12 +528,13 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         ),
         ("",),
     )
+    @api_endpoint
     def validate_token(
         cls,
         https_client: Type[GremlinAPIHttpClient] = get_gremlin_httpclient(),
         *args: tuple,
         **kwargs: dict,
-    ) -> dict:
+    ) -> APISteps[dict]:
         method: str = "POST"
         data: dict = {
             "email": cls._error_if_not_email(**kwargs),
@@ -518,5 +542,5 @@ class GremlinAPIUsersAuthMFA(GremlinAPI):
         }
         endpoint: str = "/users/auth/mfa/validate"
         payload: dict = cls._payload(**{"data": data})
-        (resp, body) = https_client.api_call(method, endpoint, **payload)
+        (resp, body) = yield method, endpoint, payload
         return body
@@ -30,6 +30,14 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     install_requires=getRequires(),
+    extras_require={
+        "analytics": ["numpy", "pandas>=1.1"],
+        "async": ["httpx>=0.26.0"],
+        "fast-json": ["orjson"],
+        "http2": ["httpx[http2]>=0.26.0"],
+        "otel": ["opentelemetry-api"],
+        "reports": ["pandas", "pyarrow>=7.0"],
+    },
     python_requires=">=3.7",
     entry_points={"console_scripts": ["pgremlin = gremlinapi.cli:main"]},
     classifiers=[
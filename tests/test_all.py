@@ -6,10 +6,14 @@ import unittest
 
 from .test_httpclient import TestHttpClient
 from .test_attacks import TestAttacks
+from .test_async_api import TestAsyncAPI
 from .test_alfi import TestAlfi
+from .test_analytics import TestAnalytics, TestAnalyticsFrames
 from .test_apikeys import TestAPIKeys
 from .test_attack_helpers import TestAttackHelpers
+from .test_benchmarks import TestBenchmarks
 from .test_cli import TestCLI
+from .test_cassette import TestCassette
 from .test_clients import TestClients
 from .test_companies import TestCompanies
 from .test_containers import TestContainers
@@ -17,12 +21,26 @@ from .test_contracts import TestContracts
 from .test_executions import TestExecutions
 from .test_gremlinapi import TestAPI
 from .test_halts import TestHalts
-from .test_kubernetes import TestKubernetesAttacks, TestKubernetesTargets
+from .test_instrumentation import TestInstrumentation
+from .test_inventory import TestInventory
+from .test_http2 import TestHttp2Client
+from .test_json_codec import TestJSONCodec
+from .test_lazy_imports import TestLazyImports
+from .test_logging import TestSecretsFilter
+from .test_token_manager import TestTokenManager
+from .test_client import TestGremlinClient
+from .test_kubernetes import (
+    TestKubernetesAttacks,
+    TestKubernetesTargets,
+    TestKubernetesAttackTargets,
+)
 from .test_metadata import TestMetadata
 from .test_metrics import TestMetrics
 from .test_orgs import TestOrgs
 from .test_oauth import TestOAUTH
 from .test_providers import TestProviders
+from .test_rate_limiter import TestRateLimiter
+from .test_report_engine import TestReportEngine
 from .test_reports import TestReports
 from .test_saml import TestSaml
 from .test_scenario_graph_helpers import TestScenarioGraphHelpers
@@ -0,0 +1,100 @@
+import unittest
+import logging
+from gremlinapi.analytics import (
+    GremlinAnalytics,
+    _load_pandas,
+    metric_columns,
+    run_failed,
+    scenario_run_columns,
+)
+
+pandas = _load_pandas()
+
+mock_runs = {
+    "items": [
+        {
+            "scenario_id": "scenario-a",
+            "run_number": 1,
+            "org_id": "team-1",
+            "stage_info": {"stage": "Successful"},
+            "created_at": "2024-01-01T10:00:00Z",
+            "start_time": "2024-01-01T10:00:00Z",
+            "end_time": "2024-01-01T10:05:00Z",
+        },
+        {
+            "scenario_id": "scenario-a",
+            "run_number": 2,
+            "org_id": "team-1",
+            "stage_info": {"stage": "Failed"},
+            "created_at": "2024-01-02T10:00:00Z",
+            "start_time": "2024-01-02T10:00:00Z",
+            "end_time": "2024-01-02T10:01:00Z",
+        },
+        {
+            "scenarioId": "scenario-b",
+            "runNumber": 1,
+            "teamId": "team-2",
+            "stage": "Running",
+            "createdAt": "2024-01-09T10:00:00Z",
+        },
+    ]
+}
+
+mock_attack_metrics = {
+    "attackId": "attack-1",
+    "metrics": [
+        {"name": "latency", "points": [[1704103200000, 100], [1704103260000, 300]]},
+        {"name": "errors", "points": [{"timestamp": 1704103200000, "value": 1}]},
+    ],
+}
+
+
+class TestAnalytics(unittest.TestCase):
+    def test_scenario_run_columns(self) -> None:
+        columns = scenario_run_columns(mock_runs)
+        self.assertEqual(
+            columns["scenario_id"], ["scenario-a", "scenario-a", "scenario-b"]
+        )
+        self.assertEqual(columns["team_id"], ["team-1", "team-1", "team-2"])
+        self.assertEqual(columns["stage"], ["Successful", "Failed", "Running"])
+        self.assertEqual(columns["failed"], [False, True, None])
+        self.assertEqual(scenario_run_columns(mock_runs["items"]), columns)
+        self.assertEqual(run_failed("TargetNotFound"), True)
+        self.assertIsNone(run_failed("Halted"))
+        self.assertIsNone(run_failed("SomeFutureStage"))
+
+    def test_metric_columns(self) -> None:
+        columns = metric_columns(mock_attack_metrics, attack_id="attack-1")
+        self.assertEqual(columns["attack_id"], ["attack-1"] * 3)
+        self.assertEqual(columns["metric"], ["latency", "latency", "errors"])
+        self.assertEqual(columns["value"], [100, 300, 1])
+        self.assertEqual(metric_columns({"cpu": [[1, 0.5]]})["metric"], ["cpu"])
+        self.assertEqual(metric_columns({})["metric"], [])
+
+    @unittest.skipIf(pandas is not None, "pandas is installed")
+    def test_frames_require_pandas(self) -> None:
+        with self.assertRaises(ImportError):
+            GremlinAnalytics.runs_frame(mock_runs)
+
+
+@unittest.skipIf(pandas is None, "pandas is not installed")
+class TestAnalyticsFrames(unittest.TestCase):
+    def test_failure_rates(self) -> None:
+        runs = GremlinAnalytics.runs_frame(mock_runs)
+        self.assertEqual(list(runs["duration_seconds"][:2]), [300.0, 60.0])
+        rates = GremlinAnalytics.failure_rates(runs)
+        self.assertEqual(list(rates.index), ["scenario-a"])
+        self.assertEqual(rates.loc["scenario-a", "runs"], 2)
+        self.assertEqual(rates.loc["scenario-a", "failure_rate"], 0.5)
+        weekly = GremlinAnalytics.failure_rates(runs, by="team_id", freq="W")
+        self.assertEqual(int(weekly["failures"].sum()), 1)
+
+    def test_percentiles(self) -> None:
+        metrics = GremlinAnalytics.attack_metrics_frame(
+            {"attack-1": mock_attack_metrics}
+        )
+        self.assertEqual(str(metrics["timestamp"].dt.tz), "UTC")
+        summary = GremlinAnalytics.percentiles(metrics, q=(0.5, 0.99))
+        self.assertEqual(list(summary.columns), ["count", "mean", "p50", "p99"])
+        self.assertEqual(summary.loc["latency", "p50"], 200)
+        self.assertEqual(summary.loc["errors", "count"], 1)
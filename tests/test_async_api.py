@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from gremlinapi.async_api import (
+    AsyncGremlinAPIAttacks,
+    AsyncGremlinAPIClients,
+    AsyncGremlinAPIReliabilityTests,
+)
+from gremlinapi.exceptions import HTTPError
+from gremlinapi.http_clients import AsyncGremlinAPIHttpClient, httpx
+
+from .util import mock_json, mock_data, mock_guid
+
+
+def mock_async_client(status_code=200, json=mock_data, requests_seen=None):
+    def handler(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        return httpx.Response(status_code, json=json)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncAPI(unittest.IsolatedAsyncioTestCase):
+    async def test_list_active_attacks(self) -> None:
+        seen = []
+        with patch.object(
+            AsyncGremlinAPIHttpClient,
+            "_build_client",
+            return_value=mock_async_client(requests_seen=seen),
+        ):
+            self.assertEqual(
+                await AsyncGremlinAPIAttacks.list_active_attacks(teamId="team"),
+                mock_data,
+            )
+            await AsyncGremlinAPIHttpClient.aclose()
+        self.assertEqual(seen[0].method, "GET")
+        self.assertTrue(str(seen[0].url).endswith("/attacks/active/?teamId=team"))
+        self.assertIn("X-Gremlin-Agent", seen[0].headers)
+
+    async def test_concurrent_calls(self) -> None:
+        seen = []
+        with patch.object(
+            AsyncGremlinAPIHttpClient,
+            "_build_client",
+            return_value=mock_async_client(requests_seen=seen),
+        ):
+            results = await asyncio.gather(
+                *[AsyncGremlinAPIClients.activate_client(**mock_guid) for _ in range(5)]
+            )
+            await AsyncGremlinAPIHttpClient.aclose()
+        self.assertEqual(results, [mock_data] * 5)
+        self.assertEqual([r.method for r in seen], ["PUT"] * 5)
+
+    async def test_http_error(self) -> None:
+        with patch.object(
+            AsyncGremlinAPIHttpClient,
+            "_build_client",
+            return_value=mock_async_client(status_code=404),
+        ):
+            with self.assertRaises(HTTPError):
+                await AsyncGremlinAPIAttacks.list_attacks()
+            await AsyncGremlinAPIHttpClient.aclose()
+
+    @patch("requests.get")
+    async def test_post_processed_response(self, mock_get) -> None:
+        mock_get.side_effect = AssertionError("the sync client was used")
+        seen = []
+        with patch.object(
+            AsyncGremlinAPIHttpClient,
+            "_build_client",
+            return_value=mock_async_client(json={"score": 42}, requests_seen=seen),
+        ):
+            self.assertEqual(
+                await AsyncGremlinAPIReliabilityTests.get_service_reliability_score(
+                    service_id="service", teamId="team"
+                ),
+                42,
+            )
+            await AsyncGremlinAPIHttpClient.aclose()
+        self.assertEqual(len(seen), 1)
@@ -23,6 +23,9 @@ from gremlinapi.attack_helpers import (
     GremlinPacketLossAttack,
     GremlinStateAttackHelper,
 )
+from gremlinapi.clients import active_client_inventory
+from gremlinapi.exceptions import GremlinIdentifierError
+from gremlinapi.containers import container_inventory
 
 from .util import mock_data
 
@@ -40,6 +43,14 @@ attack_helper_params_default = {
 
 
 class TestAttackHelpers(unittest.TestCase):
+    def setUp(self) -> None:
+        active_client_inventory.invalidate()
+        container_inventory.invalidate()
+
+    def tearDown(self) -> None:
+        active_client_inventory.invalidate()
+        container_inventory.invalidate()
+
     def test_attack_helper_api_model(self) -> None:
         # defaults
         expected_output = {
@@ -187,6 +198,47 @@ class TestAttackHelpers(unittest.TestCase):
         helper._filter_active_labels()
         self.assertEqual(helper._active_labels, expected_output)
 
+    @patch("requests.get")
+    def test_target_hosts_share_inventory(self, mock_get) -> None:
+        def mock_json():
+            return [
+                {"identifier": "host-1", "tags": {"zone": ["us-east-1a", "us-east-1b"]}},
+                {"identifier": "host-2", "tags": {"zone": "us-east-1a"}},
+            ]
+
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = mock_json
+        helper = GremlinTargetHosts(target_all_hosts=False, ids=["host-1", "host-2"])
+        self.assertEqual(helper.ids, ["host-1", "host-2"])
+        helper = GremlinTargetHosts(
+            target_all_hosts=False, tags={"zone": ["us-east-1b", "us-west-2a"]}
+        )
+        self.assertEqual(helper.tags, {"zone": ["us-east-1b"]})
+        with self.assertRaises(GremlinIdentifierError):
+            GremlinTargetHosts(target_all_hosts=False, ids=["host-3"])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.get")
+    def test_target_containers_share_inventory(self, mock_get) -> None:
+        def mock_json():
+            return [
+                {"identifier": "c1", "container_labels": {"app": "web"}},
+                {"identifier": "c2", "container_labels": {"app": ["db", "web"]}},
+            ]
+
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = mock_json
+        helper = GremlinTargetContainers(target_all_containers=False, ids=["c2"])
+        self.assertEqual(helper.ids, ["c2"])
+        helper = GremlinTargetContainers(
+            target_all_containers=False, labels={"app": ["db", "cache"]}
+        )
+        self.assertEqual(helper.labels, {"app": ["db"]})
+        self.assertEqual(container_inventory.values_by_key(), {"app": ["web", "db"]})
+        self.assertEqual(mock_get.call_count, 1)
+
     def test_target_containers_api_model(self) -> None:
         # defaults
         expected_output = {"containers": "all", "percent": 10, "type": "Random"}
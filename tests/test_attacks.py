@@ -6,6 +6,7 @@ import unittest
 import requests
 import logging
 from unittest.mock import patch
+from gremlinapi import json_codec
 from gremlinapi.attacks import GremlinAPIAttacks
 from gremlinapi.attack_helpers import (
     GremlinAttackHelper,
@@ -28,7 +29,7 @@ class TestAttacks(unittest.TestCase):
         expected_output_class = GremlinAttackHelper()
         test_kwargs = {"body": expected_output_class}
         test_output = GremlinAPIAttacks._error_if_not_attack_body(**test_kwargs)
-        self.assertEqual(test_output, str(expected_output_class))
+        self.assertEqual(test_output, expected_output_class.api_model())
 
     @patch("requests.post")
     def test_create_attack_with_decorator(self, mock_get) -> None:
@@ -39,6 +40,20 @@ class TestAttacks(unittest.TestCase):
         mock_get.return_value.json = mock_json
         self.assertEqual(GremlinAPIAttacks.create_attack(**test_kwargs), mock_data)
 
+    @patch("requests.post")
+    def test_create_attack_request_body(self, mock_post) -> None:
+        mock_post.return_value = requests.Response()
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json = mock_json
+        helper = GremlinAttackHelper()
+        GremlinAPIAttacks.create_attack(body=helper)
+        posted = json_codec.loads(mock_post.call_args[1]["data"])
+        self.assertEqual(posted, helper.api_model())
+        self.assertEqual(set(posted), {"target", "command"})
+        self.assertEqual(
+            mock_post.call_args[1]["headers"]["Content-Type"], "application/json"
+        )
+
     @patch("requests.get")
     def test_list_active_attacks_with_decorator(self, mock_get) -> None:
         mock_get.return_value = requests.Response()
@@ -82,3 +97,71 @@ class TestAttacks(unittest.TestCase):
         mock_get.return_value.json = mock_json
         test_kwargs = {"guid": "1234567890"}
         self.assertEqual(GremlinAPIAttacks.halt_attack(**test_kwargs), mock_data)
+
+    def test_list_endpoint_page_token(self) -> None:
+        test_output = GremlinAPIAttacks._list_endpoint(
+            "test-endpoint.com", pageSize=3, pageToken="abc"
+        )
+        self.assertIn("pageSize=3&pageToken=abc", test_output)
+
+    def test_list_endpoint_page_token_escaped(self) -> None:
+        test_output = GremlinAPIAttacks._list_endpoint(
+            "test-endpoint.com", pageToken="a+b/c=&d"
+        )
+        self.assertIn("pageToken=a%2Bb%2Fc%3D%26d", test_output)
+
+    @patch("requests.get")
+    def test_iter_attacks_escapes_page_token(self, mock_get) -> None:
+        pages = [
+            {"items": [{"guid": 1}], "next_page_token": "a+b/c=&d"},
+            {"items": [{"guid": 2}]},
+        ]
+        responses = []
+        for page in pages:
+            response = requests.Response()
+            response.status_code = 200
+            response.json = lambda page=page: page
+            responses.append(response)
+        mock_get.side_effect = responses
+        self.assertEqual([a["guid"] for a in GremlinAPIAttacks.iter_attacks()], [1, 2])
+        self.assertIn("pageToken=a%2Bb%2Fc%3D%26d", mock_get.call_args.args[0])
+
+    @patch("requests.get")
+    def test_iter_attacks_with_decorator(self, mock_get) -> None:
+        pages = [
+            {"items": [{"guid": 1}, {"guid": 2}], "next_page_token": "page-2"},
+            {"items": [{"guid": 3}]},
+        ]
+        responses = []
+        for page in pages:
+            response = requests.Response()
+            response.status_code = 200
+            response.json = lambda page=page: page
+            responses.append(response)
+        mock_get.side_effect = responses
+        attacks = GremlinAPIAttacks.iter_attacks(pageSize=2)
+        self.assertEqual(next(attacks), {"guid": 1})
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual([a["guid"] for a in attacks], [2, 3])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertIn("pageToken=page-2", mock_get.call_args.args[0])
+
+    @patch("requests.get")
+    def test_iter_completed_attacks_prefetch_with_decorator(self, mock_get) -> None:
+        pages = [
+            {"items": [{"guid": 1}], "nextPageToken": "page-2"},
+            {"items": [{"guid": 2}], "nextPageToken": "page-3"},
+            [{"guid": 3}],
+        ]
+        responses = []
+        for page in pages:
+            response = requests.Response()
+            response.status_code = 200
+            response.json = lambda page=page: page
+            responses.append(response)
+        mock_get.side_effect = responses
+        self.assertEqual(
+            [a["guid"] for a in GremlinAPIAttacks.iter_completed_attacks(prefetch=True)],
+            [1, 2, 3],
+        )
+        self.assertEqual(mock_get.call_count, 3)
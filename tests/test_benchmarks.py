@@ -0,0 +1,21 @@
+import unittest
+import logging
+
+from benchmarks.mock_server import GremlinMockAPIServer
+from benchmarks.run import compare
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_mock_server(self) -> None:
+        with GremlinMockAPIServer(agents=25, items=3) as server:
+            client = server.client(http_pool_enabled=True)
+            try:
+                self.assertEqual(len(client.Clients.list_clients()["active"]), 25)
+                self.assertEqual(len(client.Scenarios.list_scenarios()), 3)
+            finally:
+                client.close()
+
+    def test_compare(self) -> None:
+        baseline = {"fast": 1e-6, "slow": 0.010, "same": 0.010}
+        results = {"fast": 3e-6, "slow": 0.020, "same": 0.011, "new": 1.0}
+        self.assertEqual(compare(results, baseline, tolerance=0.5), ["slow"])
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from gremlinapi.attacks import GremlinAPIAttacks
+from gremlinapi.cassette import GremlinAPICassette
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import GremlinReplayError, HTTPError
+from gremlinapi.http_clients import (
+    GremlinAPIPooledRequestsClient,
+    close_gremlin_httpclient,
+    get_gremlin_httpclient,
+)
+from gremlinapi.scenarios import GremlinAPIScenarios
+
+from .util import mock_data, mock_scenario
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "calls.jsonl.gz")
+
+    def tearDown(self) -> None:
+        close_gremlin_httpclient()
+        self.directory.cleanup()
+
+    @patch("requests.post")
+    @patch("requests.get")
+    def test_record_and_replay(self, mock_get, mock_post) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value._content = b'{"testkey": "testval"}'
+        mock_post.return_value = requests.Response()
+        mock_post.return_value.status_code = 404
+        mock_post.return_value.reason = "Not Found"
+        mock_post.return_value._content = b"missing"
+        with patch.object(config, "cassette", self.path), patch.object(
+            config, "cassette_mode", "record"
+        ):
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), mock_data)
+            with self.assertRaises(HTTPError) as recorded:
+                GremlinAPIScenarios.create_scenario(body=mock_scenario)
+            close_gremlin_httpclient()
+        self.assertEqual(
+            [e["method"] for e in GremlinAPICassette(self.path).entries()],
+            ["GET", "POST"],
+        )
+
+        mock_get.side_effect = AssertionError("replay used the network")
+        mock_post.side_effect = AssertionError("replay used the network")
+        with patch.object(config, "cassette", self.path), patch.object(
+            config, "cassette_mode", "replay"
+        ), patch.object(config, "cassette_time_scale", 0):
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), mock_data)
+            # The last recording repeats once the cassette runs out
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), mock_data)
+            with self.assertRaises(HTTPError) as replayed:
+                GremlinAPIScenarios.create_scenario(body=mock_scenario)
+            self.assertEqual(str(replayed.exception), str(recorded.exception))
+            with self.assertRaises(GremlinReplayError):
+                GremlinAPIAttacks.list_completed_attacks()
+
+    def test_replay_timing(self) -> None:
+        with open(self.path[:-3], "w") as f:
+            f.write('{"gremlinapi_cassette": 1}\n')
+            f.write(
+                '{"method":"GET","endpoint":"/attacks/active","status":200,'
+                '"body":"[]","duration":0.2}\n'
+            )
+        with patch.object(config, "cassette", self.path[:-3]), patch.object(
+            config, "cassette_mode", "replay"
+        ), patch.object(config, "cassette_time_scale", 0.25):
+            started = time.perf_counter()
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), [])
+            self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    @patch("requests.Session.get")
+    def test_replay_with_any_transport(self, mock_get) -> None:
+        mock_get.side_effect = AssertionError("replay used the network")
+        with open(self.path[:-3], "w") as f:
+            f.write('{"gremlinapi_cassette": 1}\n')
+            f.write(
+                '{"method":"GET","endpoint":"/attacks/active","status":200,'
+                '"body":"[]","duration":0}\n'
+            )
+        with patch.object(config, "cassette", self.path[:-3]), patch.object(
+            config, "cassette_mode", "replay"
+        ):
+            # Neither h2 nor a pooled session is needed to replay
+            for client in (
+                get_gremlin_httpclient(http2=True),
+                GremlinAPIPooledRequestsClient,
+            ):
+                self.assertEqual(
+                    GremlinAPIAttacks.list_active_attacks(https_client=client), []
+                )
+        self.assertFalse(mock_get.called)
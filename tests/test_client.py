@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from gremlinapi.client import GremlinClient
+from gremlinapi.clients import client_inventory
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import GremlinParameterError
+from gremlinapi.http_clients import (
+    AsyncGremlinAPIHttpClient,
+    GremlinAPIHttpClient,
+    GremlinAPIPooledRequestsClient,
+    httpx,
+)
+from gremlinapi.token_manager import GremlinAPITokenManager
+
+from .util import mock_data
+
+
+def _response(body) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.json = lambda: body
+    return resp
+
+
+class TestGremlinClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.team_a = GremlinClient(api_key="Key team-a-key", bearer_token="", team_id="a")
+        self.team_b = GremlinClient(api_key="Key team-b-key", bearer_token="", team_id="b")
+
+    def tearDown(self) -> None:
+        self.team_a.close()
+        self.team_b.close()
+
+    def test_settings(self) -> None:
+        with self.assertRaises(GremlinParameterError):
+            GremlinClient(not_a_setting=1)
+        with self.assertRaises(GremlinParameterError):
+            GremlinClient(rate_limit_qps=5)
+        self.assertEqual(self.team_a.settings["team_id"], "a")
+        self.assertEqual(self.team_a.settings["client_cache"], {})
+        with self.team_a.activate():
+            self.assertEqual(config.team_id, "a")
+            config.bearer_token = "Bearer team-a-token"
+            with self.team_b.activate():
+                self.assertEqual(config.bearer_token, "")
+            self.assertEqual(config.bearer_token, "Bearer team-a-token")
+        self.assertNotEqual(config.bearer_token, "Bearer team-a-token")
+
+    def test_credentials_are_not_inherited(self) -> None:
+        with patch.object(config, "bearer_token", "Bearer global-tenant"), patch.object(
+            config, "team_id", "global-team"
+        ), patch.object(config, "company_name", "Global Inc."):
+            client = GremlinClient(api_key="Key client-key")
+            with client.activate():
+                header = GremlinAPIHttpClient.header()
+                self.assertEqual(header["Authorization"], "Key client-key")
+                self.assertIsNone(config.bearer_token)
+                self.assertIsNone(config.team_id)
+                self.assertIsNone(config.company_name)
+            client.close()
+
+    @patch("requests.get")
+    def test_concurrent_clients(self, mock_get) -> None:
+        seen = []
+
+        def _get(uri, **kwargs):
+            seen.append((uri, kwargs["headers"]["Authorization"]))
+            return _response(mock_data)
+
+        mock_get.side_effect = _get
+        threads = [
+            threading.Thread(target=client.Attacks.list_active_attacks)
+            for client in (self.team_a, self.team_b) * 4
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(
+            sorted(set(seen)),
+            [
+                (f"{config.base_uri}/attacks/active/?teamId=a", "Key team-a-key"),
+                (f"{config.base_uri}/attacks/active/?teamId=b", "Key team-b-key"),
+            ],
+        )
+
+    @patch("requests.get")
+    def test_paginated_generator(self, mock_get) -> None:
+        mock_get.side_effect = [
+            _response({"items": [1], "pageToken": "next"}),
+            _response({"items": [2]}),
+        ]
+        self.assertEqual(list(self.team_a.Executions.iter_executions()), [1, 2])
+        for call in mock_get.call_args_list:
+            self.assertIn("teamId=a", call[0][0])
+
+    @patch("requests.get")
+    def test_separate_caches(self, mock_get) -> None:
+        mock_get.side_effect = [
+            _response({"active": [{"containers": [{"id": "a1"}]}]}),
+            _response({"active": [{"containers": [{"id": "b1"}]}]}),
+        ]
+        containers_a = self.team_a.Clients.get_update_client_target_cache()
+        containers_b = self.team_b.Clients.get_update_client_target_cache()
+        self.assertEqual([c["id"] for c in containers_a], ["a1"])
+        self.assertEqual([c["id"] for c in containers_b], ["b1"])
+        with self.team_a.activate():
+            self.assertIsNot(client_inventory.cache(), client_inventory._default)
+            self.assertEqual(config.client_cache["active"][0]["containers"][0]["id"], "a1")
+
+    def test_separate_pools_and_token_managers(self) -> None:
+        with self.team_a.activate():
+            session_a = GremlinAPIPooledRequestsClient.session()
+            GremlinAPITokenManager.start(lambda: None)
+            self.assertTrue(GremlinAPITokenManager.is_running())
+        with self.team_b.activate():
+            self.assertIsNot(GremlinAPIPooledRequestsClient.session(), session_a)
+            self.assertFalse(GremlinAPITokenManager.is_running())
+        self.assertIsNot(GremlinAPIPooledRequestsClient._session, session_a)
+        self.assertFalse(GremlinAPITokenManager.is_running())
+        self.team_a.close()
+        with self.team_a.activate():
+            self.assertFalse(GremlinAPITokenManager.is_running())
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_async_endpoint(self) -> None:
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=mock_data)
+
+        async def run():
+            with patch.object(
+                AsyncGremlinAPIHttpClient,
+                "_build_client",
+                side_effect=lambda: httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                ),
+            ):
+                body = await self.team_b.AsyncAttacks.list_active_attacks()
+                await self.team_b.aclose()
+            return body
+
+        self.assertEqual(asyncio.run(run()), mock_data)
+        self.assertEqual(seen[0].headers["Authorization"], "Key team-b-key")
+        self.assertIn("teamId=b", str(seen[0].url))
+
+    def test_helpers_are_not_endpoints(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.team_a.GremlinTargetHosts
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import logging
 import requests
 from gremlinapi.clients import GremlinAPIClients
+from gremlinapi.exceptions import HTTPError
 
 from .util import mock_json, mock_data, mock_guid
 
@@ -35,3 +36,28 @@ class TestClients(unittest.TestCase):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json = mock_json
         self.assertEqual(GremlinAPIClients.list_clients(), mock_data)
+
+    @patch("requests.put")
+    def test_bulk_activate_with_decorator(self, mock_put) -> None:
+        ok = requests.Response()
+        ok.status_code = 200
+        ok.json = mock_json
+        failed = requests.Response()
+        failed.status_code = 404
+        failed.reason = "Not Found"
+        mock_put.side_effect = lambda uri, **kwargs: failed if "/bad/" in uri else ok
+        outcome = GremlinAPIClients.bulk_activate(
+            ["good-1", "bad", "good-2", "good-1"], team_id="team", concurrency=2
+        )
+        self.assertEqual(outcome["results"], {"good-1": mock_data, "good-2": mock_data})
+        self.assertEqual(list(outcome["errors"]), ["bad"])
+        self.assertIsInstance(outcome["errors"]["bad"], HTTPError)
+        self.assertEqual(mock_put.call_count, 3)
+
+    @patch("requests.delete")
+    def test_bulk_deactivate_with_decorator(self, mock_delete) -> None:
+        mock_delete.return_value = requests.Response()
+        mock_delete.return_value.status_code = 200
+        mock_delete.return_value.json = mock_json
+        outcome = GremlinAPIClients.bulk_deactivate(["a", "b"], concurrency=4)
+        self.assertEqual(outcome, {"results": {"a": mock_data, "b": mock_data}, "errors": {}})
@@ -25,3 +25,10 @@ class TestExecutions(unittest.TestCase):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json = mock_json
         self.assertEqual(GremlinAPIExecutions.list_executions(), mock_data)
+
+    @patch("requests.get")
+    def test_iter_executions_with_decorator(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = lambda: [mock_data, mock_data]
+        self.assertEqual(list(GremlinAPIExecutions.iter_executions()), [mock_data] * 2)
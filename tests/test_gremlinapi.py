@@ -127,6 +127,14 @@ class TestAPI(unittest.TestCase):
             expected_output,
         )
 
+    def test__optional_page_endpoint(self) -> None:
+        self.assertEqual(
+            GremlinAPI._optional_page_endpoint(
+                test_base_endpoint, pageSize=2, pageToken="a+b/c=&d"
+            ),
+            "%s/?pageSize=2&pageToken=a%%2Bb%%2Fc%%3D%%26d" % test_base_endpoint,
+        )
+
     def test__required_team_endpoint(self) -> None:
         test_endpoint = "%s" % test_base_endpoint
 
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+import logging
+from gremlinapi.attacks import GremlinAPIAttacks
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import HTTPError
+from gremlinapi.http_clients import (
+    GremlinAPIHttp2Client,
+    get_gremlin_httpclient,
+    httpx,
+)
+
+from .util import mock_data
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+
+def mock_http2_client(status_code=200, json=mock_data, requests_seen=None):
+    def handler(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        return httpx.Response(status_code, json=json)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2Client(unittest.TestCase):
+    def tearDown(self) -> None:
+        GremlinAPIHttp2Client.close()
+
+    def test_get_gremlin_httpclient(self) -> None:
+        self.assertIs(get_gremlin_httpclient(http2=True), GremlinAPIHttp2Client)
+
+    def test_http2_setting_routes_calls(self) -> None:
+        seen = []
+        with patch.object(config, "http2", True), patch.object(
+            GremlinAPIHttp2Client,
+            "_build_client",
+            return_value=mock_http2_client(requests_seen=seen),
+        ):
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), mock_data)
+            self.assertEqual(GremlinAPIAttacks.list_active_attacks(), mock_data)
+        self.assertEqual([r.method for r in seen], ["GET", "GET"])
+        self.assertTrue(str(seen[0].url).endswith("/attacks/active"))
+        self.assertIn("X-Gremlin-Agent", seen[0].headers)
+
+    def test_http_error(self) -> None:
+        with patch.object(
+            GremlinAPIHttp2Client,
+            "_build_client",
+            return_value=mock_http2_client(status_code=404),
+        ):
+            with self.assertRaises(HTTPError):
+                GremlinAPIHttp2Client.api_call("GET", "/attacks")
+
+    def test_options_enable_http2(self) -> None:
+        options = GremlinAPIHttp2Client._httpx_options(httpx.HTTPTransport, True)
+        self.assertTrue(options["http2"])
+        self.assertFalse(options["follow_redirects"])
+
+    @unittest.skipIf(h2 is not None, "h2 is installed")
+    def test_requires_h2(self) -> None:
+        with self.assertRaisesRegex(ImportError, "gremlinapi\\[http2\\]"):
+            GremlinAPIHttp2Client.client()
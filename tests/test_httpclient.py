@@ -5,11 +5,21 @@
 import os
 import sys
 import unittest
+from unittest.mock import patch
+
+import requests
 
 from gremlinapi.config import GremlinAPIConfig as config
-from gremlinapi.http_clients import get_gremlin_httpclient, GremlinAPIHttpClient
+from gremlinapi.exceptions import HTTPError, HTTPTimeout
+from gremlinapi.http_clients import (
+    get_gremlin_httpclient,
+    close_gremlin_httpclient,
+    GremlinAPIHttpClient,
+    GremlinAPIPooledRequestsClient,
+    GremlinAPIRequestsClient,
+)
 
-from .util import api_key, bearer_token
+from .util import api_key, bearer_token, mock_json, mock_data
 
 parentPath: str = os.path.abspath("..")
 if parentPath not in sys.path:
@@ -29,7 +39,108 @@ class TestHttpClient(unittest.TestCase):
         header: dict = https_client.header()
         self.assertIn(bearer_token, header["Authorization"])
 
+    def test_header_cache(self) -> None:
+        with patch.object(config, "api_key", api_key), patch.object(
+            config, "bearer_token", ""
+        ):
+            header = GremlinAPIHttpClient.header()
+            self.assertIs(GremlinAPIHttpClient.header(), header)
+            self.assertEqual(header["Authorization"], f"Key {api_key}")
+            with self.assertRaises(TypeError):
+                header["Authorization"] = "changed"  # type: ignore
+            kwargs = {"headers": header, "body": {}}
+            GremlinAPIHttpClient._request_data(kwargs)
+            self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+            self.assertIs(GremlinAPIHttpClient._json_header(header), kwargs["headers"])
+            self.assertNotIn("Content-Type", header)
+            with patch.object(config, "bearer_token", bearer_token):
+                self.assertIn(bearer_token, GremlinAPIHttpClient.header()["Authorization"])
+            explicit = GremlinAPIHttpClient.header(
+                api_key="explicit-key", bearer_token="explicit-token"
+            )
+            self.assertEqual(explicit["Authorization"], "Bearer explicit-token")
+            self.assertEqual(GremlinAPIHttpClient.header(), header)
+
     def test_base_uri(self) -> None:
         https_client: GremlinAPIHttpClient = get_gremlin_httpclient()
         t_uri: str = "test"
         self.assertEqual(f"{config.base_uri}{t_uri}", https_client.base_uri(t_uri))
+
+    @patch("requests.Session.get")
+    def test_pooled_client_dispatch(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = mock_json
+        config.http_pool_enabled = True
+        try:
+            https_client: GremlinAPIHttpClient = get_gremlin_httpclient()
+            (resp, body) = https_client.api_call("GET", "/test", headers={})
+            self.assertEqual(body, mock_data)
+            self.assertEqual(mock_get.call_count, 1)
+        finally:
+            config.http_pool_enabled = False
+            GremlinAPIPooledRequestsClient.close()
+
+    def test_pooled_client_session_reuse(self) -> None:
+        session: requests.Session = GremlinAPIPooledRequestsClient.session()
+        self.assertIs(session, GremlinAPIPooledRequestsClient.session())
+        adapter = session.get_adapter(config.base_uri)
+        self.assertEqual(adapter._pool_maxsize, config.http_pool_maxsize)
+        new_session: requests.Session = GremlinAPIPooledRequestsClient.reset()
+        self.assertIsNot(session, new_session)
+        close_gremlin_httpclient()
+        self.assertIsNone(GremlinAPIPooledRequestsClient._session)
+
+    @patch("time.sleep")
+    @patch("requests.get")
+    def test_retry_transient_status(self, mock_get, mock_sleep) -> None:
+        busy: requests.Response = requests.Response()
+        busy.status_code = 503
+        busy.headers["Retry-After"] = "7"
+        ok: requests.Response = requests.Response()
+        ok.status_code = 200
+        ok.json = mock_json
+        mock_get.side_effect = [busy, ok]
+        (resp, body) = GremlinAPIRequestsClient.api_call("GET", "/test", headers={})
+        self.assertEqual(body, mock_data)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("time.sleep")
+    @patch("requests.post")
+    def test_no_retry_for_unsafe_method(self, mock_post, mock_sleep) -> None:
+        mock_post.return_value = requests.Response()
+        mock_post.return_value.status_code = 503
+        mock_post.return_value.reason = "Service Unavailable"
+        with self.assertRaises(HTTPError):
+            GremlinAPIRequestsClient.api_call("POST", "/test", headers={})
+        self.assertEqual(mock_post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("time.sleep")
+    @patch("requests.get")
+    def test_timeout_raises_after_retries(self, mock_get, mock_sleep) -> None:
+        mock_get.side_effect = requests.exceptions.ReadTimeout()
+        with self.assertRaises(HTTPTimeout):
+            GremlinAPIRequestsClient.api_call("GET", "/test", headers={})
+        self.assertEqual(mock_get.call_count, config.retry_max_attempts)
+        self.assertEqual(
+            mock_get.call_args.kwargs["timeout"],
+            (config.http_connect_timeout, config.http_read_timeout),
+        )
+
+    def test_retry_delay_backoff(self) -> None:
+        with patch.object(config, "retry_jitter", False), patch.object(
+            config, "retry_backoff_factor", 0.5
+        ), patch.object(config, "retry_backoff_max", 3):
+            self.assertEqual(GremlinAPIRequestsClient._retry_delay(1), 0.5)
+            self.assertEqual(GremlinAPIRequestsClient._retry_delay(3), 2)
+            self.assertEqual(GremlinAPIRequestsClient._retry_delay(100), 3)
+            self.assertEqual(GremlinAPIRequestsClient._retry_delay(1, "2"), 2)
+            self.assertEqual(GremlinAPIRequestsClient._retry_delay(1, "12"), 3)
+            self.assertEqual(
+                GremlinAPIRequestsClient._retry_delay(
+                    1, "Wed, 21 Oct 2099 07:28:00 GMT"
+                ),
+                3,
+            )
@@ -0,0 +1,136 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import logging
+import requests
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import HTTPError
+from gremlinapi.instrumentation import (
+    GremlinAPIInstrumentation,
+    GremlinAPILatencyHistogram,
+    endpoint_template,
+)
+from gremlinapi.clients import GremlinAPIClients
+from gremlinapi.scenarios import GremlinAPIScenarios
+
+from .util import mock_json, mock_data
+
+scenario_guid = "9676868b-60d2-5ebe-aa66-c1de8162ff9d"
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        GremlinAPIInstrumentation.reset()
+        self.events = []
+        GremlinAPIInstrumentation.add_hook(self.events.append)
+
+    def tearDown(self) -> None:
+        GremlinAPIInstrumentation.remove_hook(self.events.append)
+        GremlinAPIInstrumentation.reset()
+
+    def test_endpoint_template(self) -> None:
+        self.assertEqual(
+            endpoint_template(
+                f"{config.base_uri}/scenarios/{scenario_guid}/runs/12/?teamId=abc",
+                {"guid": scenario_guid, "runNumber": 12, "teamId": "abc"},
+            ),
+            "/scenarios/{guid}/runs/{runNumber}",
+        )
+        self.assertEqual(
+            endpoint_template(
+                "/users/someone%40example.com/active",
+                {"email": "someone@example.com"},
+            ),
+            "/users/{email}/active",
+        )
+        self.assertEqual(endpoint_template("/attacks/active/"), "/attacks/active")
+        self.assertEqual(endpoint_template("/clients/web-host"), "/clients/web-host")
+
+    @patch("requests.put")
+    def test_endpoint_named_identifiers(self, mock_put) -> None:
+        mock_put.return_value = requests.Response()
+        mock_put.return_value.status_code = 200
+        mock_put.return_value._content = b"{}"
+        for host in ("web-host", "db-host"):
+            GremlinAPIClients.activate_client(guid=host, teamId="frontend")
+        self.assertEqual(
+            [event.endpoint for event in self.events],
+            ["/clients/{guid}/activate"] * 2,
+        )
+        self.assertEqual(len(GremlinAPIInstrumentation.summary()), 1)
+
+    def test_histogram(self) -> None:
+        histogram = GremlinAPILatencyHistogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(
+            histogram.cumulative(), [(0.1, 1), (1.0, 3), (float("inf"), 4)]
+        )
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.55)
+
+    @patch("requests.get")
+    def test_event_and_summary(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value._content = b'{"testkey": "testval"}'
+        self.assertEqual(
+            GremlinAPIScenarios.list_scenario_runs(guid=scenario_guid), mock_data
+        )
+        self.assertEqual(len(self.events), 1)
+        event = self.events[0]
+        self.assertEqual(event.operation, "GremlinAPIScenarios.list_scenario_runs")
+        self.assertEqual((event.method, event.status), ("GET", 200))
+        self.assertEqual(event.endpoint, "/scenarios/{guid}/runs")
+        self.assertEqual(event.bytes_received, 22)
+        self.assertEqual(event.retries, 0)
+        summary = GremlinAPIInstrumentation.summary()
+        self.assertEqual(summary[0]["count"], 1)
+        self.assertEqual(summary[0]["statuses"], {"200": 1})
+
+    @patch("requests.get")
+    def test_error_and_prometheus_text(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 404
+        mock_get.return_value.reason = "Not Found"
+        mock_get.return_value.json = mock_json
+        with self.assertRaises(HTTPError):
+            GremlinAPIScenarios.list_scenarios()
+        self.assertEqual(self.events[0].error, "HTTPError")
+        self.assertEqual(self.events[0].status, 404)
+        text = GremlinAPIInstrumentation.prometheus_text()
+        labels = 'operation="GremlinAPIScenarios.list_scenarios",method="GET",endpoint="/scenarios"'
+        self.assertIn("# TYPE gremlinapi_request_duration_seconds histogram", text)
+        self.assertIn(
+            f'gremlinapi_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text
+        )
+        self.assertIn(f'gremlinapi_requests_total{{{labels},status="404"}} 1', text)
+
+    @patch("requests.get")
+    def test_disabled(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = mock_json
+        with patch.object(config, "instrumentation_enabled", False):
+            GremlinAPIScenarios.list_scenarios()
+        self.assertEqual(self.events, [])
+        self.assertEqual(GremlinAPIInstrumentation.summary(), [])
+
+    @patch("requests.get")
+    def test_opentelemetry_span(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = mock_json
+        tracer = MagicMock()
+        hook = GremlinAPIInstrumentation.enable_opentelemetry(tracer=tracer)
+        try:
+            GremlinAPIScenarios.list_scenarios()
+        finally:
+            GremlinAPIInstrumentation.remove_hook(hook)
+        (name,), options = tracer.start_span.call_args
+        self.assertEqual(name, "GET /scenarios")
+        self.assertEqual(options["attributes"]["http.response.status_code"], 200)
+        self.assertEqual(
+            options["attributes"]["gremlinapi.operation"],
+            "GremlinAPIScenarios.list_scenarios",
+        )
+        tracer.start_span.return_value.end.assert_called_once()
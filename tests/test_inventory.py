@@ -0,0 +1,112 @@
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+import logging
+import requests
+from gremlinapi.clients import GremlinAPIClients, client_inventory
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.inventory import (
+    GremlinAPITTLCache,
+    GremlinClientInventory,
+    GremlinTargetInventory,
+)
+
+mock_clients = {
+    "active": [
+        {
+            "identifier": "host-1",
+            "containers": [
+                {"id": "c1", "labels": {"app": "web"}},
+                {"id": "c2", "labels": {"app": "db"}},
+            ],
+        }
+    ],
+    "inactive": [{"identifier": "host-2", "containers": [{"id": "c3", "labels": {"app": "web"}}]}],
+    "idle": [],
+}
+
+
+class TestInventory(unittest.TestCase):
+    def test_ttl_cache_expiry(self) -> None:
+        loader = MagicMock(side_effect=[1, 2])
+        cache = GremlinAPITTLCache(loader, ttl=0.05)
+        self.assertEqual(cache.get(), 1)
+        self.assertEqual(cache.get(), 1)
+        time.sleep(0.06)
+        self.assertEqual(cache.get(), 2)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_ttl_cache_invalidate_hook(self) -> None:
+        loader = MagicMock(side_effect=[1, 2])
+        hook = MagicMock()
+        cache = GremlinAPITTLCache(loader)
+        cache.add_invalidation_hook(hook)
+        self.assertEqual(cache.get(), 1)
+        cache.invalidate()
+        hook.assert_called_once_with()
+        self.assertEqual(cache.get(), 2)
+
+    def test_ttl_cache_background_refresh(self) -> None:
+        loader = MagicMock(return_value=1)
+        cache = GremlinAPITTLCache(loader, ttl=60)
+        cache.start_background_refresh(interval=0.01)
+        time.sleep(0.05)
+        cache.stop_background_refresh()
+        self.assertGreater(loader.call_count, 1)
+
+    def test_client_inventory_indexes(self) -> None:
+        inventory = GremlinClientInventory(lambda: mock_clients)
+        try:
+            self.assertEqual([c["id"] for c in inventory.containers()], ["c1", "c2", "c3"])
+            self.assertEqual(inventory.container("c2")["labels"], {"app": "db"})
+            self.assertEqual(inventory.container_ids_with_label("app", "web"), {"c1", "c3"})
+            self.assertIs(config.client_cache, mock_clients)
+        finally:
+            inventory.invalidate()
+
+    def test_client_inventory_adopts_assigned_cache(self) -> None:
+        loader = MagicMock(return_value=mock_clients)
+        inventory = GremlinClientInventory(loader)
+        config.client_cache = {"active": [{"containers": [{"id": "x"}]}]}
+        try:
+            self.assertEqual([c["id"] for c in inventory.containers()], ["x"])
+            loader.assert_not_called()
+        finally:
+            inventory.invalidate()
+
+    @patch("requests.get")
+    def test_get_update_client_target_cache(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = lambda: mock_clients
+        GremlinAPIClients.invalidate_client_target_cache()
+        try:
+            self.assertEqual(len(GremlinAPIClients.get_update_client_target_cache()), 3)
+            self.assertEqual(len(GremlinAPIClients.get_update_client_target_cache()), 3)
+            self.assertEqual(mock_get.call_count, 1)
+            GremlinAPIClients.invalidate_client_target_cache()
+            GremlinAPIClients.get_update_client_target_cache()
+            self.assertEqual(mock_get.call_count, 2)
+        finally:
+            GremlinAPIClients.invalidate_client_target_cache()
+
+    def test_target_inventory_indexes(self) -> None:
+        loader = MagicMock(
+            return_value=[
+                {"identifier": "h1", "os-type": "linux", "tags": {"zone": ["a", "b"]}},
+                {"identifier": "h2", "os-type": "linux", "tags": {"zone": "a", "n": 1}},
+            ]
+        )
+        inventory = GremlinTargetInventory(
+            loader, "tags", native_keys=("os-type",), ttl=60
+        )
+        self.assertEqual(inventory.identifiers(), {"h1", "h2"})
+        self.assertEqual(
+            inventory.values_by_key(),
+            {"os-type": ["linux"], "zone": ["a", "b"], "n": []},
+        )
+        self.assertTrue(inventory.has_value("zone", "b"))
+        self.assertFalse(inventory.has_value("zone", "c"))
+        self.assertFalse(inventory.has_value("zone", ["a"]))
+        self.assertTrue(inventory.has_identifier("h2"))
+        loader.assert_called_once_with()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from gremlinapi import json_codec
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.http_clients import GremlinAPIHttpClient
+from gremlinapi.scenario_graph_helpers import GremlinScenarioGraphHelper
+from gremlinapi.scenarios import GremlinAPIScenarios
+
+from .util import mock_data, mock_scenario
+
+mock_document = {"clients": [{"identifier": "host-1", "tags": {"zone": "a/b"}}], "n": 1}
+
+
+class TestJSONCodec(unittest.TestCase):
+    def test_backend_auto(self) -> None:
+        with patch.object(config, "json_codec", None):
+            self.assertEqual(json_codec.backend(), json_codec.BACKENDS[
+                min(json_codec.BACKENDS.index(name) for name in json_codec._codecs)
+            ])
+
+    def test_backend_configured(self) -> None:
+        with patch.object(config, "json_codec", "json"):
+            self.assertEqual(json_codec.backend(), "json")
+        with patch.object(config, "json_codec", "not-a-codec"):
+            self.assertEqual(json_codec.backend(), "json")
+
+    def test_round_trip_every_backend(self) -> None:
+        for name in json_codec._codecs:
+            with patch.object(config, "json_codec", name):
+                encoded = json_codec.dumpb(mock_document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json_codec.loads(encoded), mock_document)
+                self.assertEqual(json_codec.loads(json_codec.dumps(mock_document)), mock_document)
+                self.assertEqual(json_codec.loads(json_codec.dumpb({1: "a"})), {"1": "a"})
+
+    def test_request_data_encodes_body(self) -> None:
+        kwargs = {"headers": {}, "body": mock_document}
+        data = GremlinAPIHttpClient._request_data(kwargs)
+        self.assertEqual(json_codec.loads(data), mock_document)
+        self.assertEqual(kwargs, {"headers": {"Content-Type": "application/json"}})
+        kwargs = {"headers": {}, "body": "already-encoded"}
+        self.assertEqual(GremlinAPIHttpClient._request_data(kwargs), "already-encoded")
+
+    def test_response_body_decodes_content(self) -> None:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json_codec.dumpb(mock_document)
+        self.assertEqual(GremlinAPIHttpClient._response_body(resp), mock_document)
+        resp._content = b"not json"
+        resp.encoding = "utf-8"
+        self.assertEqual(GremlinAPIHttpClient._response_body(resp), "not json")
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.json = lambda: mock_data
+        self.assertEqual(GremlinAPIHttpClient._response_body(resp), mock_data)
+
+    def test_scenario_body_is_api_model(self) -> None:
+        helper = GremlinScenarioGraphHelper(**mock_scenario)
+        self.assertEqual(
+            GremlinAPIScenarios._error_if_not_scenario_body(body=helper),
+            helper.api_model(),
+        )
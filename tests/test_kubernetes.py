@@ -5,7 +5,10 @@ import requests
 from gremlinapi.kubernetes import (
     GremlinAPIKubernetesAttacks,
     GremlinAPIKubernetesTargets,
+    kubernetes_target_inventory,
 )
+from gremlinapi.kubernetes_attack_helpers import GremlinKubernetesAttackTarget
+from gremlinapi.exceptions import GremlinIdentifierError
 
 from .util import mock_json, mock_data, mock_uid, mock_body
 
@@ -66,3 +69,55 @@ class TestKubernetesTargets(unittest.TestCase):
         self.assertEqual(
             GremlinAPIKubernetesTargets.list_kubernetes_targets(), mock_data
         )
+
+
+class TestKubernetesAttackTargets(unittest.TestCase):
+    mock_targets = [
+        {
+            "clusterId": "cluster-1",
+            "objects": [
+                {"kind": "DEPLOYMENT", "namespace": "default", "name": "web", "uid": "u1"},
+                {"kind": "DEPLOYMENT", "namespace": "default", "name": "db", "uid": "u2"},
+            ],
+        },
+        {
+            "clusterId": "cluster-2",
+            "objects": [
+                {"kind": "DEPLOYMENT", "namespace": "default", "name": "web", "uid": "u3"},
+            ],
+        },
+    ]
+
+    def setUp(self) -> None:
+        kubernetes_target_inventory.invalidate()
+
+    def tearDown(self) -> None:
+        kubernetes_target_inventory.invalidate()
+
+    @patch("requests.get")
+    def test_resolve_with_decorator(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = lambda: self.mock_targets
+        targets = GremlinKubernetesAttackTarget.resolve(
+            [
+                {"cluster_id": c, "namespace": "default", "kind": "deployment", "name": n}
+                for (c, n) in [("cluster-1", "web"), ("cluster-1", "db"), ("cluster-2", "web")]
+            ]
+        )
+        self.assertEqual([t.api_model()["uid"] for t in targets], ["u1", "u2", "u3"])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.get")
+    def test_resolve_reports_all_missing(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = lambda: self.mock_targets
+        with self.assertRaises(GremlinIdentifierError) as context:
+            GremlinKubernetesAttackTarget.resolve(
+                [
+                    {"cluster_id": "cluster-1", "namespace": "default", "kind": "pod", "name": n}
+                    for n in ("web", "db")
+                ]
+            )
+        self.assertEqual(str(context.exception).count("0 were idenfied"), 2)
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+import gremlinapi
+from gremlinapi.attacks import GremlinAPIAttacks
+from gremlinapi.users import GremlinAPIUsersAuth
+
+
+def _modules_after(statement: str) -> set:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_defers_endpoints(self) -> None:
+        modules = _modules_after("import gremlinapi")
+        for name in ("requests", "urllib3", "httpx", "gremlinapi.attacks"):
+            self.assertNotIn(name, modules)
+        self.assertIn("gremlinapi.config", modules)
+
+    def test_import_loads_only_what_is_needed(self) -> None:
+        modules = _modules_after("from gremlinapi import Attacks")
+        self.assertIn("gremlinapi.attacks", modules)
+        self.assertIn("requests", modules)
+        self.assertNotIn("gremlinapi.async_api", modules)
+        self.assertNotIn("httpx", modules)
+
+    def test_lazy_attributes(self) -> None:
+        self.assertIs(gremlinapi.Attacks, GremlinAPIAttacks)
+        self.assertIs(gremlinapi.userAuth, GremlinAPIUsersAuth)
+        self.assertEqual(gremlinapi.attacks.GremlinAPIAttacks, GremlinAPIAttacks)
+        self.assertIn("Scenarios", dir(gremlinapi))
+        self.assertIn("GremlinParameterError", gremlinapi.__all__)
+        with self.assertRaises(AttributeError):
+            gremlinapi.NotAnAttribute
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+import logging
+import threading
+from gremlinapi import SecretsFilter, _compile_secrets
+from gremlinapi.config import GremlinAPIConfig as config
+
+mock_api_key = "Key abc+def(123)"
+mock_bearer = "Bearer 0123456789"
+mock_password = "hunter2hunter2"
+
+
+def _record(msg, args=()) -> logging.LogRecord:
+    return logging.LogRecord("GremlinAPI.client", logging.DEBUG, __file__, 1, msg, args, None)
+
+
+class TestSecretsFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.patches = [
+            patch.object(config, "api_key", mock_api_key),
+            patch.object(config, "bearer_token", mock_bearer),
+            patch.object(config, "password", mock_password),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        for p in self.patches:
+            p.stop()
+
+    def test_redacts_message(self) -> None:
+        record = _record(f"headers {{'Authorization': '{mock_api_key}'}} {mock_password}")
+        self.assertTrue(SecretsFilter().filter(record))
+        self.assertEqual(
+            record.getMessage(), "headers {'Authorization': '...123)} [PASSWORD REDACTED]"
+        )
+
+    def test_redacts_args(self) -> None:
+        kwargs = {"headers": {"Authorization": mock_bearer}}
+        record = _record("kwargs: %s, user %s, %d", (kwargs, mock_password, 3))
+        SecretsFilter().filter(record)
+        self.assertEqual(
+            record.getMessage(),
+            "kwargs: {'headers': {'Authorization': '...6789}}, user [PASSWORD REDACTED], 3",
+        )
+        record = _record("token %(token)s", ({"token": mock_bearer},))
+        SecretsFilter().filter(record)
+        self.assertEqual(record.getMessage(), "token ...6789")
+
+    def test_untouched_without_secrets(self) -> None:
+        args = ({"teamId": "1"}, "value")
+        record = _record("nothing to hide %s %s", args)
+        SecretsFilter().filter(record)
+        self.assertIs(record.args, args)
+
+    def test_unset_secrets(self) -> None:
+        with patch.object(config, "api_key", None), patch.object(
+            config, "bearer_token", None
+        ), patch.object(config, "password", config.__dict__["password"]):
+            record = _record({"not": "a string"})
+            self.assertTrue(SecretsFilter().filter(record))
+            self.assertEqual(record.msg, {"not": "a string"})
+
+    def test_compiles_once_per_change(self) -> None:
+        _compile_secrets.cache_clear()
+        secrets_filter = SecretsFilter()
+        with patch("gremlinapi.re.compile", wraps=__import__("re").compile) as mock_compile:
+            for _ in range(3):
+                secrets_filter.filter(_record("message"))
+            self.assertEqual(mock_compile.call_count, 1)
+            with patch.object(config, "password", "another-password"):
+                secrets_filter.filter(_record("another-password"))
+            self.assertEqual(mock_compile.call_count, 2)
+
+    def test_compiles_once_per_secrets(self) -> None:
+        _compile_secrets.cache_clear()
+        secrets_filter = SecretsFilter()
+        with patch("gremlinapi.re.compile", wraps=__import__("re").compile) as mock_compile:
+            for api_key in ["Key first-client", "Key second-client"] * 3:
+                with patch.object(config, "api_key", api_key):
+                    record = _record(f"key {api_key}")
+                    secrets_filter.filter(record)
+                    self.assertEqual(record.getMessage(), f"key ...{api_key[-4:]}")
+            self.assertEqual(mock_compile.call_count, 2)
+
+    def test_concurrent_secrets_change(self) -> None:
+        secrets_filter = SecretsFilter()
+        errors = []
+
+        def log_records() -> None:
+            try:
+                for _ in range(500):
+                    record = _record(f"password {mock_password}")
+                    secrets_filter.filter(record)
+                    record.getMessage()
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=log_records) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for index in range(500):
+            config.password = mock_password if index % 2 else None
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
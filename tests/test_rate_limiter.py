@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from gremlinapi.clients import GremlinAPIClients
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.rate_limiter import GremlinAPIRateLimiter, GremlinAPITokenBucket
+
+from .util import mock_json, mock_data, mock_guid
+
+
+class TestRateLimiter(unittest.TestCase):
+    def tearDown(self) -> None:
+        GremlinAPIRateLimiter.reset()
+
+    def test_token_bucket_burst_then_wait(self) -> None:
+        bucket = GremlinAPITokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_token_bucket_threads(self) -> None:
+        bucket = GremlinAPITokenBucket(rate=1000, capacity=1)
+        waits = []
+        threads = [
+            threading.Thread(target=lambda: waits.append(bucket.reserve()))
+            for _ in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(round(w, 4) for w in waits)), 20)
+
+    def test_token_bucket_async(self) -> None:
+        bucket = GremlinAPITokenBucket(rate=1000, capacity=1)
+
+        async def run():
+            return await asyncio.gather(*[bucket.acquire_async() for _ in range(3)])
+
+        self.assertEqual(asyncio.run(run())[0], 0.0)
+
+    def test_buckets_for_prefix(self) -> None:
+        with patch.object(config, "rate_limit_qps", 100), patch.object(
+            config, "rate_limit_endpoint_qps", {"/clients": 5, "/clients/active": 1}
+        ):
+            self.assertEqual(len(GremlinAPIRateLimiter.buckets_for("/attacks")), 1)
+            buckets = GremlinAPIRateLimiter.buckets_for(
+                f"{config.base_uri}/clients/active?teamId=1"
+            )
+            self.assertEqual([b.rate for b in buckets], [100, 1])
+            self.assertEqual(
+                [b.rate for b in GremlinAPIRateLimiter.buckets_for("/clients/abc")],
+                [100, 5],
+            )
+
+    def test_disabled_by_default(self) -> None:
+        self.assertEqual(GremlinAPIRateLimiter.buckets_for("/clients"), [])
+
+    @patch("gremlinapi.rate_limiter.GremlinAPITokenBucket.acquire")
+    @patch("requests.put")
+    def test_api_call_acquires_token(self, mock_put, mock_acquire) -> None:
+        mock_put.return_value = requests.Response()
+        mock_put.return_value.status_code = 200
+        mock_put.return_value.json = mock_json
+        mock_acquire.return_value = 0.0
+        with patch.object(config, "rate_limit_endpoint_qps", {"/clients": 5}):
+            self.assertEqual(GremlinAPIClients.activate_client(**mock_guid), mock_data)
+        self.assertEqual(mock_acquire.call_count, 1)
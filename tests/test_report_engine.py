@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import logging
+import requests
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import GremlinParameterError, HTTPError
+from gremlinapi.report_engine import (
+    GremlinReportCache,
+    GremlinReportEngine,
+    period_chunks,
+)
+
+
+def mock_report_response(uri, **kwargs):
+    query = parse_qs(urlsplit(uri).query)
+    start = query.get("start", query.get("startDate"))[0]
+    resp = requests.Response()
+    if start == "2024-02-05":
+        resp.status_code = 503
+        resp.reason = "Service Unavailable"
+        return resp
+    resp.status_code = 200
+    resp._content = b'[{"attacks": 2, "start": "%s"}]' % start.encode("utf-8")
+    return resp
+
+
+class TestReportEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "reports.sqlite3")
+
+    def tearDown(self) -> None:
+        GremlinReportCache.close_all()
+        self.directory.cleanup()
+
+    def test_period_chunks(self) -> None:
+        self.assertEqual(
+            period_chunks("2024-01-31", "2024-02-01", "days"),
+            [
+                (date(2024, 1, 31), date(2024, 1, 31)),
+                (date(2024, 2, 1), date(2024, 2, 1)),
+            ],
+        )
+        self.assertEqual(
+            period_chunks("2024-01-03", "2024-01-08", "WEEKS"),
+            [
+                (date(2024, 1, 1), date(2024, 1, 7)),
+                (date(2024, 1, 8), date(2024, 1, 14)),
+            ],
+        )
+        self.assertEqual(
+            period_chunks(date(2023, 12, 15), date(2024, 2, 1), "MONTHS"),
+            [
+                (date(2023, 12, 1), date(2023, 12, 31)),
+                (date(2024, 1, 1), date(2024, 1, 31)),
+                (date(2024, 2, 1), date(2024, 2, 29)),
+            ],
+        )
+        with self.assertRaises(GremlinParameterError):
+            period_chunks("2024-01-01", "2024-01-02", "YEARS")
+        with self.assertRaises(GremlinParameterError):
+            period_chunks("2024-01-02", "2024-01-01")
+
+    @patch("requests.get")
+    def test_fetch_caches_ended_periods(self, mock_get) -> None:
+        mock_get.side_effect = mock_report_response
+        with patch.object(config, "report_cache", self.path):
+            result = GremlinReportEngine.fetch(
+                "attacks",
+                "2024-01-01",
+                "2024-01-21",
+                period="weeks",
+                team_id="team",
+                concurrency=2,
+                today=date(2024, 1, 17),
+            )
+            self.assertEqual((result.fetched, result.cached), (3, 0))
+            self.assertEqual(mock_get.call_count, 3)
+            self.assertIn("teamId=team", mock_get.call_args[0][0])
+            self.assertIn("period=WEEKS", mock_get.call_args[0][0])
+            rows = result.rows()
+            self.assertEqual(
+                [row["start"] for row in rows], ["2024-01-01", "2024-01-08", "2024-01-15"]
+            )
+            self.assertEqual(rows[0]["period_end"], date(2024, 1, 7))
+
+            # Only the week containing today is downloaded again
+            mock_get.reset_mock()
+            result = GremlinReportEngine.fetch(
+                "attacks",
+                "2024-01-01",
+                "2024-01-21",
+                period="WEEKS",
+                team_id="team",
+                today=date(2024, 1, 17),
+            )
+            self.assertEqual((result.fetched, result.cached), (1, 2))
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertIn("start=2024-01-15", mock_get.call_args[0][0])
+            self.assertEqual(len(result.rows()), 3)
+
+            # Other teams do not share cached periods
+            mock_get.reset_mock()
+            GremlinReportEngine.fetch(
+                "attacks", "2024-01-01", "2024-01-07", period="WEEKS", team_id="other"
+            )
+            self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.get")
+    def test_fetch_keeps_periods_fetched_before_a_failure(self, mock_get) -> None:
+        mock_get.side_effect = mock_report_response
+        with patch.object(config, "report_cache", self.path), patch.object(
+            config, "retry_max_attempts", 1
+        ):
+            with self.assertRaises(HTTPError):
+                GremlinReportEngine.fetch(
+                    "users", "2024-01-29", "2024-02-11", period="WEEKS"
+                )
+            mock_get.reset_mock()
+            with self.assertRaises(HTTPError):
+                GremlinReportEngine.fetch(
+                    "users", "2024-01-29", "2024-02-11", period="WEEKS"
+                )
+            self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.get")
+    def test_fetch_without_cache(self, mock_get) -> None:
+        mock_get.side_effect = mock_report_response
+        with patch.object(config, "report_cache", None):
+            GremlinReportEngine.fetch("teams", "2024-01-01", "2024-01-02")
+            GremlinReportEngine.fetch("teams", "2024-01-01", "2024-01-02")
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertIn("startDate=2024-01-01", mock_get.call_args_list[0][0][0])
+        with self.assertRaises(GremlinParameterError):
+            GremlinReportEngine.fetch("pricing", "2024-01-01", "2024-01-02")
@@ -1,5 +1,7 @@
+import io
+import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 import logging
 from gremlinapi.scenario_graph_helpers import (
     GremlinScenarioGraphHelper,
@@ -11,8 +13,12 @@ from gremlinapi.scenario_graph_helpers import (
     GremlinScenarioALFINode,
     GremlinScenarioDelayNode,
     GremlinScenarioStatusCheckNode,
+    GremlinScenarioContinuousStatusCheckNode,
     _GremlinNodeGraph,
 )
+from gremlinapi.exceptions import GremlinGraphError, GremlinParameterError
+from gremlinapi.clients import client_inventory
+from gremlinapi.config import GremlinAPIConfig as config
 
 from gremlinapi.attack_helpers import (
     GremlinAttackTargetHelper,
@@ -591,3 +597,244 @@ class TestScenarioGraphHelpers(unittest.TestCase):
         self.assertFalse(helper_node_3.id in helper_node._edges)
         self.assertFalse(helper_node_2.id in helper_node_3._edges)
         self.assertFalse(helper_node_3.id in helper_node_2._edges)
+
+    @patch("inspect.stack")
+    def test__gremlin_node_graph_validate_type(self, mock_stack) -> None:
+        helper = _GremlinNodeGraph()
+        helper.append(GremlinScenarioNode(**mock_scenario))
+        mock_stack.assert_not_called()
+
+        def append_invalid_node():
+            helper.append("not-a-node")
+
+        with self.assertRaises(GremlinParameterError) as context:
+            append_invalid_node()
+        self.assertTrue(
+            str(context.exception).startswith(
+                "append_invalid_node expects node to be a subclass of GremlinScenarioNode"
+            )
+        )
+        mock_stack.assert_not_called()
+
+    def test__gremlin_node_graph_total_targets(self) -> None:
+        def labelled_node(labels):
+            node = GremlinScenarioNode(**mock_scenario)
+            node.target = MagicMock()
+            node.target.target_definition_graph.return_value = {
+                "strategy": {"attrs": {"multiSelectLabels": labels}}
+            }
+            return node
+
+        config.client_cache = {
+            "active": [
+                {
+                    "containers": [
+                        {"id": "c1", "labels": {"app": "web"}},
+                        {"id": "c2", "labels": {"app": "db"}},
+                        {"id": "c3", "labels": {"app": "web", "tier": "front"}},
+                    ]
+                }
+            ]
+        }
+        try:
+            helper = _GremlinNodeGraph()
+            web_node = labelled_node({"app": ["web"]})
+            front_node = labelled_node({"tier": ["front"]})
+            helper.append(GremlinScenarioDelayNode(**mock_delay_node))
+            helper.append(web_node)
+            helper.append(front_node)
+            self.assertEqual(helper.total_targets(), 2)
+            helper.append(labelled_node({"app": "db"}))
+            self.assertEqual(helper.total_targets(), 3)
+            self.assertEqual(web_node.target.target_definition_graph.call_count, 1)
+            helper.remove(front_node)
+            self.assertEqual(helper.total_targets(), 3)
+            helper.remove(web_node)
+            self.assertEqual(helper.total_targets(), 1)
+            config.client_cache = {
+                "active": [{"containers": [{"id": "c4", "labels": {"app": "db"}}]}]
+            }
+            self.assertEqual(helper.total_targets(), 1)
+            self.assertEqual(helper._target_refs, {"c4": 1})
+        finally:
+            client_inventory.invalidate()
+
+    def test__gremlin_node_graph_total_targets_after_target_change(self) -> None:
+        class LabelTarget(GremlinAttackTargetHelper):
+            def target_definition_graph(self):
+                return {"strategy": {"attrs": {"multiSelectLabels": self.labels}}}
+
+        config.client_cache = {
+            "active": [
+                {
+                    "containers": [
+                        {"id": "c1", "labels": {"app": "web"}},
+                        {"id": "c2", "labels": {"app": "db"}},
+                        {"id": "c3", "labels": {"app": "web", "tier": "front"}},
+                    ]
+                }
+            ]
+        }
+        try:
+            helper = GremlinScenarioGraphHelper(**mock_scenario)
+            node = GremlinScenarioNode(**mock_scenario)
+            node.target = LabelTarget()
+            node.target.labels = {"app": ["web"]}
+            helper.add_node(node)
+            self.assertEqual(helper.total_targets(), 2)
+            node.target.labels = {"app": ["db"]}
+            self.assertEqual(helper.total_targets(), 1)
+            node.target = LabelTarget()
+            node.target.labels = {"tier": ["front"]}
+            self.assertEqual(helper.total_targets(), 1)
+            self.assertEqual(helper._nodes._target_refs, {"c3": 1})
+        finally:
+            client_inventory.invalidate()
+
+    def test__gremlin_node_graph_total_targets_matches_only_changed(self) -> None:
+        class LabelTarget(GremlinAttackTargetHelper):
+            matches = 0
+
+            def target_definition_graph(self):
+                LabelTarget.matches += 1
+                return {"strategy": {"attrs": {"multiSelectLabels": self.labels}}}
+
+        config.client_cache = {
+            "active": [
+                {
+                    "containers": [
+                        {"id": "c1", "labels": {"app": "web"}},
+                        {"id": "c2", "labels": {"app": "webapp"}},
+                    ]
+                }
+            ]
+        }
+        try:
+            helper = GremlinScenarioGraphHelper(**mock_scenario)
+            nodes = []
+            for _ in range(5):
+                node = GremlinScenarioNode(**mock_scenario)
+                node.target = LabelTarget()
+                node.target.labels = {"app": "web"}
+                helper.add_node(node)
+                nodes.append(node)
+            self.assertEqual(helper.total_targets(), 1)
+            self.assertEqual(LabelTarget.matches, 5)
+            nodes[2].target.labels = {"app": ["webapp"]}
+            self.assertEqual(helper.total_targets(), 2)
+            self.assertEqual(LabelTarget.matches, 6)
+            helper.remove_node(nodes[2])
+            nodes[2].target.labels = {"app": ["web"]}
+            self.assertEqual(helper.total_targets(), 1)
+            self.assertEqual(LabelTarget.matches, 6)
+        finally:
+            client_inventory.invalidate()
+
+    def test__gremlin_node_graph_get_nodes_linear_long_chain(self) -> None:
+        helper = GremlinScenarioGraphHelper(**mock_scenario)
+        previous = None
+        for _ in range(3000):
+            node = GremlinScenarioDelayNode(**mock_delay_node)
+            helper.add_node(node)
+            if previous is not None:
+                helper.add_edge(node, previous)
+            previous = node
+        nodes = helper.api_model()["graph"]["nodes"]
+        self.assertEqual(len(nodes), 3000)
+        self.assertEqual(nodes["2999"]["id"], "2999")
+        self.assertEqual(nodes["2999"]["next"], "3000")
+
+    def test__gremlin_node_graph_get_nodes_linear_cycle(self) -> None:
+        helper = _GremlinNodeGraph()
+        nodes = [GremlinScenarioNode(**mock_scenario) for _ in range(3)]
+        for node in nodes:
+            helper.append(node)
+        helper.add_edge(nodes[0], nodes[1])
+        helper.add_edge(nodes[1], nodes[2])
+        helper.add_edge(nodes[2], nodes[0])
+        with self.assertRaises(GremlinGraphError):
+            helper.get_nodes_linear()
+
+    def test_gremlin_scenario_node_data_cached(self) -> None:
+        helper = _GremlinNodeGraph()
+        node = GremlinScenarioILFINode(
+            name="mock_scenario",
+            command=GremlinAttackCommandHelper(),
+            target=GremlinAttackTargetHelper(),
+        )
+        helper.append(node)
+        with patch.object(
+            GremlinScenarioILFINode, "api_model", wraps=node.api_model
+        ) as mock_api_model:
+            helper.get_nodes_linear(branch_id=1)
+            first = helper.get_nodes_linear()
+            self.assertEqual(mock_api_model.call_count, 1)
+            self.assertNotIn("branchId", first["0"])
+            node.name = "renamed"
+            self.assertEqual(helper.get_nodes_linear()["0"]["name"], "renamed")
+            self.assertEqual(mock_api_model.call_count, 2)
+            node.command.length = 120
+            helper.get_nodes_linear()
+            self.assertEqual(mock_api_model.call_count, 3)
+
+    def test_gremlin_scenario_graph_helper_iterencode(self) -> None:
+        helper = GremlinScenarioGraphHelper(**mock_scenario)
+        self.assertEqual("".join(helper.iterencode()), json.dumps(helper.api_model()))
+        previous = None
+        for _ in range(3):
+            node = GremlinScenarioDelayNode(**mock_delay_node)
+            helper.add_node(node)
+            if previous is not None:
+                helper.add_edge(node, previous)
+            previous = node
+        self.assertEqual("".join(helper.iterencode()), json.dumps(helper.api_model()))
+        fp = io.StringIO()
+        helper.dump(fp)
+        self.assertEqual(json.loads(fp.getvalue()), helper.api_model())
+        helper.add_node(
+            GremlinScenarioContinuousStatusCheckNode(**mock_status_check_node)
+        )
+        self.assertEqual("".join(helper.iterencode()), json.dumps(helper.api_model()))
+
+    def test__gremlin_node_graph_algorithms(self) -> None:
+        helper = _GremlinNodeGraph()
+        start = GremlinScenarioNode(**mock_scenario)
+        short_delay = GremlinScenarioDelayNode(delay=10)
+        long_delay = GremlinScenarioDelayNode(delay=30)
+        attack = GremlinScenarioILFINode(
+            name="mock_scenario",
+            command=GremlinAttackCommandHelper(length=60),
+            target=GremlinAttackTargetHelper(),
+        )
+        self.assertEqual(helper.longest_path(), ("", "", 0))
+        for node in (start, short_delay, long_delay, attack):
+            helper.append(node)
+        helper.add_edge(start, short_delay)
+        helper.add_edge(start, long_delay)
+        helper.add_edge(short_delay, attack)
+        helper.add_edge(long_delay, attack)
+        self.assertEqual(helper.get_node(attack.id), attack)
+        self.assertEqual(helper.tail(), attack)
+        self.assertFalse(helper.has_cycle())
+        order = helper.topological_order()
+        self.assertEqual(order[0], start)
+        self.assertEqual(order[-1], attack)
+        self.assertEqual(helper.longest_path(), (start.id, attack.id, 90))
+
+        # insert_between keeps the edge direction
+        extra_delay = GremlinScenarioDelayNode(delay=45)
+        helper.insert_between(extra_delay, attack, short_delay)
+        self.assertEqual(helper.get_node(extra_delay.id), extra_delay)
+        self.assertNotIn(attack.id, short_delay._edges)
+        self.assertEqual(helper.longest_path(), (start.id, attack.id, 115))
+        with self.assertRaises(GremlinGraphError):
+            helper.insert_between(extra_delay, start, attack)
+
+        helper.remove(extra_delay)
+        self.assertIsNone(helper.get_node(extra_delay.id))
+        self.assertEqual(helper.longest_path(), (start.id, attack.id, 90))
+
+        helper.add_edge(attack, start)
+        self.assertTrue(helper.has_cycle())
+        with self.assertRaises(GremlinGraphError):
+            helper.topological_order()
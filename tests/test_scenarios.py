@@ -2,9 +2,21 @@ import unittest
 from unittest.mock import patch
 import logging
 import requests
+from gremlinapi import json_codec
+from gremlinapi.scenario_graph_helpers import (
+    GremlinScenarioDelayNode,
+    GremlinScenarioGraphHelper,
+)
 from gremlinapi.scenarios import GremlinAPIScenarios, GremlinAPIScenariosRecommended
 
-from .util import mock_json, mock_data, mock_scenario, mock_payload, mock_scenario_guid
+from .util import (
+    mock_json,
+    mock_data,
+    mock_delay_node,
+    mock_scenario,
+    mock_payload,
+    mock_scenario_guid,
+)
 
 
 class TestScenarios(unittest.TestCase):
@@ -26,6 +38,28 @@ class TestScenarios(unittest.TestCase):
         mock_get.return_value.json = mock_json
         self.assertEqual(GremlinAPIScenarios.create_scenario(**mock_payload), mock_data)
 
+    @patch("requests.put")
+    @patch("requests.post")
+    def test_scenario_request_bodies(self, mock_post, mock_put) -> None:
+        for mock_call in (mock_post, mock_put):
+            mock_call.return_value = requests.Response()
+            mock_call.return_value.status_code = 200
+            mock_call.return_value.json = mock_json
+        helper = GremlinScenarioGraphHelper(**mock_scenario)
+        helper.add_node(GremlinScenarioDelayNode(**mock_delay_node))
+        GremlinAPIScenarios.create_scenario(body=helper)
+        posted = json_codec.loads(mock_post.call_args[1]["data"])
+        self.assertEqual(posted, helper.api_model())
+        self.assertEqual(posted["name"], mock_scenario["name"])
+        self.assertEqual(list(posted["graph"]["nodes"]), ["0"])
+        self.assertEqual(
+            mock_post.call_args[1]["headers"]["Content-Type"], "application/json"
+        )
+        GremlinAPIScenarios.update_scenario(guid="1234", body=helper.api_model())
+        self.assertEqual(
+            json_codec.loads(mock_put.call_args[1]["data"]), helper.api_model()
+        )
+
     @patch("requests.get")
     def test_get_scenario_with_decorator(self, mock_get) -> None:
         mock_get.return_value = requests.Response()
@@ -80,6 +114,16 @@ class TestScenarios(unittest.TestCase):
             GremlinAPIScenarios.list_scenarios_runs(**mock_scenario_guid), mock_data
         )
 
+    @patch("requests.get")
+    def test_iter_scenarios_runs_with_decorator(self, mock_get) -> None:
+        mock_get.return_value = requests.Response()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json = lambda: {"items": [mock_data]}
+        self.assertEqual(
+            list(GremlinAPIScenarios.iter_scenarios_runs(**mock_scenario_guid)),
+            [mock_data],
+        )
+
     @patch("requests.post")
     def test_run_scenario_with_decorator(self, mock_get) -> None:
         mock_get.return_value = requests.Response()
@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+import logging
+import requests
+from gremlinapi.config import GremlinAPIConfig as config
+from gremlinapi.exceptions import HTTPError
+from gremlinapi.http_clients import GremlinAPIRequestsClient
+from gremlinapi.token_manager import GremlinAPITokenManager
+from gremlinapi.users import GremlinAPIUsersAuth
+
+from .util import mock_json, mock_data
+
+
+def _response(status_code: int) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.reason = "Unauthorized"
+    resp.json = mock_json
+    return resp
+
+
+class TestTokenManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.patches = [
+            patch.object(config, "bearer_token", "Bearer stale-token"),
+            patch.object(config, "bearer_expires", None),
+            patch.object(config, "bearer_timestamp", ""),
+            patch.object(config, "bearer_refresh_margin", 300),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        GremlinAPITokenManager.stop()
+        for p in self.patches:
+            p.stop()
+
+    def _refresher(self, delay: float = 0.0) -> MagicMock:
+        def _login() -> None:
+            time.sleep(delay)
+            config.bearer_token = "Bearer fresh-token"
+            config.bearer_expires = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        return MagicMock(side_effect=_login)
+
+    def test_expires_at(self) -> None:
+        now = datetime.now(timezone.utc)
+        self.assertIsNone(GremlinAPITokenManager.expires_at())
+        with patch.object(config, "bearer_expires", now + timedelta(hours=2)), patch.object(
+            config, "bearer_timestamp", now
+        ), patch.object(config, "max_bearer_interval", 3600):
+            self.assertEqual(GremlinAPITokenManager.expires_at(), now + timedelta(hours=1))
+            self.assertAlmostEqual(
+                GremlinAPITokenManager.seconds_until_refresh(), 3300, delta=5
+            )
+
+    def test_concurrent_refreshes_log_in_once(self) -> None:
+        refresher = self._refresher(delay=0.05)
+        GremlinAPITokenManager.start(refresher)
+        threads = [
+            threading.Thread(target=GremlinAPITokenManager.refresh, args=("Bearer stale-token",))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(refresher.call_count, 1)
+        self.assertEqual(config.bearer_token, "Bearer fresh-token")
+
+    def test_background_refresh_ahead_of_expiry(self) -> None:
+        config.bearer_expires = datetime.now(timezone.utc) + timedelta(seconds=60)
+        refresher = self._refresher()
+        GremlinAPITokenManager.start(refresher)
+        for _ in range(100):
+            if config.bearer_token == "Bearer fresh-token":
+                break
+            time.sleep(0.01)
+        refresher.assert_called_once_with()
+        self.assertGreater(GremlinAPITokenManager.seconds_until_refresh(), 0)
+
+    @patch("requests.get")
+    def test_replay_once_on_401(self, mock_get) -> None:
+        mock_get.side_effect = [_response(401), _response(200)]
+        GremlinAPITokenManager.start(self._refresher())
+        (resp, body) = GremlinAPIRequestsClient.api_call(
+            "GET", "/test", headers=GremlinAPIRequestsClient.header()
+        )
+        self.assertEqual(body, mock_data)
+        self.assertEqual(
+            mock_get.call_args[1]["headers"]["Authorization"], "Bearer fresh-token"
+        )
+        mock_get.side_effect = [_response(401), _response(401)]
+        with patch.object(config, "bearer_token", "Bearer revoked"):
+            with self.assertRaises(HTTPError):
+                GremlinAPIRequestsClient.api_call("GET", "/test", headers={})
+
+    @patch("requests.get")
+    def test_no_replay_without_manager(self, mock_get) -> None:
+        mock_get.return_value = _response(401)
+        with self.assertRaises(HTTPError):
+            GremlinAPIRequestsClient.api_call("GET", "/test", headers={})
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("requests.post")
+    @patch("requests.get")
+    def test_no_replay_of_401_during_refresh(self, mock_get, mock_post) -> None:
+        mock_get.side_effect = lambda *args, **kwargs: _response(401)
+        mock_post.side_effect = lambda *args, **kwargs: _response(401)
+        refresher = MagicMock(
+            side_effect=lambda: GremlinAPIUsersAuth.auth_user(
+                email="user@example.com", password="password", companyName="company"
+            )
+        )
+        GremlinAPITokenManager.start(refresher)
+        outcome = []
+
+        def _call() -> None:
+            try:
+                GremlinAPIRequestsClient.api_call("GET", "/test", headers={})
+            except HTTPError as e:
+                outcome.append(e)
+
+        caller = threading.Thread(target=_call, daemon=True)
+        caller.start()
+        caller.join(5)
+        self.assertFalse(caller.is_alive(), "401 during a refresh deadlocked")
+        self.assertEqual(len(outcome), 1)
+        refresher.assert_called_once_with()
+        self.assertEqual(mock_post.call_count, 1)